@@ -9,6 +9,7 @@ from typing import Any
 from ..automation.metadata_enhancer import AdvancedMetadataEnhancer
 from ..core.config import CKCConfig
 from ..core.metadata import KnowledgeMetadata, MetadataManager
+from ..core.metadata_index import MetadataIndex
 
 
 class AIKnowledgeAssistant:
@@ -19,6 +20,8 @@ class AIKnowledgeAssistant:
         self.config = config
         self.metadata_manager = MetadataManager()
         self.metadata_enhancer = AdvancedMetadataEnhancer(config)
+        # Opened on the first related-content lookup
+        self._metadata_index: MetadataIndex | None = None
 
         # AI assistance settings
         self.ai_dir = vault_path / ".ckc" / "ai_assistance"
@@ -55,11 +58,27 @@ class AIKnowledgeAssistant:
         suggestions["suggestions"].extend(quality_suggestions)
 
         # Related content suggestions
-        related_suggestions = self._suggest_related_content(content, metadata)
+        related_suggestions = self._suggest_related_content(
+            content, metadata, file_path
+        )
         suggestions["suggestions"].extend(related_suggestions)
 
         return suggestions
 
+    def close(self) -> None:
+        """Close the metadata index if it was opened."""
+        if self._metadata_index is not None:
+            self._metadata_index.close()
+            self._metadata_index = None
+
+    def __enter__(self) -> "AIKnowledgeAssistant":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        """Context manager exit."""
+        self.close()
+
     def suggest_knowledge_organization(self) -> dict[str, Any]:
         """Suggest improvements to overall knowledge organization."""
         suggestions: dict[str, Any] = {
@@ -350,13 +369,16 @@ class AIKnowledgeAssistant:
         return suggestions
 
     def _suggest_related_content(
-        self, content: str, metadata: KnowledgeMetadata
+        self,
+        content: str,
+        metadata: KnowledgeMetadata,
+        file_path: Path | None = None,
     ) -> list[dict[str, str]]:
         """Suggest related content connections."""
         suggestions = []
 
         # Find similar content by tags
-        similar_files = self._find_similar_content(metadata.tags)
+        similar_files = self._find_similar_content(metadata.tags, exclude=file_path)
         if similar_files:
             suggestions.append(
                 {
@@ -1093,26 +1115,49 @@ updated: "{timestamp}"
 
         return predictions
 
-    def _find_similar_content(self, tags: list[str]) -> list[str]:
-        """Find content with similar tags."""
-        similar_files = []
-
-        # This would search through vault for files with overlapping tags
-        # Simplified implementation for now
-        if tags:
-            # Search for files with any matching tags
-            for md_file in self.vault_path.rglob("*.md"):
-                if md_file.name != "README.md":
-                    try:
-                        file_metadata = (
-                            self.metadata_manager.extract_metadata_from_file(md_file)
-                        )
-                        if any(tag in file_metadata.tags for tag in tags):
-                            similar_files.append(md_file.name)
-                    except Exception:
-                        continue
-
-        return similar_files[:10]  # Return top 10
+    def _find_similar_content(
+        self, tags: list[str], exclude: Path | None = None
+    ) -> list[str]:
+        """Find the files whose tags overlap most, most similar first.
+
+        The vault's metadata index is opened and refreshed on first use only,
+        so later lookups never walk the vault and only visit files that share
+        a tag. The trade-off is staleness: notes added or edited elsewhere
+        after the first lookup are not seen until a new assistant is created,
+        while the note being analyzed is always re-indexed.
+
+        Args:
+            tags: Tags of the note to find neighbours for
+            exclude: The note itself, left out of the results
+
+        Returns:
+            Names of up to 10 related files
+        """
+        if not tags:
+            return []
+
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex.for_directory(
+                self.vault_path, self.metadata_manager
+            )
+            self._metadata_index.refresh(
+                self.vault_path, skip=lambda md_file: md_file.name == "README.md"
+            )
+        elif (
+            exclude is not None
+            and exclude.is_file()
+            and exclude.name != "README.md"
+            and self.vault_path.resolve() in exclude.resolve().parents
+        ):
+            self._metadata_index.get(exclude)
+        related = self._metadata_index.related(
+            self.vault_path,
+            tags,
+            exclude=exclude,
+            skip=lambda md_file: md_file.name == "README.md",
+            limit=10,
+        )
+        return [path.name for path, _, _ in related]
 
     def _identify_potential_references(self, content: str) -> list[str]:
         """Identify potential cross-references in content."""
@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from enum import Enum
 
-from .pattern_loader import PatternLoader
+from .pattern_loader import PATTERN_LEVELS, CompiledPatterns, PatternLoader
+
+# Pattern groups in classification order: (loader group, result tag type)
+PATTERN_GROUPS = (("tech", "tech"), ("domain", "domain"), ("content", "type"))
 
 
 class ConfidenceLevel(Enum):
@@ -41,7 +44,10 @@ class ClassificationEngine:
 
     def _load_patterns(self) -> None:
         """Load all classification patterns."""
-        all_patterns = self.pattern_loader.get_all_patterns()
+        self.compiled_patterns: CompiledPatterns = (
+            self.pattern_loader.load_compiled_patterns()
+        )
+        all_patterns = self.compiled_patterns.patterns
         self.tech_patterns = all_patterns["tech"]
         self.domain_patterns = all_patterns["domain"]
         self.content_patterns = all_patterns["content"]
@@ -59,26 +65,53 @@ class ClassificationEngine:
             List of classification results.
         """
         results = []
-        content_lower = content.lower()
 
-        # Classify technology
-        tech_results = self._classify_patterns(
-            content_lower, self.tech_patterns, "tech"
-        )
-        results.extend(tech_results)
+        # One automaton scan covers tech, domain and content type patterns
+        matches = self.compiled_patterns.match(content)
+        for group, tag_type in PATTERN_GROUPS:
+            results.extend(self._build_results(group, tag_type, matches))
 
-        # Classify domain
-        domain_results = self._classify_patterns(
-            content_lower, self.domain_patterns, "domain"
-        )
-        results.extend(domain_results)
+        return results
 
-        # Classify content type
-        type_results = self._classify_patterns(
-            content_lower, self.content_patterns, "type"
-        )
-        results.extend(type_results)
+    def _build_results(
+        self,
+        group: str,
+        tag_type: str,
+        matches: dict[tuple[str, str], list[tuple[float, str]]],
+    ) -> list[ClassificationResult]:
+        """Turn compiled pattern matches for one group into results.
+
+        Args:
+            group: Pattern group name (tech, domain, content).
+            tag_type: Type of tag being classified (tech, domain, type).
+            matches: Output of :meth:`CompiledPatterns.match`.
+
+        Returns:
+            List of classification results sorted by confidence.
+        """
+        results = []
+
+        for pattern_name in self.compiled_patterns.patterns[group]:
+            confidence, evidence = self._score_evidence(
+                matches.get((group, pattern_name), [])
+            )
+
+            if confidence > 0.1:  # Minimum threshold
+                reasoning = self._generate_reasoning(
+                    pattern_name, evidence, confidence, tag_type
+                )
 
+                result = ClassificationResult(
+                    tag_type=tag_type,
+                    suggested_value=pattern_name,
+                    confidence=confidence,
+                    reasoning=reasoning,
+                    evidence=evidence,
+                )
+                results.append(result)
+
+        # Sort by confidence descending
+        results.sort(key=lambda x: x.confidence, reverse=True)
         return results
 
     def _classify_patterns(
@@ -94,6 +127,12 @@ class ClassificationEngine:
         Returns:
             List of classification results for this pattern type.
         """
+        # Loaded pattern sets are served by the compiled automaton
+        for group, _ in PATTERN_GROUPS:
+            if patterns is self.compiled_patterns.patterns[group]:
+                matches = self.compiled_patterns.match(content)
+                return self._build_results(group, tag_type, matches)
+
         results = []
 
         for pattern_name, pattern_config in patterns.items():
@@ -131,26 +170,29 @@ class ClassificationEngine:
         Returns:
             Tuple of (confidence_score, evidence_list).
         """
-        evidence = []
-        score = 0.0
+        matched = [
+            (weight, f"{label}: '{pattern}'")
+            for level, weight, label in PATTERN_LEVELS
+            for pattern in pattern_config.get(level, [])
+            if pattern.lower() in content
+        ]
+        return self._score_evidence(matched)
+
+    def _score_evidence(
+        self, matched: list[tuple[float, str]]
+    ) -> tuple[float, list[str]]:
+        """Combine matched pattern weights into a confidence score.
+
+        Args:
+            matched: (weight, evidence) pairs in pattern configuration order.
 
-        # High confidence patterns (weight: 1.0)
-        for pattern in pattern_config.get("high_confidence", []):
-            if pattern.lower() in content:
-                evidence.append(f"High confidence: '{pattern}'")
-                score += 1.0
-
-        # Medium confidence patterns (weight: 0.6)
-        for pattern in pattern_config.get("medium_confidence", []):
-            if pattern.lower() in content:
-                evidence.append(f"Medium confidence: '{pattern}'")
-                score += 0.6
-
-        # Keyword patterns (weight: 0.3)
-        for pattern in pattern_config.get("keywords", []):
-            if pattern.lower() in content:
-                evidence.append(f"Keyword: '{pattern}'")
-                score += 0.3
+        Returns:
+            Tuple of (confidence_score, evidence_list).
+        """
+        evidence = [text for _, text in matched]
+        score = 0.0
+        for weight, _ in matched:
+            score += weight
 
         # Normalize score based on pattern density
         if evidence:
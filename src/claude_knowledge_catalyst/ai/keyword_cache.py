@@ -0,0 +1,216 @@
+"""Persistent LRU cache of extracted keywords."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+KEYWORD_CACHE_FILE_NAME = "yake_keywords.db"
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Bump when the cached representation or extraction semantics change
+KEYWORD_CACHE_VERSION = "2"
+
+# (text, score, language, confidence), as stored for each keyword
+CachedKeyword = tuple[str, float, str, float]
+
+
+class KeywordCache:
+    """SQLite-backed keyword cache with least-recently-used eviction.
+
+    Entries are keyed by an opaque string built by the caller from the
+    content checksum, the extraction configuration and the language, so an
+    unchanged note is never re-extracted while a configuration change simply
+    misses. Each hit refreshes the entry's last-use time, and once the cache
+    holds more than ``max_entries`` the least recently used entries are
+    dropped. Several processes may share one cache file.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize keyword cache.
+
+        Args:
+            cache_path: Location of the SQLite database, or None for a cache
+                that lives only for this process
+            max_entries: Number of entries kept before the least recently
+                used ones are evicted
+            clock: Source of last-use timestamps
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = self._connect(cache_path)
+        self._ensure_schema()
+        self._size = self._count()
+
+    def _connect(self, cache_path: Path | None) -> sqlite3.Connection:
+        """Open the database, falling back to memory if the path is unusable."""
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(cache_path), timeout=30, check_same_thread=False
+                )
+                # Entries can always be recomputed, so durability is traded
+                # for cheap commits on every hit
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=OFF")
+                return conn
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Keyword cache unavailable at {cache_path}: {e}")
+                self.cache_path = None
+
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    def _ensure_schema(self) -> None:
+        """Create tables, clearing them when written by another version."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_info "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+            row = self._conn.execute(
+                "SELECT value FROM cache_info WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != KEYWORD_CACHE_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS keywords")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_info (key, value) "
+                    "VALUES ('version', ?)",
+                    (KEYWORD_CACHE_VERSION,),
+                )
+
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS keywords ("
+                "key TEXT PRIMARY KEY, "
+                "last_used REAL NOT NULL, "
+                "keywords TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS keywords_last_used ON keywords (last_used)"
+            )
+
+    def _count(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM keywords").fetchone()
+        return int(row[0])
+
+    def get(self, key: str) -> list[CachedKeyword] | None:
+        """Look up cached keywords and mark the entry as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached keywords, or None on a miss
+        """
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT keywords FROM keywords WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE keywords SET last_used = ? WHERE key = ?",
+                    (self._clock(), key),
+                )
+        except sqlite3.Error:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [
+            (str(text), float(score), str(language), float(confidence))
+            for text, score, language, confidence in json.loads(row[0])
+        ]
+
+    def put(self, key: str, keywords: Sequence[CachedKeyword]) -> None:
+        """Store keywords, evicting least recently used entries when full.
+
+        Args:
+            key: Cache key
+            keywords: Keywords to cache
+        """
+        payload = json.dumps(keywords, ensure_ascii=False)
+        try:
+            with self._lock, self._conn:
+                existed = self._conn.execute(
+                    "SELECT 1 FROM keywords WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO keywords (key, last_used, keywords) "
+                    "VALUES (?, ?, ?)",
+                    (key, self._clock(), payload),
+                )
+                if existed is None:
+                    self._size += 1
+                if self._size > self.max_entries:
+                    self._evict()
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to write keyword cache: {e}")
+
+    def _evict(self) -> None:
+        """Drop least recently used entries down to ``max_entries``.
+
+        Must be called with the lock held inside a transaction. The size is
+        recounted first, since other processes may share the cache file.
+        """
+        self._size = int(
+            self._conn.execute("SELECT COUNT(*) FROM keywords").fetchone()[0]
+        )
+        overflow = self._size - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._conn.execute(
+            "DELETE FROM keywords WHERE key IN "
+            "(SELECT key FROM keywords ORDER BY last_used LIMIT ?)",
+            (overflow,),
+        )
+        self._size -= overflow
+        self.evictions += overflow
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM keywords")
+            self._size = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return self._count()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "path": str(self.cache_path) if self.cache_path else None,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
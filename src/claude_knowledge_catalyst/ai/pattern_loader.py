@@ -1,26 +1,122 @@
 """Pattern loading and management for content classification."""
 
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from ..core.keyword_matcher import KeywordMatcher
+
+PATTERN_FILES = {
+    "tech": "tech_patterns.yaml",
+    "domain": "domain_patterns.yaml",
+    "content": "content_patterns.yaml",
+}
+
+# Confidence levels in evaluation order: (level key, weight, evidence prefix)
+PATTERN_LEVELS = (
+    ("high_confidence", 1.0, "High confidence"),
+    ("medium_confidence", 0.6, "Medium confidence"),
+    ("keywords", 0.3, "Keyword"),
+)
+
+# Bump when the compiled representation changes
+COMPILED_PATTERNS_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Directory used for compiled pattern artifacts."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "claude-knowledge-catalyst"
+
+
+@dataclass
+class CompiledPatterns:
+    """All classification patterns compiled into a single keyword automaton.
+
+    Automaton labels are ``(group, pattern_name, level_index, position)``
+    tuples pointing back into ``patterns``, so weights and evidence strings
+    can be reconstructed from one scan of the content.
+    """
+
+    patterns: dict[str, dict[str, dict[str, list[str]]]]
+    matcher: KeywordMatcher
+
+    @classmethod
+    def compile(
+        cls, patterns: dict[str, dict[str, dict[str, list[str]]]]
+    ) -> "CompiledPatterns":
+        """Compile pattern groups keyed by 'tech', 'domain' and 'content'."""
+        keywords = [
+            (pattern, (group, pattern_name, level_index, position))
+            for group, group_patterns in patterns.items()
+            for pattern_name, pattern_config in group_patterns.items()
+            for level_index, (level, _, _) in enumerate(PATTERN_LEVELS)
+            for position, pattern in enumerate(pattern_config.get(level, []))
+        ]
+        return cls(patterns=patterns, matcher=KeywordMatcher(keywords))
+
+    def match(self, content: str) -> dict[tuple[str, str], list[tuple[float, str]]]:
+        """Find every pattern occurring in the content.
+
+        Args:
+            content: Text to scan (case-insensitive).
+
+        Returns:
+            Mapping of (group, pattern_name) to (weight, evidence) pairs in
+            the same order as the pattern configuration lists them.
+        """
+        labels: set[Any] = self.matcher.find_labels(content)
+        hits: dict[tuple[str, str], list[tuple[int, int]]] = {}
+        for group, pattern_name, level_index, position in labels:
+            hits.setdefault((group, pattern_name), []).append((level_index, position))
+
+        matches: dict[tuple[str, str], list[tuple[float, str]]] = {}
+        for (group, pattern_name), positions in hits.items():
+            pattern_config = self.patterns[group][pattern_name]
+            matches[(group, pattern_name)] = [
+                (
+                    PATTERN_LEVELS[level_index][1],
+                    f"{PATTERN_LEVELS[level_index][2]}: "
+                    f"'{pattern_config[PATTERN_LEVELS[level_index][0]][position]}'",
+                )
+                for level_index, position in sorted(positions)
+            ]
+        return matches
+
 
 class PatternLoader:
     """Loads and manages classification patterns from YAML files."""
 
-    def __init__(self, patterns_dir: Path | None = None):
+    def __init__(
+        self,
+        patterns_dir: Path | None = None,
+        cache_dir: Path | None = None,
+        use_disk_cache: bool = True,
+    ):
         """Initialize pattern loader.
 
         Args:
             patterns_dir: Directory containing pattern YAML files.
                          If None, uses default patterns directory.
+            cache_dir: Directory for the compiled pattern artifact.
+                      If None, uses the user cache directory.
+            use_disk_cache: Whether to persist compiled patterns between runs.
         """
         if patterns_dir is None:
             self.patterns_dir = Path(__file__).parent / "patterns"
         else:
             self.patterns_dir = Path(patterns_dir)
 
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.use_disk_cache = use_disk_cache
+        self._compiled_cache: CompiledPatterns | None = None
+
         # Manual caching to avoid B019 warnings
         self._tech_patterns_cache: dict[str, dict[str, list[str]]] | None = None
         self._domain_patterns_cache: dict[str, dict[str, list[str]]] | None = None
@@ -146,6 +242,93 @@ class PatternLoader:
         self._tech_patterns_cache = None
         self._domain_patterns_cache = None
         self._content_patterns_cache = None
+        self._compiled_cache = None
+
+    def load_compiled_patterns(self) -> CompiledPatterns:
+        """Load all patterns compiled into a single automaton.
+
+        The compiled artifact is reused from disk while the pattern files are
+        unchanged, so startup skips both YAML parsing and compilation.
+
+        Returns:
+            Compiled patterns for single-pass classification.
+        """
+        if self._compiled_cache is not None:
+            return self._compiled_cache
+
+        signature = self._source_signature()
+        compiled = self._read_compiled_cache(signature)
+        if compiled is None:
+            compiled = CompiledPatterns.compile(self.get_all_patterns())
+            self._write_compiled_cache(signature, compiled)
+        else:
+            self._tech_patterns_cache = compiled.patterns["tech"]
+            self._domain_patterns_cache = compiled.patterns["domain"]
+            self._content_patterns_cache = compiled.patterns["content"]
+
+        self._compiled_cache = compiled
+        return compiled
+
+    @property
+    def compiled_cache_path(self) -> Path:
+        """Location of the compiled artifact for this patterns directory."""
+        digest = hashlib.md5(
+            str(self.patterns_dir.resolve()).encode("utf-8")
+        ).hexdigest()[:16]
+        return self.cache_dir / f"patterns-{digest}.pickle"
+
+    def _source_signature(self) -> tuple[Any, ...]:
+        """Version plus (name, mtime, size) of every pattern file."""
+        entries: list[Any] = [COMPILED_PATTERNS_VERSION]
+        for filename in PATTERN_FILES.values():
+            try:
+                stat = (self.patterns_dir / filename).stat()
+                entries.append((filename, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                entries.append((filename, None, None))
+        return tuple(entries)
+
+    def _read_compiled_cache(
+        self, signature: tuple[Any, ...]
+    ) -> CompiledPatterns | None:
+        """Load the compiled artifact if it matches the current pattern files."""
+        if not self.use_disk_cache:
+            return None
+
+        try:
+            with open(self.compiled_cache_path, "rb") as f:
+                cached_signature, compiled = pickle.load(f)
+        except Exception:
+            # Missing, truncated or incompatible artifacts are simply rebuilt
+            return None
+
+        if cached_signature != signature or not isinstance(compiled, CompiledPatterns):
+            return None
+        return compiled
+
+    def _write_compiled_cache(
+        self, signature: tuple[Any, ...], compiled: CompiledPatterns
+    ) -> None:
+        """Persist the compiled artifact atomically; failures are non-fatal."""
+        if not self.use_disk_cache:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".patterns-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (signature, compiled), f, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(temp_path, self.compiled_cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except (OSError, pickle.PickleError):
+            pass
 
     def get_pattern_files_info(self) -> dict[str, dict[str, Any]]:
         """Get information about pattern files.
@@ -154,13 +337,8 @@ class PatternLoader:
             Dictionary with file information including existence and modification time.
         """
         files_info = {}
-        pattern_files = [
-            "tech_patterns.yaml",
-            "domain_patterns.yaml",
-            "content_patterns.yaml",
-        ]
 
-        for filename in pattern_files:
+        for filename in PATTERN_FILES.values():
             file_path = self.patterns_dir / filename
             files_info[filename] = {
                 "exists": file_path.exists(),
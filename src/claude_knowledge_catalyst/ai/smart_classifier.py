@@ -8,6 +8,7 @@ from pathlib import Path
 
 from ..core.metadata import KnowledgeMetadata
 from ..core.tag_standards import TagStandardsManager
+from ..core.tracing import trace_span
 from .classification_engine import ClassificationEngine, ClassificationResult
 from .pattern_loader import PatternLoader
 
@@ -84,22 +85,23 @@ class SmartContentClassifier:
         Returns:
             List of classification results sorted by confidence.
         """
-        # Get base classification from pattern engine
-        results = self.classification_engine.classify_content(content, file_path)
+        with trace_span("classify.content", file=file_path):
+            # Get base classification from pattern engine
+            results = self.classification_engine.classify_content(content, file_path)
 
-        # Enhance with YAKE if available
-        if self.enable_yake and self.yake_extractor:
-            results = self._enhance_with_yake(content, results)
+            # Enhance with YAKE if available
+            if self.enable_yake and self.yake_extractor:
+                results = self._enhance_with_yake(content, results)
 
-        # Add complexity and confidence classifications
-        results.extend(self._classify_complexity(content))
-        results.extend(self._classify_confidence(content))
+            # Add complexity and confidence classifications
+            results.extend(self._classify_complexity(content))
+            results.extend(self._classify_confidence(content))
 
-        # Deduplicate and sort by confidence
-        results = self._deduplicate_results(results)
-        results.sort(key=lambda x: x.confidence, reverse=True)
+            # Deduplicate and sort by confidence
+            results = self._deduplicate_results(results)
+            results.sort(key=lambda x: x.confidence, reverse=True)
 
-        return results
+            return results
 
     def _enhance_with_yake(
         self, content: str, pattern_results: list[ClassificationResult]
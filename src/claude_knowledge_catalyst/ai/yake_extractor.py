@@ -1,8 +1,17 @@
 """YAKE keyword extraction integration for enhanced content classification."""
 
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import pickle
 import re
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any, NamedTuple, Optional
 
 try:
@@ -10,12 +19,60 @@ try:
     import yake
     from unidecode import unidecode
 
+    # Make the langdetect fallback deterministic across runs
+    langdetect.DetectorFactory.seed = 0
+
     YAKE_AVAILABLE = True
 except ImportError:
     YAKE_AVAILABLE = False
 
+from ..core.text_tokenizer import ENGLISH_STOPWORDS
+from ..core.tracing import trace_span
+from .keyword_cache import KEYWORD_CACHE_FILE_NAME, KeywordCache
+from .pattern_loader import default_cache_dir
+
 logger = logging.getLogger(__name__)
 
+# Map of langdetect codes to the languages used for extraction
+LANGDETECT_LANGUAGE_MAP = {
+    "ja": "ja",
+    "en": "en",
+    "zh-cn": "zh",
+    "zh-tw": "zh",
+    "ko": "ko",
+    "fr": "fr",
+    "de": "de",
+    "es": "es",
+}
+
+# Script-based detection thresholds: CJK share of letters that makes text
+# CJK, kana share of kana + kanji that makes it Japanese rather than Chinese,
+# and the English function-word share (with few accented letters) needed to
+# call Latin text English without langdetect
+CJK_SCRIPT_SHARE = 0.2
+JAPANESE_KANA_SHARE = 0.05
+ENGLISH_STOPWORD_SHARE = 0.15
+NON_ASCII_LATIN_SHARE = 0.01
+MIN_ENGLISH_WORDS = 5
+
+_KANA_PATTERN = re.compile("[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]+")
+_HAN_PATTERN = re.compile("[\u3005\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_HANGUL_PATTERN = re.compile("[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]+")
+_LATIN_PATTERN = re.compile("[A-Za-z\u00c0-\u024f]+")
+_NON_ASCII_LATIN_PATTERN = re.compile("[\u00c0-\u024f]+")
+_WORD_PATTERN = re.compile("[a-z\u00c0-\u024f]+")
+
+# Batches smaller than this are extracted serially; pool startup would dominate
+BATCH_PARALLEL_THRESHOLD = 32
+
+# Upper bound on the default number of worker processes
+MAX_DEFAULT_BATCH_WORKERS = 8
+
+# Config fields that only size caches and never change extracted keywords
+_CACHE_NEUTRAL_FIELDS = frozenset(
+    {"cache_size", "persistent_cache", "persistent_cache_size"}
+)
+
 
 @dataclass
 class YAKEConfig:
@@ -33,6 +90,8 @@ class YAKEConfig:
     confidence_threshold: float = 0.2  # Increased for better filtering
     enable_content_filtering: bool = True  # New: Enable pre-filtering for large content
     max_content_length: int = 5000  # New: Limit content length for processing
+    persistent_cache: bool = True  # Reuse keywords of unchanged content across runs
+    persistent_cache_size: int = 10_000  # LRU bound of the on-disk keyword cache
 
 
 class Keyword(NamedTuple):
@@ -45,58 +104,101 @@ class Keyword(NamedTuple):
 
 
 class LanguageDetector:
-    """Language detection with optimized caching."""
+    """Language detection from Unicode script counts, with an LRU cache.
+
+    Japanese, Chinese and Korean are recognized from the scripts they are
+    written in, and Latin text with a high share of English function words
+    is taken as English; only the remaining (ambiguous) Latin text is passed
+    to langdetect. Results are cached by a digest of the cleaned sample.
+    """
 
     def __init__(self, cache_size: int = 200):
         self._cache_size = cache_size
-        self._language_cache: dict[str, str] = {}
+        self._language_cache: OrderedDict[bytes, str] = OrderedDict()
+        self.script_detections = 0
+        self.fallback_detections = 0
 
     def detect_language(self, text: str) -> str:
         """Detect the primary language of the text."""
         if not YAKE_AVAILABLE:
             return "en"
 
-        # Check cache first
-        if text in self._language_cache:
-            return self._language_cache[text]
+        clean_text = self._clean_for_detection(text)
+        key = hashlib.blake2b(
+            clean_text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
 
-        # Manage cache size
-        if len(self._language_cache) >= self._cache_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self._language_cache))
-            del self._language_cache[oldest_key]
+        # Check cache first
+        cached = self._language_cache.get(key)
+        if cached is not None:
+            self._language_cache.move_to_end(key)
+            return cached
+
+        result = self._detect_uncached(clean_text)
+
+        self._language_cache[key] = result
+        if len(self._language_cache) > self._cache_size:
+            self._language_cache.popitem(last=False)
+        return result
+
+    def _detect_uncached(self, clean_text: str) -> str:
+        """Detect the language of cleaned text without consulting the cache."""
+        if len(clean_text) < 10:
+            return "en"  # Default for short text
+
+        result = self._detect_by_script(clean_text)
+        if result is not None:
+            self.script_detections += 1
+            return result
 
+        self.fallback_detections += 1
         try:
-            # Clean text for better detection
-            clean_text = self._clean_for_detection(text)
-            if len(clean_text) < 10:
-                result = "en"  # Default for short text
-                self._language_cache[text] = result
-                return result
-
             detected = langdetect.detect(clean_text)
-
-            # Map common language codes
-            language_map = {
-                "ja": "ja",
-                "en": "en",
-                "zh-cn": "zh",
-                "zh-tw": "zh",
-                "ko": "ko",
-                "fr": "fr",
-                "de": "de",
-                "es": "es",
-            }
-
-            result = language_map.get(detected, "en")
-            self._language_cache[text] = result
-            return result
-
+            return LANGDETECT_LANGUAGE_MAP.get(detected, "en")
         except Exception as e:
             logger.warning(f"Language detection failed: {e}")
-            result = "en"
-            self._language_cache[text] = result
-            return result
+            return "en"
+
+    def _detect_by_script(self, text: str) -> str | None:
+        """Decide the language from script counts, or None if ambiguous."""
+        kana = _count_chars(_KANA_PATTERN, text)
+        han = _count_chars(_HAN_PATTERN, text)
+        hangul = _count_chars(_HANGUL_PATTERN, text)
+        latin = _count_chars(_LATIN_PATTERN, text)
+        cjk = kana + han + hangul
+
+        if cjk and cjk >= CJK_SCRIPT_SHARE * (cjk + latin):
+            if hangul >= kana + han:
+                return "ko"
+            if kana >= JAPANESE_KANA_SHARE * (kana + han):
+                return "ja"
+            if hangul == 0:
+                return "zh"
+            return None
+
+        if latin == 0:
+            return None
+
+        words = _WORD_PATTERN.findall(text.lower())
+        if len(words) < MIN_ENGLISH_WORDS:
+            return None
+        non_ascii = _count_chars(_NON_ASCII_LATIN_PATTERN, text)
+        stopwords = sum(1 for word in words if word in ENGLISH_STOPWORDS)
+        if (
+            non_ascii <= NON_ASCII_LATIN_SHARE * latin
+            and stopwords >= ENGLISH_STOPWORD_SHARE * len(words)
+        ):
+            return "en"
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get detection and cache statistics."""
+        return {
+            "cache_size": len(self._language_cache),
+            "max_cache_size": self._cache_size,
+            "script_detections": self.script_detections,
+            "fallback_detections": self.fallback_detections,
+        }
 
     def _clean_for_detection(self, text: str) -> str:
         """Clean text for better language detection."""
@@ -154,12 +256,21 @@ class TextNormalizer:
 class YAKEKeywordExtractor:
     """YAKE-based keyword extraction with multi-language support."""
 
-    def __init__(self, config: YAKEConfig | None = None):
-        """Initialize YAKE keyword extractor."""
+    def __init__(self, config: YAKEConfig | None = None, cache_dir: Path | None = None):
+        """Initialize YAKE keyword extractor.
+
+        Args:
+            config: Extraction configuration
+            cache_dir: Directory for the persistent keyword cache.
+                      If None, uses the user cache directory.
+        """
         self.config = config or YAKEConfig()
-        self.language_detector = LanguageDetector()
+        self.language_detector = LanguageDetector(self.config.cache_size)
         self.text_normalizer = TextNormalizer()
         self._extractors: dict[str, yake.KeywordExtractor] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.keyword_cache: KeywordCache | None = None
+        self._config_digest = self._compute_config_digest()
 
         if not YAKE_AVAILABLE:
             logger.warning(
@@ -170,6 +281,27 @@ class YAKEKeywordExtractor:
         # Initialize extractors for supported languages
         self._initialize_extractors()
 
+        if self.config.persistent_cache:
+            self.keyword_cache = KeywordCache(
+                self.cache_dir / KEYWORD_CACHE_FILE_NAME,
+                max_entries=self.config.persistent_cache_size,
+            )
+
+    def _compute_config_digest(self) -> str:
+        """Digest of every config field that influences extracted keywords."""
+        settings = {
+            name: value
+            for name, value in asdict(self.config).items()
+            if name not in _CACHE_NEUTRAL_FIELDS
+        }
+        encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _cache_key(self, content: str, language: str | None) -> str:
+        """Key of the keywords for content, config and requested language."""
+        checksum = hashlib.sha256(content.encode("utf-8", "surrogatepass"))
+        return f"{checksum.hexdigest()}:{self._config_digest}:{language or 'auto'}"
+
     def _initialize_extractors(self) -> None:
         """Initialize YAKE extractors for each supported language."""
         if not YAKE_AVAILABLE:
@@ -201,6 +333,13 @@ class YAKEKeywordExtractor:
         if not content or len(content.strip()) < self.config.min_keyword_length:
             return []
 
+        cache_key = None
+        if self.keyword_cache is not None:
+            cache_key = self._cache_key(content, language)
+            cached = self.keyword_cache.get(cache_key)
+            if cached is not None:
+                return [Keyword(*keyword) for keyword in cached]
+
         try:
             # Pre-filter content for performance
             if self.config.enable_content_filtering:
@@ -229,7 +368,8 @@ class YAKEKeywordExtractor:
                 processed_content = content
 
             # Extract keywords
-            raw_keywords = extractor.extract_keywords(processed_content)
+            with trace_span("classify.yake", language=language):
+                raw_keywords = extractor.extract_keywords(processed_content)
 
             # Debug: Print the format of raw_keywords
             if raw_keywords:
@@ -244,6 +384,8 @@ class YAKEKeywordExtractor:
             logger.debug(
                 f"Extracted {len(keywords)} keywords from {len(content)} chars"
             )
+            if cache_key is not None and self.keyword_cache is not None:
+                self.keyword_cache.put(cache_key, keywords)
             return keywords
 
         except Exception as e:
@@ -359,15 +501,84 @@ class YAKEKeywordExtractor:
 
         return text
 
-    def extract_keywords_batch(self, contents: list[str]) -> list[list[Keyword]]:
-        """Extract keywords from multiple documents efficiently."""
-        results = []
+    def extract_keywords_batch(
+        self, contents: list[str], workers: int | None = None
+    ) -> list[list[Keyword]]:
+        """Extract keywords from multiple documents using a process pool.
+
+        Documents already in the keyword cache are answered in this process;
+        the rest are spread over worker processes, each of which builds its
+        own extractor once and shares the on-disk cache. Workers are spawned
+        rather than forked, as callers may be running other threads.
+
+        Args:
+            contents: Documents to extract keywords from
+            workers: Number of worker processes (defaults to the CPU count,
+                capped at ``MAX_DEFAULT_BATCH_WORKERS``); 1 forces serial
+                extraction in this process
+
+        Returns:
+            One keyword list per input document, in input order
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, MAX_DEFAULT_BATCH_WORKERS)
+        parallel = (
+            YAKE_AVAILABLE and workers > 1 and len(contents) >= BATCH_PARALLEL_THRESHOLD
+        )
+
+        results: list[list[Keyword] | None] = [None] * len(contents)
+        pending = list(range(len(contents)))
+        if parallel:
+            pending = []
+            for index, content in enumerate(contents):
+                cached = self._cached_keywords(content)
+                if cached is None:
+                    pending.append(index)
+                else:
+                    results[index] = cached
+
+        workers = min(workers, len(pending))
+        if parallel and len(pending) >= BATCH_PARALLEL_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker,
+                    initargs=(self.config, self.cache_dir),
+                ) as executor:
+                    chunksize = max(1, len(pending) // (workers * 4))
+                    extracted = list(
+                        executor.map(
+                            _extract_in_worker,
+                            [contents[index] for index in pending],
+                            chunksize=chunksize,
+                        )
+                    )
+                for index, keywords in zip(pending, extracted, strict=True):
+                    results[index] = keywords
+                pending = []
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                print(
+                    f"Warning: Parallel keyword extraction unavailable, "
+                    f"running serially: {e}"
+                )
+
+        for index in pending:
+            results[index] = self.extract_keywords(contents[index])
 
-        for content in contents:
-            keywords = self.extract_keywords(content)
-            results.append(keywords)
+        return [keywords or [] for keywords in results]
 
-        return results
+    def _cached_keywords(self, content: str) -> list[Keyword] | None:
+        """Keywords for auto-detected content from the cache, if present."""
+        if self.keyword_cache is None or not YAKE_AVAILABLE:
+            return None
+        if not content or len(content.strip()) < self.config.min_keyword_length:
+            return None
+
+        cached = self.keyword_cache.get(self._cache_key(content, None))
+        if cached is None:
+            return None
+        return [Keyword(*keyword) for keyword in cached]
 
     def get_extractor_info(self) -> dict[str, Any]:
         """Get information about available extractors."""
@@ -376,9 +587,37 @@ class YAKEKeywordExtractor:
             "supported_languages": self.config.supported_languages,
             "initialized_extractors": list(self._extractors.keys()),
             "config": self.config.__dict__,
+            "language_detection": self.language_detector.get_stats(),
+            "keyword_cache": (
+                self.keyword_cache.get_stats() if self.keyword_cache else None
+            ),
         }
 
 
-def create_yake_extractor(config: YAKEConfig | None = None) -> YAKEKeywordExtractor:
+def create_yake_extractor(
+    config: YAKEConfig | None = None, cache_dir: Path | None = None
+) -> YAKEKeywordExtractor:
     """Convenience function to create YAKE extractor."""
-    return YAKEKeywordExtractor(config)
+    return YAKEKeywordExtractor(config, cache_dir)
+
+
+# Per-process extractor used by extract_keywords_batch worker processes
+_worker_extractor: YAKEKeywordExtractor | None = None
+
+
+def _init_batch_worker(config: YAKEConfig, cache_dir: Path) -> None:
+    """Create the worker's extractor once per process."""
+    global _worker_extractor
+    _worker_extractor = YAKEKeywordExtractor(config, cache_dir)
+
+
+def _extract_in_worker(content: str) -> list[Keyword]:
+    """Extract keywords for one document inside a worker process."""
+    if _worker_extractor is None:
+        raise RuntimeError("Batch extraction worker was not initialized")
+    return _worker_extractor.extract_keywords(content)
+
+
+def _count_chars(pattern: re.Pattern[str], text: str) -> int:
+    """Number of characters in text matched by a character-class pattern."""
+    return sum(len(run) for run in pattern.findall(text))
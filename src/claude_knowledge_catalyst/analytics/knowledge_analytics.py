@@ -6,20 +6,37 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
-
 from ..core.config import CKCConfig
 from ..core.metadata import KnowledgeMetadata, MetadataManager
+from ..core.metadata_index import MetadataIndex
 from ..core.structure_validator import StructureHealthMonitor
+from .usage_statistics import PerformanceMonitor, UsageStatisticsCollector
 
 
 class KnowledgeAnalytics:
     """Comprehensive knowledge analytics and insights."""
 
-    def __init__(self, vault_path: Path, config: CKCConfig):
+    def __init__(
+        self,
+        vault_path: Path,
+        config: CKCConfig,
+        usage_collector: UsageStatisticsCollector | None = None,
+    ):
+        """Initialize knowledge analytics.
+
+        Args:
+            vault_path: Vault to analyze
+            config: CKC configuration
+            usage_collector: Collector that records how long each report
+                step takes; steps are traced either way
+        """
         self.vault_path = vault_path
         self.config = config
+        self.usage_collector = usage_collector
         self.metadata_manager = MetadataManager()
+        self.metadata_index = MetadataIndex.for_directory(
+            vault_path, self.metadata_manager
+        )
         self.health_monitor = StructureHealthMonitor(
             vault_path, config.hybrid_structure
         )
@@ -44,38 +61,53 @@ class KnowledgeAnalytics:
             "report_sections": {},
         }
 
-        # Collect all knowledge items with error handling
-        try:
-            knowledge_items = self._collect_knowledge_items()
-        except (FileNotFoundError, PermissionError):
-            # Handle missing files gracefully
-            knowledge_items = []
-            # Could log warning here in the future
-
-        # Generate report sections
-        report["report_sections"]["overview"] = self._generate_overview(knowledge_items)
-        report["report_sections"]["content_analysis"] = (
-            self._analyze_content_distribution(knowledge_items)
-        )
-        report["report_sections"]["quality_metrics"] = self._analyze_quality_metrics(
-            knowledge_items
-        )
-        report["report_sections"]["usage_patterns"] = self._analyze_usage_patterns(
-            knowledge_items
-        )
-        report["report_sections"]["knowledge_evolution"] = (
-            self._analyze_knowledge_evolution(knowledge_items)
-        )
-        report["report_sections"]["structure_health"] = self._analyze_structure_health()
-        report["report_sections"]["recommendations"] = self._generate_recommendations(
-            knowledge_items
-        )
+        with self._monitor("analyze.report"):
+            # Collect all knowledge items with error handling
+            try:
+                with self._monitor("analyze.collect"):
+                    knowledge_items = self._collect_knowledge_items()
+            except (FileNotFoundError, PermissionError):
+                # Handle missing files gracefully
+                knowledge_items = []
+                # Could log warning here in the future
+
+            # Generate report sections
+            sections = report["report_sections"]
+            with self._monitor("analyze.overview", files=len(knowledge_items)):
+                sections["overview"] = self._generate_overview(knowledge_items)
+            with self._monitor("analyze.content", files=len(knowledge_items)):
+                sections["content_analysis"] = self._analyze_content_distribution(
+                    knowledge_items
+                )
+            with self._monitor("analyze.quality", files=len(knowledge_items)):
+                sections["quality_metrics"] = self._analyze_quality_metrics(
+                    knowledge_items
+                )
+            with self._monitor("analyze.usage", files=len(knowledge_items)):
+                sections["usage_patterns"] = self._analyze_usage_patterns(
+                    knowledge_items
+                )
+            with self._monitor("analyze.evolution", files=len(knowledge_items)):
+                sections["knowledge_evolution"] = self._analyze_knowledge_evolution(
+                    knowledge_items
+                )
+            with self._monitor("analyze.structure_health"):
+                sections["structure_health"] = self._analyze_structure_health()
+            with self._monitor("analyze.recommendations", files=len(knowledge_items)):
+                sections["recommendations"] = self._generate_recommendations(
+                    knowledge_items
+                )
 
-        # Save report
-        self._save_report(report)
+            # Save report
+            with self._monitor("analyze.save"):
+                self._save_report(report)
 
         return report
 
+    def _monitor(self, operation: str, **metadata: Any) -> PerformanceMonitor:
+        """Time and trace one step of report generation."""
+        return PerformanceMonitor(self.usage_collector, operation, metadata)
+
     def _collect_knowledge_items(self) -> list[tuple[Path, KnowledgeMetadata]]:
         """Collect all knowledge items with metadata."""
         # Check cache
@@ -87,20 +119,15 @@ class KnowledgeAnalytics:
             )
             return cached_items
 
-        knowledge_items = []
-
-        # Find all markdown files
-        md_files = list(self.vault_path.rglob("*.md"))
+        def report_error(md_file: Path, error: Exception) -> None:
+            print(f"Warning: Could not extract metadata from {md_file}: {error}")
 
-        for md_file in md_files:
-            if md_file.name == "README.md":
-                continue
-
-            try:
-                metadata = self.metadata_manager.extract_metadata_from_file(md_file)
-                knowledge_items.append((md_file, metadata))
-            except Exception as e:
-                print(f"Warning: Could not extract metadata from {md_file}: {e}")
+        # Unchanged files are served from the persistent index
+        knowledge_items = self.metadata_index.scan(
+            self.vault_path,
+            skip=lambda md_file: md_file.name == "README.md",
+            on_error=report_error,
+        )
 
         # Cache results
         self._cache["knowledge_items"] = knowledge_items
@@ -720,6 +747,9 @@ class KnowledgeAnalytics:
 
     def generate_visualizations(self, report: dict[str, Any]) -> dict[str, Path]:
         """Generate visualization charts from analytics data."""
+        # matplotlib is only needed for charts, so it is imported on demand
+        import matplotlib.pyplot as plt
+
         visualizations = {}
         viz_dir = self.analytics_dir / "visualizations"
         viz_dir.mkdir(exist_ok=True)
@@ -0,0 +1,141 @@
+"""Buffered background writer for segmented logs."""
+
+import atexit
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from .segmented_log import SegmentedLog
+
+DEFAULT_MAX_BUFFERED = 256
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class BufferedLogWriter:
+    """Batches log entries in memory and appends them from a worker thread.
+
+    Entries are flushed once ``max_buffered`` are pending, every
+    ``flush_interval`` seconds, on ``flush()``/``close()`` and at interpreter
+    exit, so each flush opens every affected segment once instead of once
+    per entry. Entries may name a file whose size is looked up at flush
+    time, which keeps ``stat`` calls off the caller's thread too.
+    """
+
+    def __init__(
+        self,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize buffered writer.
+
+        Args:
+            max_buffered: Pending entries that trigger an immediate flush
+            flush_interval: Seconds between periodic flushes
+        """
+        self.max_buffered = max_buffered
+        self.flush_interval = flush_interval
+        self.flushes = 0
+        self.entries_written = 0
+        self._buffer: list[tuple[SegmentedLog, dict[str, Any], Path | None]] = []
+        self._buffer_lock = threading.Lock()
+        # Held while writing so flushes (and log maintenance) never interleave
+        self.write_lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self, log: SegmentedLog, entry: dict[str, Any], stat_path: Path | None = None
+    ) -> None:
+        """Queue an entry for writing.
+
+        Args:
+            log: Log the entry belongs to
+            entry: Entry to append
+            stat_path: File whose size is stored as ``file_size`` when written
+        """
+        full = False
+        with self._buffer_lock:
+            if self._stopped:
+                pending = [(log, entry, stat_path)]
+            else:
+                self._buffer.append((log, entry, stat_path))
+                pending = None
+                full = len(self._buffer) >= self.max_buffered
+                self._ensure_thread()
+
+        if pending is not None:
+            # Closed writers fall back to writing synchronously
+            self._write(pending)
+        elif full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write all pending entries now."""
+        # Taking the write lock first keeps concurrent flushes in order
+        with self.write_lock:
+            with self._buffer_lock:
+                pending, self._buffer = self._buffer, []
+            if pending:
+                self._write(pending)
+
+    def close(self) -> None:
+        """Stop the worker thread and write pending entries."""
+        with self._buffer_lock:
+            self._stopped = True
+            thread = self._thread
+        # Closed writers need no exit hook and must not be kept alive by one
+        atexit.unregister(self.close)
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be written."""
+        with self._buffer_lock:
+            return len(self._buffer)
+
+    def _ensure_thread(self) -> None:
+        """Start the worker thread (caller holds the buffer lock)."""
+        if self._thread is None:
+            # Registered only once there is something to flush at exit
+            atexit.register(self.close)
+            self._thread = threading.Thread(
+                target=self._run, name="ckc-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Flush on a timer or when the buffer fills, until closed."""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+            with self._buffer_lock:
+                if self._stopped:
+                    return
+
+    def _write(
+        self, pending: list[tuple[SegmentedLog, dict[str, Any], Path | None]]
+    ) -> None:
+        """Append entries grouped by log, resolving deferred file sizes."""
+        batches: dict[SegmentedLog, list[dict[str, Any]]] = defaultdict(list)
+        for log, entry, stat_path in pending:
+            if stat_path is not None:
+                try:
+                    entry["file_size"] = stat_path.stat().st_size
+                except OSError:
+                    entry["file_size"] = 0
+            batches[log].append(entry)
+
+        with self.write_lock:
+            for log, entries in batches.items():
+                try:
+                    log.append(entries)
+                except OSError:
+                    continue  # Fail silently for logging
+                self.entries_written += len(entries)
+            self.flushes += 1
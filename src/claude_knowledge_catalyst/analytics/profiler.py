@@ -0,0 +1,215 @@
+"""cProfile and tracemalloc harness for CKC commands."""
+
+import cProfile
+import io
+import pstats
+import re
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+PROFILES_DIR_NAME = "profiles"
+DEFAULT_TOP_N = 25
+
+# Allocation sites listed in the memory report
+MEMORY_TOP_N = 10
+
+
+class HotFunction(NamedTuple):
+    """A function's share of a profiled run."""
+
+    location: str
+    calls: int
+    total_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass
+class ProfileReport:
+    """Files and headline numbers of one profiled run."""
+
+    label: str
+    stats_path: Path
+    summary_path: Path
+    elapsed_seconds: float
+    hot_functions: list[HotFunction] = field(default_factory=list)
+    peak_memory_bytes: int | None = None
+
+
+class CommandProfiler:
+    """Runs a callable under cProfile and optionally tracemalloc.
+
+    Each run writes ``<timestamp>-<label>.prof``, loadable with ``pstats``
+    or snakeviz, and a ``.txt`` summary with the top functions by own and
+    cumulative time and, when memory tracing is on, the peak traced memory
+    and the largest allocation sites. Runs of the same command within one
+    second are numbered rather than overwriting each other.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        top_n: int = DEFAULT_TOP_N,
+        trace_memory: bool = False,
+    ) -> None:
+        """Initialize command profiler.
+
+        Args:
+            output_dir: Directory for profile files, usually ``.ckc/profiles``
+            top_n: Number of functions listed in the summary
+            trace_memory: Also record allocations with tracemalloc
+        """
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+
+    def run(self, label: str, func: Callable[[], Any]) -> tuple[Any, ProfileReport]:
+        """Profile a call and write its reports.
+
+        Reports are written even if the call raises.
+
+        Args:
+            label: Name of the profiled work, used in file names
+            func: Callable to profile
+
+        Returns:
+            Tuple of (call result, profile report)
+        """
+        profiler = cProfile.Profile()
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        snapshot = None
+        peak = None
+        try:
+            profiler.enable()
+            try:
+                result = func()
+            finally:
+                profiler.disable()
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            report = self._write_reports(label, profiler, elapsed, peak, snapshot)
+
+        return result, report
+
+    def _write_reports(
+        self,
+        label: str,
+        profiler: cProfile.Profile,
+        elapsed: float,
+        peak: int | None,
+        snapshot: tracemalloc.Snapshot | None,
+    ) -> ProfileReport:
+        """Write the pstats file and text summary for a run."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self._reserve_stem(label)
+        stats_path = self.output_dir / f"{stem}.prof"
+        summary_path = self.output_dir / f"{stem}.txt"
+
+        profiler.dump_stats(str(stats_path))
+        listing = io.StringIO()
+        stats = pstats.Stats(profiler, stream=listing)
+        hot_functions = _hot_functions(stats, self.top_n)
+
+        lines = [
+            f"Command: {label}",
+            f"Elapsed: {elapsed:.3f}s",
+            f"Profile: {stats_path.name}",
+        ]
+        if peak is not None:
+            lines.append(f"Peak traced memory: {_format_bytes(peak)}")
+
+        for sort_key, title in [
+            (pstats.SortKey.TIME, "own time"),
+            (pstats.SortKey.CUMULATIVE, "cumulative time"),
+        ]:
+            lines += ["", f"Top {self.top_n} functions by {title}:", ""]
+            listing.seek(0)
+            listing.truncate()
+            stats.sort_stats(sort_key).print_stats(self.top_n)
+            lines.append(listing.getvalue().strip("\n"))
+
+        if snapshot is not None:
+            lines += ["", f"Top {MEMORY_TOP_N} allocation sites:", ""]
+            snapshot = snapshot.filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__)]
+            )
+            for stat in snapshot.statistics("lineno")[:MEMORY_TOP_N]:
+                lines.append(
+                    f"{_format_bytes(stat.size):>10}  {stat.count:>8} blocks  "
+                    f"{stat.traceback}"
+                )
+
+        summary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return ProfileReport(
+            label=label,
+            stats_path=stats_path,
+            summary_path=summary_path,
+            elapsed_seconds=elapsed,
+            hot_functions=hot_functions,
+            peak_memory_bytes=peak,
+        )
+
+    def _reserve_stem(self, label: str) -> str:
+        """Claim a file stem no earlier run has used.
+
+        The summary file is created exclusively, so runs of the same command
+        within one second get numbered stems instead of overwriting each other.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        slug = _slug(label)
+        stem = f"{timestamp}-{slug}"
+        attempt = 1
+        while True:
+            try:
+                (self.output_dir / f"{stem}.txt").open("x").close()
+                return stem
+            except FileExistsError:
+                attempt += 1
+                stem = f"{timestamp}-{attempt}-{slug}"
+
+
+def _hot_functions(stats: pstats.Stats, top_n: int) -> list[HotFunction]:
+    """The functions that spent the most time in their own code."""
+    entries = stats.stats  # type: ignore[attr-defined]
+    ranked = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)
+    hot_functions = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in ranked[:top_n]:
+        hot_functions.append(
+            HotFunction(
+                location=f"{Path(filename).name}:{line}({name})",
+                calls=calls,
+                total_seconds=total,
+                cumulative_seconds=cumulative,
+            )
+        )
+    return hot_functions
+
+
+def _slug(label: str) -> str:
+    """File-name-safe version of a label."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", label).strip("-")[:60] or "command"
+
+
+def _format_bytes(size: int) -> str:
+    """Human-readable byte count."""
+    value = float(size)
+    for unit in ["B", "KiB", "MiB"]:
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
@@ -0,0 +1,356 @@
+"""Append-only JSONL logs split into daily segment files."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_FILE_NAME = "index.json"
+
+# Bump when the index layout changes
+SEGMENT_INDEX_VERSION = 1
+
+# Bytes read from the end of a segment to find its last entry
+_TAIL_READ_BYTES = 64 * 1024
+
+
+class SegmentedLog:
+    """JSONL log stored as one segment file per day.
+
+    Entries are routed to ``<YYYY-MM-DD>.jsonl`` by the date prefix of their
+    ``timestamp``. A small ``index.json`` records each segment's first and
+    last timestamp along with the size it had when they were read, so
+    readers skip segments outside the requested window without opening them
+    and only parse timestamps in the segment that straddles the cutoff.
+    Appenders never touch the index: a segment whose size no longer matches
+    is re-indexed from its first and last line on the next read. Retention
+    deletes whole segment files.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize segmented log.
+
+        Args:
+            directory: Directory holding the segment files and index
+        """
+        self.directory = directory
+        self.index_path = directory / INDEX_FILE_NAME
+        self._lock = threading.RLock()
+        self._index: dict[str, dict[str, Any]] | None = None
+
+    def append(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Append entries to the segments for their days.
+
+        Args:
+            entries: Log entries, each with an ISO ``timestamp``
+        """
+        lines_by_segment: dict[str, list[str]] = {}
+        for entry in entries:
+            name = self.segment_name(str(entry.get("timestamp", "")))
+            line = json.dumps(entry, ensure_ascii=False) + "\n"
+            lines_by_segment.setdefault(name, []).append(line)
+
+        if not lines_by_segment:
+            return
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for name, lines in lines_by_segment.items():
+                with open(self.directory / name, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+
+    @staticmethod
+    def segment_name(timestamp: str) -> str:
+        """Segment file name for an ISO timestamp (today's if unparseable)."""
+        day = timestamp[:10]
+        try:
+            datetime.strptime(day, "%Y-%m-%d")
+        except ValueError:
+            day = datetime.now().strftime("%Y-%m-%d")
+        return f"{day}{SEGMENT_SUFFIX}"
+
+    def segments(self) -> list[Path]:
+        """Segment files in chronological order."""
+        try:
+            return sorted(
+                path
+                for path in self.directory.iterdir()
+                if path.suffix == SEGMENT_SUFFIX and path.is_file()
+            )
+        except OSError:
+            return []
+
+    def read_since(self, cutoff: datetime) -> Iterator[dict[str, Any]]:
+        """Stream entries with a timestamp at or after the cutoff.
+
+        Args:
+            cutoff: Earliest timestamp to include
+
+        Yields:
+            Log entries in segment order; malformed lines are skipped
+        """
+        for path, start, end in self._ranges():
+            if end is not None and end < cutoff:
+                continue
+            # Segments that start inside the window need no timestamp checks
+            filter_by_time = start is None or start < cutoff
+            yield from _read_segment(path, cutoff if filter_by_time else None)
+
+    def drop_before(self, cutoff: datetime) -> int:
+        """Remove entries that predate the cutoff.
+
+        Segments whose entries are all older are deleted outright. The
+        segment straddling the cutoff is rewritten by ``trim_segment``.
+        Both happen under the log's lock, so in-process appenders can keep
+        writing meanwhile.
+
+        Args:
+            cutoff: Earliest timestamp to keep
+
+        Returns:
+            Number of segment files deleted
+        """
+        removed = 0
+        with self._lock:
+            for path, start, end in self._ranges():
+                if end is not None and end < cutoff:
+                    try:
+                        path.unlink()
+                        removed += 1
+                    except OSError:
+                        continue
+                elif start is None or start < cutoff:
+                    self.trim_segment(path, cutoff)
+            self._refresh_index()
+        return removed
+
+    def trim_segment(self, path: Path, cutoff: datetime) -> int:
+        """Drop a segment's entries before the cutoff, replacing it atomically.
+
+        Surviving lines are streamed into a temporary file that is renamed
+        over the segment, so an interruption leaves the original intact.
+        Segments are append-ordered, so timestamps are only parsed up to the
+        first entry at or after the cutoff; the rest of the file is copied
+        as raw bytes.
+
+        Args:
+            path: Segment file
+            cutoff: Earliest timestamp to keep
+
+        Returns:
+            Number of lines removed
+        """
+        with self._lock:
+            try:
+                return self._rewrite_from_cutoff(path, cutoff)
+            except OSError as e:
+                print(f"Warning: Could not trim log segment {path}: {e}")
+                return 0
+
+    def _rewrite_from_cutoff(self, path: Path, cutoff: datetime) -> int:
+        """Stream a segment into a temp file, keeping entries from the cutoff."""
+        removed = 0
+        with open(path, "rb") as source:
+            # Find where the retained part begins
+            keep_from = None
+            while True:
+                offset = source.tell()
+                line = source.readline()
+                if not line:
+                    break
+                timestamp = _parse_time(_entry_timestamp(line))
+                if timestamp is not None and timestamp >= cutoff:
+                    keep_from = offset
+                    break
+                removed += 1
+
+            if removed == 0:
+                return 0
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as target:
+                    if keep_from is not None:
+                        source.seek(keep_from)
+                        shutil.copyfileobj(source, target)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        return removed
+
+    def import_legacy(self, log_path: Path) -> None:
+        """Split a single-file JSONL log into segments and remove it.
+
+        Args:
+            log_path: Legacy log file; nothing happens if it does not exist
+        """
+        if not log_path.exists():
+            return
+
+        with self._lock:
+            try:
+                with open(log_path, encoding="utf-8") as f:
+                    batch: list[dict[str, Any]] = []
+                    for line in f:
+                        entry = _parse_line(line)
+                        if entry is not None:
+                            batch.append(entry)
+                        if len(batch) >= 1000:
+                            self.append(batch)
+                            batch = []
+                    self.append(batch)
+                log_path.unlink()
+            except OSError as e:
+                print(f"Warning: Could not migrate log {log_path}: {e}")
+
+    def _ranges(self) -> list[tuple[Path, datetime | None, datetime | None]]:
+        """Each segment with its first and last timestamp, from the index."""
+        with self._lock:
+            index = self._refresh_index()
+            ranges = []
+            for path in self.segments():
+                info = index.get(path.name, {})
+                ranges.append(
+                    (path, _parse_time(info.get("start")), _parse_time(info.get("end")))
+                )
+            return ranges
+
+    def _refresh_index(self) -> dict[str, dict[str, Any]]:
+        """Bring the index up to date with the segment files on disk."""
+        if self._index is None:
+            self._index = self._load_index()
+
+        index = self._index
+        changed = False
+        names = set()
+        for path in self.segments():
+            names.add(path.name)
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            if index.get(path.name, {}).get("size") == size:
+                continue
+
+            start, end = _first_and_last_timestamp(path)
+            index[path.name] = {"size": size, "start": start, "end": end}
+            changed = True
+
+        for name in set(index) - names:
+            del index[name]
+            changed = True
+
+        if changed:
+            self._save_index(index)
+        return index
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Read the index file, starting over if it is missing or invalid."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != SEGMENT_INDEX_VERSION:
+            return {}
+        segments = data.get("segments")
+        return segments if isinstance(segments, dict) else {}
+
+    def _save_index(self, index: dict[str, dict[str, Any]]) -> None:
+        """Write the index atomically; failures only cost a re-index later."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.directory, prefix=".index-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": SEGMENT_INDEX_VERSION, "segments": index}, f)
+                os.replace(temp_path, self.index_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
+
+def _parse_line(line: str) -> dict[str, Any] | None:
+    """Decode one JSONL line, or None if it is not a log entry."""
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _parse_time(value: Any) -> datetime | None:
+    """Parse an ISO timestamp, or None if it is missing or invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _read_segment(path: Path, cutoff: datetime | None) -> Iterator[dict[str, Any]]:
+    """Stream a segment's entries, dropping those before the cutoff if given."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                entry = _parse_line(line)
+                if entry is None:
+                    continue
+                if cutoff is not None:
+                    entry_time = _parse_time(entry.get("timestamp"))
+                    if entry_time is None or entry_time < cutoff:
+                        continue
+                yield entry
+    except OSError:
+        return
+
+
+def _first_and_last_timestamp(path: Path) -> tuple[str | None, str | None]:
+    """Timestamps of the first and last valid entries of a segment."""
+    try:
+        with open(path, "rb") as f:
+            first = None
+            for line in f:
+                first = _entry_timestamp(line)
+                if first is not None:
+                    break
+
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - _TAIL_READ_BYTES))
+            tail_lines = f.read().splitlines()
+    except OSError:
+        return None, None
+
+    last = None
+    for line in reversed(tail_lines):
+        last = _entry_timestamp(line)
+        if last is not None:
+            break
+    return first, last or first
+
+
+def _entry_timestamp(line: bytes) -> str | None:
+    """The timestamp of an encoded entry, if it is valid."""
+    try:
+        entry = _parse_line(line.decode("utf-8"))
+    except UnicodeDecodeError:
+        return None
+    if entry is None or _parse_time(entry.get("timestamp")) is None:
+        return None
+    return str(entry["timestamp"])
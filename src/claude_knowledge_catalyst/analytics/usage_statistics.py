@@ -1,8 +1,8 @@
 """Usage statistics and performance analysis for CKC."""
 
-import json
 import time
 from collections import Counter, defaultdict
+from contextlib import AbstractContextManager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -11,12 +11,23 @@ if TYPE_CHECKING:
     from typing import Self
 
 from ..core.config import CKCConfig
+from ..core.tracing import Span, trace_span
+from .log_writer import BufferedLogWriter
+from .segmented_log import SegmentedLog
 
 
 class UsageStatisticsCollector:
     """Collects and analyzes usage statistics for CKC."""
 
-    def __init__(self, vault_path: Path, config: CKCConfig):
+    def __init__(self, vault_path: Path, config: CKCConfig, buffered: bool = True):
+        """Initialize usage statistics collector.
+
+        Args:
+            vault_path: Vault whose ``.ckc/statistics`` directory holds the logs
+            config: CKC configuration
+            buffered: Batch log writes on a background thread instead of
+                appending to the log file on every tracked event
+        """
         self.vault_path = vault_path
         self.config = config
 
@@ -24,10 +35,20 @@ class UsageStatisticsCollector:
         self.stats_dir = vault_path / ".ckc" / "statistics"
         self.stats_dir.mkdir(parents=True, exist_ok=True)
 
-        # Usage tracking files
-        self.usage_log_path = self.stats_dir / "usage_log.jsonl"
-        self.performance_log_path = self.stats_dir / "performance_log.jsonl"
-        self.interaction_log_path = self.stats_dir / "interaction_log.jsonl"
+        # Usage tracking logs, one directory of daily segments each
+        self.usage_log = SegmentedLog(self.stats_dir / "usage_log")
+        self.performance_log = SegmentedLog(self.stats_dir / "performance_log")
+        self.interaction_log = SegmentedLog(self.stats_dir / "interaction_log")
+
+        # Split single-file logs written by earlier versions into segments
+        for name, log in (
+            ("usage_log", self.usage_log),
+            ("performance_log", self.performance_log),
+            ("interaction_log", self.interaction_log),
+        ):
+            log.import_legacy(self.stats_dir / f"{name}.jsonl")
+
+        self.log_writer = BufferedLogWriter() if buffered else None
 
         # Cache
         self._stats_cache: dict[str, Any] = {}
@@ -44,10 +65,19 @@ class UsageStatisticsCollector:
             "metadata": metadata or {},
         }
 
-        self._append_to_log(self.usage_log_path, log_entry)
+        self._append_to_log(self.usage_log, log_entry)
 
-    def track_file_access(self, file_path: Path, access_type: str) -> None:
-        """Track file access patterns."""
+    def track_file_access(
+        self, file_path: Path, access_type: str, file_size: int | None = None
+    ) -> None:
+        """Track file access patterns.
+
+        Args:
+            file_path: Accessed file
+            access_type: Kind of access (read, write, sync, delete)
+            file_size: Size of the file if already known; otherwise it is
+                looked up when the entry is written
+        """
         # Try to make path relative to vault, fallback to absolute path
         try:
             relative_path = str(file_path.relative_to(self.vault_path))
@@ -59,10 +89,14 @@ class UsageStatisticsCollector:
             "timestamp": datetime.now().isoformat(),
             "file_path": relative_path,
             "access_type": access_type,  # read, write, sync, delete
-            "file_size": file_path.stat().st_size if file_path.exists() else 0,
+            "file_size": file_size or 0,
         }
 
-        self._append_to_log(self.interaction_log_path, log_entry)
+        self._append_to_log(
+            self.interaction_log,
+            log_entry,
+            stat_path=file_path if file_size is None else None,
+        )
 
     def track_performance_metric(
         self, metric_name: str, value: float, context: dict | None = None
@@ -75,10 +109,11 @@ class UsageStatisticsCollector:
             "context": context or {},
         }
 
-        self._append_to_log(self.performance_log_path, log_entry)
+        self._append_to_log(self.performance_log, log_entry)
 
     def generate_usage_report(self, days: int = 30) -> dict[str, Any]:
         """Generate comprehensive usage statistics report."""
+        self.flush()
         cutoff_date = datetime.now() - timedelta(days=days)
 
         report = {
@@ -102,7 +137,7 @@ class UsageStatisticsCollector:
 
     def _analyze_operations(self, cutoff_date: datetime) -> dict[str, Any]:
         """Analyze operation statistics."""
-        operations = self._load_log_entries(self.usage_log_path, cutoff_date)
+        operations = self._load_log_entries(self.usage_log, cutoff_date)
 
         analysis: dict[str, Any] = {
             "total_operations": len(operations),
@@ -143,7 +178,7 @@ class UsageStatisticsCollector:
 
     def _analyze_file_access(self, cutoff_date: datetime) -> dict[str, Any]:
         """Analyze file access patterns."""
-        accesses = self._load_log_entries(self.interaction_log_path, cutoff_date)
+        accesses = self._load_log_entries(self.interaction_log, cutoff_date)
 
         access_types: Counter[str] = Counter()
         most_accessed_files: Counter[str] = Counter()
@@ -215,7 +250,7 @@ class UsageStatisticsCollector:
 
     def _analyze_performance(self, cutoff_date: datetime) -> dict[str, Any]:
         """Analyze performance metrics."""
-        metrics = self._load_log_entries(self.performance_log_path, cutoff_date)
+        metrics = self._load_log_entries(self.performance_log, cutoff_date)
 
         metric_types: Counter[str] = Counter()
         performance_trends: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -275,8 +310,8 @@ class UsageStatisticsCollector:
 
     def _analyze_user_behavior(self, cutoff_date: datetime) -> dict[str, Any]:
         """Analyze user behavior patterns."""
-        operations = self._load_log_entries(self.usage_log_path, cutoff_date)
-        accesses = self._load_log_entries(self.interaction_log_path, cutoff_date)
+        operations = self._load_log_entries(self.usage_log, cutoff_date)
+        accesses = self._load_log_entries(self.interaction_log, cutoff_date)
 
         analysis = {
             "session_patterns": self._analyze_sessions(operations + accesses),
@@ -509,9 +544,7 @@ class UsageStatisticsCollector:
 
     def _analyze_system_health(self, cutoff_date: datetime) -> dict[str, Any]:
         """Analyze system health indicators."""
-        performance_metrics = self._load_log_entries(
-            self.performance_log_path, cutoff_date
-        )
+        performance_metrics = self._load_log_entries(self.performance_log, cutoff_date)
 
         health_indicators = {
             "error_rate": 0,  # Would need error tracking
@@ -605,92 +638,83 @@ class UsageStatisticsCollector:
 
         return recommendations
 
-    def _load_log_entries(self, log_path: Path, cutoff_date: datetime) -> list[dict]:
-        """Load log entries since cutoff date."""
-        entries: list[dict] = []
-
-        if not log_path.exists():
-            return entries
+    def _load_log_entries(self, log: SegmentedLog, cutoff_date: datetime) -> list[dict]:
+        """Load log entries since cutoff date.
 
-        try:
-            with open(log_path, encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        entry_time = datetime.fromisoformat(entry["timestamp"])
-                        if entry_time >= cutoff_date:
-                            entries.append(entry)
-                    except (json.JSONDecodeError, KeyError, ValueError):
-                        continue
-        except OSError:
-            pass
+        Only segments overlapping the window are opened.
+        """
+        return list(log.read_since(cutoff_date))
 
-        return entries
+    def _append_to_log(
+        self, log: SegmentedLog, entry: dict, stat_path: Path | None = None
+    ) -> None:
+        """Append entry to log file, through the buffered writer if enabled."""
+        if self.log_writer is not None:
+            self.log_writer.submit(log, entry, stat_path)
+            return
 
-    def _append_to_log(self, log_path: Path, entry: dict) -> None:
-        """Append entry to log file."""
         try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if stat_path is not None:
+                entry["file_size"] = (
+                    stat_path.stat().st_size if stat_path.exists() else 0
+                )
+            log.append([entry])
         except OSError:
             pass  # Fail silently for logging
 
+    def flush(self) -> None:
+        """Write any buffered log entries."""
+        if self.log_writer is not None:
+            self.log_writer.flush()
+
+    def close(self) -> None:
+        """Stop the background writer after writing buffered entries."""
+        if self.log_writer is not None:
+            self.log_writer.close()
+
     def cleanup_old_logs(self, days_to_keep: int = 90) -> None:
-        """Clean up old log entries."""
+        """Clean up old log entries by deleting expired daily segments."""
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+        self.flush()
 
-        for log_path in [
-            self.usage_log_path,
-            self.performance_log_path,
-            self.interaction_log_path,
-        ]:
-            if not log_path.exists():
-                continue
-
-            # Read and filter entries
-            recent_entries = []
-            try:
-                with open(log_path, encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            entry = json.loads(line.strip())
-                            entry_time = datetime.fromisoformat(entry["timestamp"])
-                            if entry_time >= cutoff_date:
-                                recent_entries.append(entry)
-                        except (json.JSONDecodeError, KeyError, ValueError):
-                            continue
-
-                # Write back filtered entries
-                with open(log_path, "w", encoding="utf-8") as f:
-                    for entry in recent_entries:
-                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-
-            except OSError:
-                pass
+        for log in [self.usage_log, self.performance_log, self.interaction_log]:
+            log.drop_before(cutoff_date)
 
 
 class PerformanceMonitor:
-    """Context manager for tracking operation performance."""
+    """Context manager for tracking operation performance.
+
+    Timing uses ``time.perf_counter_ns``. While tracing is active the
+    operation is also recorded as a span, so nested monitors show up as a
+    hierarchy in the exported trace. Without a collector only the span is
+    recorded.
+    """
 
     def __init__(
         self,
-        collector: UsageStatisticsCollector,
+        collector: UsageStatisticsCollector | None,
         operation_name: str,
         metadata: dict | None = None,
     ):
         self.collector = collector
         self.operation_name = operation_name
         self.metadata = metadata or {}
-        self.start_time: float | None = None
+        self.start_ns: int | None = None
+        self._span: AbstractContextManager[Span | None] | None = None
 
     def __enter__(self) -> "Self":
-        self.start_time = time.time()
+        self._span = trace_span(self.operation_name, **self.metadata)
+        self._span.__enter__()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.collector is not None and self.start_ns is not None:
+            duration = (time.perf_counter_ns() - self.start_ns) / 1e9
             self.collector.track_operation(self.operation_name, duration, self.metadata)
+        if self._span is not None:
+            self._span.__exit__(exc_type, exc_val, exc_tb)
+            self._span = None
 
 
 def create_usage_collector(
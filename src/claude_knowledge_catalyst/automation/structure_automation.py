@@ -170,13 +170,16 @@ class AutomatedStructureManager:
         md_files = list(self.vault_path.rglob("*.md"))
         result["files_checked"] = len(md_files)
 
-        for md_file in md_files:
-            if md_file.name == "README.md":
-                continue
+        extractions = self.metadata_manager.extract_metadata_bulk(
+            md_file for md_file in md_files if md_file.name != "README.md"
+        )
 
+        for md_file, metadata, error in extractions:
             try:
+                if metadata is None:
+                    raise error or ValueError("No metadata extracted")
+
                 # Check metadata
-                metadata = self.metadata_manager.extract_metadata_from_file(md_file)
                 issues = self._analyze_metadata_issues(metadata, md_file)
 
                 if issues:
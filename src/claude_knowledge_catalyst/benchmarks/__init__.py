@@ -0,0 +1,21 @@
+"""Synthetic vaults and benchmarks for Claude Knowledge Catalyst."""
+
+from .suite import (
+    BenchmarkResult,
+    BenchmarkRun,
+    BenchmarkSuite,
+    Regression,
+    find_regressions,
+)
+from .vault_generator import VAULT_SIZES, GeneratedVault, VaultGenerator
+
+__all__ = [
+    "BenchmarkResult",
+    "BenchmarkRun",
+    "BenchmarkSuite",
+    "Regression",
+    "find_regressions",
+    "VAULT_SIZES",
+    "GeneratedVault",
+    "VaultGenerator",
+]
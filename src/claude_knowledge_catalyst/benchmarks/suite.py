@@ -0,0 +1,361 @@
+"""Benchmark suite for CKC's main workloads with baseline comparison."""
+
+import contextlib
+import json
+import os
+import platform
+import shutil
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..core.config import CKCConfig
+from ..core.metadata import MetadataManager
+from ..core.metadata_index import MetadataIndex
+from ..core.tracing import trace_span
+from ..sync.obsidian import ObsidianVaultManager
+from .vault_generator import GeneratedVault, VaultGenerator
+
+BENCHMARKS_DIR_NAME = "benchmarks"
+BASELINE_FILE_NAME = "baseline.json"
+
+# Bump when benchmark definitions change so old baselines are not compared
+BENCHMARK_FORMAT_VERSION = 1
+
+# Relative slowdown per item that counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Timings shorter than this are too noisy to flag
+MIN_COMPARABLE_SECONDS = 0.05
+
+# Classification with YAKE is costly, so it runs on a sample of notes
+DEFAULT_CLASSIFY_SAMPLE = 500
+
+SEARCH_QUERIES = ["python retries", "デプロイ テスト", "prompt errors", "cache"]
+SEARCH_FILTERS: list[dict[str, str | None]] = [
+    {"tech": "python"},
+    {"status": "production", "domain": "web-dev"},
+    {"type": "prompt", "confidence": "high"},
+]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark."""
+
+    name: str
+    items: int
+    seconds: float
+
+    @property
+    def ms_per_item(self) -> float:
+        """Average time per processed item in milliseconds."""
+        return self.seconds * 1000 / self.items if self.items else 0.0
+
+
+@dataclass
+class Regression:
+    """A benchmark that got slower than its baseline."""
+
+    name: str
+    baseline_seconds: float
+    seconds: float
+
+    @property
+    def slowdown(self) -> float:
+        """Relative slowdown, e.g. 0.3 for 30% slower."""
+        return self.seconds / self.baseline_seconds - 1
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of one suite run along with the environment it ran in."""
+
+    notes: int
+    seed: int
+    results: list[BenchmarkResult] = field(default_factory=list)
+    created: str = field(default_factory=lambda: datetime.now().isoformat())
+    environment: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON storage."""
+        return {
+            "version": BENCHMARK_FORMAT_VERSION,
+            "notes": self.notes,
+            "seed": self.seed,
+            "created": self.created,
+            "environment": self.environment,
+            "results": [
+                {**asdict(result), "ms_per_item": round(result.ms_per_item, 4)}
+                for result in self.results
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkRun":
+        """Deserialize a stored run.
+
+        Raises:
+            ValueError: If the data was written by another format version
+        """
+        if data.get("version") != BENCHMARK_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported benchmark format version: {data.get('version')}"
+            )
+        return cls(
+            notes=int(data["notes"]),
+            seed=int(data["seed"]),
+            created=str(data.get("created", "")),
+            environment=dict(data.get("environment", {})),
+            results=[
+                BenchmarkResult(str(r["name"]), int(r["items"]), float(r["seconds"]))
+                for r in data.get("results", [])
+            ],
+        )
+
+    def save(self, path: Path) -> Path:
+        """Write the run as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            The written path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkRun":
+        """Read a run written by :meth:`save`."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def result(self, name: str) -> BenchmarkResult | None:
+        """The result of a benchmark by name."""
+        return next((r for r in self.results if r.name == name), None)
+
+    def is_comparable(self, other: "BenchmarkRun") -> bool:
+        """Whether both runs used the same generated vault."""
+        return (self.notes, self.seed) == (other.notes, other.seed)
+
+
+def find_regressions(
+    run: BenchmarkRun,
+    baseline: BenchmarkRun,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Regression]:
+    """Compare a run against a baseline recorded on the same vault.
+
+    Costs such as a search query grow with the vault rather than with the
+    benchmark's item count, so only runs over the same number of notes and
+    seed are comparable. Benchmarks are compared by time per item, which
+    covers differing classification samples, and only when both timings
+    are long enough to be meaningful.
+
+    Args:
+        run: New results
+        baseline: Reference results
+        tolerance: Allowed relative slowdown before a benchmark is flagged
+
+    Returns:
+        Benchmarks slower than the baseline by more than the tolerance
+
+    Raises:
+        ValueError: If the baseline was recorded on another vault
+    """
+    if not run.is_comparable(baseline):
+        raise ValueError(
+            f"Baseline was recorded on {baseline.notes} notes (seed "
+            f"{baseline.seed}), this run used {run.notes} notes (seed {run.seed})"
+        )
+
+    regressions = []
+    for result in run.results:
+        reference = baseline.result(result.name)
+        if reference is None or not reference.items or not result.items:
+            continue
+        if max(result.seconds, reference.seconds) < MIN_COMPARABLE_SECONDS:
+            continue
+
+        # Scale the baseline to this run's item count
+        expected = reference.seconds * result.items / reference.items
+        if result.seconds > expected * (1 + tolerance):
+            regressions.append(Regression(result.name, expected, result.seconds))
+    return regressions
+
+
+class BenchmarkSuite:
+    """Times extraction, classification, sync, search and analytics.
+
+    A synthetic vault is generated in the work directory and every
+    benchmark runs against it in order, since sync produces the vault that
+    search and analytics read. Per-file console output is silenced while
+    timing.
+    """
+
+    BENCHMARKS = (
+        "extract",
+        "classify",
+        "sync.cold",
+        "sync.incremental",
+        "search.index",
+        "search.query",
+        "analytics",
+    )
+
+    def __init__(
+        self,
+        workdir: Path,
+        notes: int,
+        seed: int = 0,
+        classify_sample: int = DEFAULT_CLASSIFY_SAMPLE,
+    ) -> None:
+        """Initialize benchmark suite.
+
+        Args:
+            workdir: Directory for the generated vault and sync output; the
+                ``source`` and ``vault`` directories from an earlier run are
+                replaced, so cold timings never start from its manifest or index
+            notes: Number of notes in the generated vault
+            seed: Seed for the vault generator
+            classify_sample: Maximum number of notes to classify
+        """
+        self.workdir = workdir
+        self.notes = notes
+        self.seed = seed
+        self.classify_sample = classify_sample
+        self.vault: GeneratedVault | None = None
+        self.vault_path = workdir / "vault"
+
+    def run(self, only: Sequence[str] | None = None) -> BenchmarkRun:
+        """Generate the vault and run the benchmarks.
+
+        Args:
+            only: Names of benchmarks to record (all by default); sync still
+                runs when a later benchmark needs its output
+
+        Returns:
+            Results of the recorded benchmarks
+        """
+        unknown = set(only or []) - set(self.BENCHMARKS)
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+        run = BenchmarkRun(self.notes, self.seed, environment=_environment())
+        for stale in [self.workdir / "source", self.vault_path]:
+            shutil.rmtree(stale, ignore_errors=True)
+        self.vault = VaultGenerator(self.seed).generate(
+            self.workdir / "source", self.notes
+        )
+
+        steps: list[tuple[str, Callable[[], int]]] = [
+            ("extract", self._extract),
+            ("classify", self._classify),
+            ("sync.cold", self._sync),
+            ("sync.incremental", self._sync),
+            ("search.index", self._index),
+            ("search.query", self._query),
+            ("analytics", self._analytics),
+        ]
+        needs_vault = {"sync.incremental", "search.index", "search.query", "analytics"}
+        wanted = set(only or self.BENCHMARKS)
+        for name, step in steps:
+            prepares_vault = name == "sync.cold" and wanted & needs_vault
+            prepares_index = name == "search.index" and "search.query" in wanted
+            if name not in wanted and not prepares_vault and not prepares_index:
+                continue
+
+            with _quiet(), trace_span(f"benchmark.{name}"):
+                start = time.perf_counter()
+                items = step()
+                seconds = time.perf_counter() - start
+            if name in wanted:
+                run.results.append(BenchmarkResult(name, items, seconds))
+        return run
+
+    @property
+    def _notes(self) -> list[Path]:
+        """Paths of the generated notes."""
+        if self.vault is None:
+            raise RuntimeError("Vault has not been generated")
+        return self.vault.notes
+
+    def _extract(self) -> int:
+        """Extract metadata for every note."""
+        MetadataManager().extract_metadata_bulk(self._notes)
+        return len(self._notes)
+
+    def _classify(self) -> int:
+        """Classify a sample of notes."""
+        from ..ai.keyword_cache import KeywordCache
+        from ..ai.smart_classifier import SmartContentClassifier
+
+        classifier = SmartContentClassifier()
+        if classifier.yake_extractor is not None:
+            # Time extraction itself, not hits in the user's keyword cache
+            classifier.yake_extractor.keyword_cache = KeywordCache(None)
+        sample = self._notes[: self.classify_sample]
+        for path in sample:
+            classifier.classify_content(path.read_text(encoding="utf-8"), str(path))
+        return len(sample)
+
+    def _sync(self) -> int:
+        """Sync the generated notes into the vault."""
+        if self.vault is None:
+            raise RuntimeError("Vault has not been generated")
+        manager = ObsidianVaultManager(self.vault_path, MetadataManager())
+        manager.sync_directory(self.vault.source_dir)
+        return len(self._notes)
+
+    def _index(self) -> int:
+        """Build the metadata index of the synced vault."""
+        with self._metadata_index() as index:
+            return index.refresh(self.vault_path)
+
+    def _query(self) -> int:
+        """Run ranked and filtered searches against the index."""
+        with self._metadata_index() as index:
+            for query in SEARCH_QUERIES:
+                index.search_text(self.vault_path, query, limit=20)
+            for filters in SEARCH_FILTERS:
+                index.search(self.vault_path, filters, limit=20)
+        return len(SEARCH_QUERIES) + len(SEARCH_FILTERS)
+
+    def _analytics(self) -> int:
+        """Generate the comprehensive analytics report."""
+        from ..analytics.knowledge_analytics import KnowledgeAnalytics
+
+        config = CKCConfig(project_root=self.workdir)
+        KnowledgeAnalytics(self.vault_path, config).generate_comprehensive_report()
+        return len(self._notes)
+
+    @contextlib.contextmanager
+    def _metadata_index(self) -> Iterator[MetadataIndex]:
+        """Open the vault's persistent metadata index."""
+        index = MetadataIndex.for_directory(self.vault_path, MetadataManager())
+        try:
+            yield index
+        finally:
+            index.close()
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    """Silence per-file console output while timing."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _environment() -> dict[str, Any]:
+    """Facts about the machine that affect timings."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
@@ -0,0 +1,230 @@
+"""Deterministic generator of realistic synthetic knowledge vaults."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Named vault sizes used by the benchmark suite
+VAULT_SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+TECH_TAGS = [
+    "python",
+    "javascript",
+    "typescript",
+    "rust",
+    "go",
+    "docker",
+    "kubernetes",
+    "react",
+    "fastapi",
+    "postgresql",
+]
+DOMAIN_TAGS = [
+    "web-dev",
+    "data-science",
+    "machine-learning",
+    "devops",
+    "security",
+    "mobile-dev",
+    "testing",
+]
+TYPES = ["prompt", "code", "concept", "resource"]
+STATUSES = ["draft", "tested", "production", "deprecated"]
+COMPLEXITIES = ["beginner", "intermediate", "advanced", "expert"]
+CONFIDENCES = ["low", "medium", "high"]
+PROJECTS = ["atlas", "beacon", "catalyst", "delta", "ember"]
+AREAS = ["prompts", "snippets", "notes", "research", "logs", "archive"]
+
+ENGLISH_SENTENCES = [
+    "This note explains how the {tech} service handles retries and timeouts.",
+    "We compared several prompt variants and kept the one with fewer errors.",
+    "The deployment pipeline builds a container image and runs the test suite.",
+    "Caching the parsed configuration removed most of the startup latency.",
+    "Use structured logging so traces can be correlated across services.",
+    "The migration script must be idempotent because it may run twice.",
+    "Profiling showed that serialization dominated the request time.",
+    "Keep prompts short and include one worked example for the model.",
+    "Database queries were batched to avoid one round trip per record.",
+    "The {tech} client library needs an explicit connection pool size.",
+]
+JAPANESE_SENTENCES = [
+    "このノートでは{tech}のエラー処理とリトライの方針をまとめます。",
+    "プロンプトを短くすると応答の品質が安定しました。",
+    "デプロイ前に必ずテストスイートを実行してください。",
+    "設定ファイルの読み込みをキャッシュして起動時間を短縮しました。",
+    "データベースへの問い合わせはまとめて実行すると効率的です。",
+    "ログには構造化された形式を使い、調査を容易にします。",
+    "この手順は二回実行されても安全であるように設計されています。",
+    "性能測定の結果、シリアライズ処理が最も時間を要していました。",
+]
+CODE_BLOCKS = {
+    "python": (
+        "def fetch_{n}(client, key):\n"
+        "    for attempt in range(3):\n"
+        "        try:\n"
+        "            return client.get(key)\n"
+        "        except TimeoutError:\n"
+        "            continue\n"
+        "    return None\n"
+    ),
+    "javascript": (
+        "export async function load{n}(url) {{\n"
+        "  const response = await fetch(url);\n"
+        "  return response.json();\n"
+        "}}\n"
+    ),
+    "bash": "docker build -t app-{n} .\ndocker run --rm app-{n} pytest -q\n",
+    "sql": "SELECT id, title FROM notes WHERE updated > NOW() - INTERVAL '{n} days';\n",
+}
+
+
+@dataclass
+class GeneratedVault:
+    """Layout of a generated vault."""
+
+    root: Path
+    source_dir: Path
+    notes: list[Path] = field(default_factory=list)
+    japanese_notes: int = 0
+    notes_with_code: int = 0
+    notes_without_frontmatter: int = 0
+
+
+class VaultGenerator:
+    """Builds vaults of synthetic notes that resemble real CKC content.
+
+    Notes are spread over nested directories under ``.claude/`` and mix
+    English and Japanese prose, fenced code blocks and several frontmatter
+    shapes: full tag-centered metadata, minimal metadata, legacy ``tags``
+    lists and no frontmatter at all. The same seed always produces the same
+    vault, so benchmark runs are comparable.
+    """
+
+    def __init__(
+        self, seed: int = 0, japanese_share: float = 0.3, code_share: float = 0.4
+    ) -> None:
+        """Initialize vault generator.
+
+        Args:
+            seed: Random seed; equal seeds give identical vaults
+            japanese_share: Fraction of notes written mostly in Japanese
+            code_share: Fraction of notes with fenced code blocks
+        """
+        self.seed = seed
+        self.japanese_share = japanese_share
+        self.code_share = code_share
+
+    def generate(self, root: Path, notes: int) -> GeneratedVault:
+        """Write a vault of synthetic notes.
+
+        Args:
+            root: Directory to create the vault in
+            notes: Number of notes to write
+
+        Returns:
+            Description of the generated vault
+        """
+        rng = random.Random(self.seed)
+        source_dir = root / ".claude"
+        vault = GeneratedVault(root=root, source_dir=source_dir)
+
+        for number in range(notes):
+            directory = source_dir / self._directory(rng, number)
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"note_{number:06d}.md"
+
+            japanese = rng.random() < self.japanese_share
+            with_code = rng.random() < self.code_share
+            frontmatter = self._frontmatter(rng, number)
+            body = self._body(rng, number, japanese, with_code)
+            path.write_text(frontmatter + body, encoding="utf-8")
+
+            vault.notes.append(path)
+            vault.japanese_notes += japanese
+            vault.notes_with_code += with_code
+            vault.notes_without_frontmatter += not frontmatter
+
+        return vault
+
+    def _directory(self, rng: random.Random, number: int) -> Path:
+        """Nested directory for a note, between one and three levels deep."""
+        parts = [rng.choice(AREAS)]
+        depth = rng.choice([0, 1, 1, 2])
+        for level in range(depth):
+            parts.append(f"group_{level}_{rng.randrange(8)}")
+        # Keep directories to a few hundred notes even in large vaults
+        parts.append(f"batch_{number // 500:03d}")
+        return Path(*parts)
+
+    def _frontmatter(self, rng: random.Random, number: int) -> str:
+        """One of several frontmatter shapes, or none."""
+        created = datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(525_600))
+        updated = created + timedelta(days=rng.randrange(90))
+        shape = rng.random()
+
+        if shape < 0.1:
+            return ""
+        if shape < 0.25:
+            # Legacy notes with only a flat tag list
+            tags = rng.sample(TECH_TAGS + DOMAIN_TAGS, 3)
+            return (
+                "---\n"
+                f'title: "Legacy note {number}"\n'
+                f"tags: [{', '.join(tags)}]\n"
+                f'created: "{created.isoformat()}"\n'
+                "---\n\n"
+            )
+        if shape < 0.45:
+            return f'---\ntitle: "Quick note {number}"\nstatus: draft\n---\n\n'
+
+        lines = [
+            "---",
+            f'title: "Knowledge note {number}"',
+            f"type: {rng.choice(TYPES)}",
+            f"status: {rng.choice(STATUSES)}",
+            f"tech: [{', '.join(rng.sample(TECH_TAGS, rng.randint(1, 3)))}]",
+            f"domain: [{', '.join(rng.sample(DOMAIN_TAGS, rng.randint(1, 2)))}]",
+            f"projects: [{rng.choice(PROJECTS)}]",
+            f"complexity: {rng.choice(COMPLEXITIES)}",
+            f"confidence: {rng.choice(CONFIDENCES)}",
+            f'created: "{created.isoformat()}"',
+            f'updated: "{updated.isoformat()}"',
+        ]
+        if rng.random() < 0.5:
+            lines.append(f"success_rate: {rng.randint(40, 100)}")
+        if rng.random() < 0.3:
+            lines.append("claude_model: [sonnet, opus]")
+        lines += ["---", "", ""]
+        return "\n".join(lines)
+
+    def _body(
+        self, rng: random.Random, number: int, japanese: bool, with_code: bool
+    ) -> str:
+        """Markdown body with headings, prose and optional code."""
+        tech = rng.choice(TECH_TAGS)
+        sentences = JAPANESE_SENTENCES if japanese else ENGLISH_SENTENCES
+        heading = f"ノート {number}" if japanese else f"Note {number}"
+        parts = [f"# {heading}\n"]
+
+        for section in range(rng.randint(1, 4)):
+            parts.append(
+                f"\n## {'セクション' if japanese else 'Section'} {section}\n\n"
+            )
+            count = rng.randint(2, 6)
+            parts.append(
+                " ".join(rng.choice(sentences).format(tech=tech) for _ in range(count))
+            )
+            parts.append("\n")
+            if japanese and rng.random() < 0.3:
+                # Mixed-language notes are common
+                parts.append(rng.choice(ENGLISH_SENTENCES).format(tech=tech) + "\n")
+
+        if with_code:
+            language = rng.choice(list(CODE_BLOCKS))
+            code = CODE_BLOCKS[language].format(n=number)
+            parts.append(f"\n```{language}\n{code}```\n")
+
+        if rng.random() < 0.2:
+            parts.append(f"\nSee also [[note_{rng.randrange(max(number, 1)):06d}]].\n")
+        return "".join(parts)
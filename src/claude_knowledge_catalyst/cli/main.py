@@ -1,9 +1,10 @@
 """Modern CLI interface for Claude Knowledge Catalyst using Typer."""
 
 import shutil
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
@@ -11,18 +12,20 @@ from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 from .. import __version__
-from ..ai.smart_classifier import SmartContentClassifier
 from ..core.config import CKCConfig, SyncTarget, load_config
+from ..core.frontmatter_reader import read_frontmatter_text
 from ..core.metadata import KnowledgeMetadata, MetadataManager
-from ..core.watcher import KnowledgeWatcher
-from ..obsidian.query_builder import ObsidianQueryBuilder, PredefinedQueries
+from ..core.metadata_index import MetadataIndex
+from ..core.text_tokenizer import tokenize
+from ..core.tracing import start_tracing, stop_tracing, trace_span
 from ..sync.obsidian import ObsidianVaultManager
-from .interactive import (
-    InteractiveTagManager,
-    interactive_search_session,
-    quick_tag_wizard,
-)
-from .smart_sync import migrate_to_tag_centered_cli, smart_sync_command
+from ..sync.pipeline import MultiTargetSyncPipeline
+
+# Classification (YAKE, langdetect), file watching (watchdog), query building,
+# interactive tools and smart sync are imported inside the commands that use
+# them, so `ckc --version`, `ckc status` and other common commands start fast
+if TYPE_CHECKING:
+    from ..ai.smart_classifier import SmartContentClassifier
 
 
 def version_callback(value: bool) -> None:
@@ -52,6 +55,7 @@ console = Console()
 # Add global version option
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     version: bool = typer.Option(
         False,
         "--version",
@@ -60,14 +64,39 @@ def main_callback(
         is_eager=True,
         help="Show version information",
     ),
+    trace: str | None = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome/Perfetto trace of the command to this file",
+    ),
 ) -> None:
     """Claude Knowledge Catalyst CLI."""
-    pass
+    if trace is not None:
+        _trace_command(ctx, Path(trace))
+
+
+def _trace_command(ctx: typer.Context, trace_path: Path) -> None:
+    """Trace the invoked command and export its spans when it finishes."""
+    tracer = start_tracing()
+    root = ExitStack()
+    root.enter_context(trace_span(f"cli.{ctx.invoked_subcommand}"))
+
+    def finish() -> None:
+        root.close()
+        stop_tracing()
+        try:
+            tracer.export_chrome_trace(trace_path)
+            console.print(f"[dim]Trace written to {trace_path}[/dim]")
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not write trace: {e}[/yellow]")
+
+    ctx.call_on_close(finish)
 
 
 # Global state
 _config: CKCConfig | None = None
 _metadata_manager: MetadataManager | None = None
+_metadata_indexes: dict[Path, MetadataIndex] = {}
 
 
 def get_config(config_path: Path | None = None) -> CKCConfig:
@@ -94,6 +123,41 @@ def get_metadata_manager() -> MetadataManager:
     return _metadata_manager
 
 
+def get_metadata_index(root: Path) -> MetadataIndex:
+    """Get the persistent metadata index stored under a directory."""
+    key = Path(root)
+    if key not in _metadata_indexes:
+        _metadata_indexes[key] = MetadataIndex.for_directory(
+            key, get_metadata_manager()
+        )
+    return _metadata_indexes[key]
+
+
+def create_sync_pipeline(
+    sync_targets: list[SyncTarget], metadata_manager: MetadataManager
+) -> MultiTargetSyncPipeline:
+    """Create a pipeline syncing to every given target at once."""
+    return MultiTargetSyncPipeline(
+        {
+            target.name: ObsidianVaultManager(target.path, metadata_manager)
+            for target in sync_targets
+        },
+        metadata_manager,
+    )
+
+
+def _is_knowledge_file(md_file: Path) -> bool:
+    """Check if a markdown file holds knowledge content (not README/hidden)."""
+    return md_file.name != "README.md" and not md_file.name.startswith(".")
+
+
+def _scan_knowledge_files(root: Path) -> list[tuple[Path, KnowledgeMetadata]]:
+    """Collect (path, metadata) for knowledge files under root via the index."""
+    return get_metadata_index(root).scan(
+        root, skip=lambda md_file: not _is_knowledge_file(md_file)
+    )
+
+
 @app.command()
 def init(
     force: bool = typer.Option(
@@ -254,34 +318,37 @@ def sync(
 
     console.print(f"[blue]Syncing from: {claude_dir}[/blue]")
 
-    # Sync each target
+    # Parse each source once and write to all targets concurrently
+    pipeline = create_sync_pipeline(targets_to_sync, metadata_manager)
+    target_results = pipeline.sync_directory(claude_dir, project)
+
     total_synced = 0
     for sync_target in targets_to_sync:
-        console.print(f"\n[yellow]Syncing to {sync_target.name}...[/yellow]")
-
-        try:
-            # Use pure tag-centered vault manager
-            vault_manager = ObsidianVaultManager(sync_target.path, metadata_manager)
-            results = vault_manager.sync_directory(claude_dir, project)
-
-            # Show results
-            success_count = sum(1 for success in results.values() if success)
-            total_count = len(results)
-            total_synced += success_count
+        console.print(f"\n[yellow]Synced to {sync_target.name}[/yellow]")
+        target_result = target_results[sync_target.name]
 
+        if target_result.error is not None:
             console.print(
-                f"[green]✓[/green] Synced {success_count}/{total_count} files"
+                f"[red]✗[/red] Error syncing to {sync_target.name}: "
+                f"{target_result.error}"
             )
+            continue
 
-            # Show failed files
-            failed_files = [path for path, success in results.items() if not success]
-            if failed_files:
-                console.print("[red]Failed files:[/red]")
-                for file_path in failed_files:
-                    console.print(f"  - {file_path}")
+        # Show results
+        success_count = target_result.success_count
+        total_synced += success_count
+        summary = target_result.summary
+        console.print(
+            f"[green]✓[/green] Synced {success_count}/{len(target_result.results)} "
+            f"files ({summary.updated} updated, {summary.skipped} unchanged, "
+            f"{summary.removed} removed)"
+        )
 
-        except Exception as e:
-            console.print(f"[red]✗[/red] Error syncing to {sync_target.name}: {e}")
+        # Show failed files
+        if target_result.failed_files:
+            console.print("[red]Failed files:[/red]")
+            for file_path in target_result.failed_files:
+                console.print(f"  - {file_path}")
 
     if total_synced > 0:
         console.print(f"\n[green]🎉 Successfully synced {total_synced} files[/green]")
@@ -300,23 +367,41 @@ def watch(
         console.print("Enable with: auto_sync: true in ckc_config.yaml")
         raise typer.Exit(1)
 
-    # Create sync callback
-    def sync_callback(event_type: str, file_path: Path) -> None:
+    # Create sync callback for debounced batches of changes
+    def sync_callback(events: list[tuple[str, Path]]) -> None:
         """Callback for file changes."""
-        console.print(f"[dim]File {event_type}: {file_path}[/dim]")
+        for event_type, file_path in events:
+            console.print(f"[dim]File {event_type}: {file_path}[/dim]")
 
-        # Sync to enabled targets
-        for sync_target in config.get_enabled_sync_targets():
-            try:
-                vault_manager = ObsidianVaultManager(sync_target.path, metadata_manager)
-                project_name = config.project_name or None
-                vault_manager.sync_file(file_path, project_name)
-                console.print(f"[green]✓[/green] Synced to {sync_target.name}")
-            except Exception as e:
-                console.print(f"[red]✗[/red] Sync error for {sync_target.name}: {e}")
+        # Deleted files have nothing left to sync
+        file_paths = list(
+            dict.fromkeys(file_path for _, file_path in events if file_path.exists())
+        )
+        if not file_paths:
+            return
+
+        # Sync to enabled targets, parsing each file only once
+        pipeline = create_sync_pipeline(
+            config.get_enabled_sync_targets(), metadata_manager
+        )
+        project_name = config.project_name or None
+        for name, target_result in pipeline.sync_files(
+            file_paths, project_name
+        ).items():
+            if target_result.error is None and not target_result.failed_files:
+                console.print(
+                    f"[green]✓[/green] Synced {len(file_paths)} file(s) to {name}"
+                )
+            else:
+                error = target_result.error or ", ".join(target_result.failed_files)
+                console.print(f"[red]✗[/red] Sync error for {name}: {error}")
+
+    from ..core.watcher import KnowledgeWatcher
 
     # Create watcher
-    watcher = KnowledgeWatcher(config.watch, metadata_manager, sync_callback)
+    watcher = KnowledgeWatcher(
+        config.watch, metadata_manager, batch_sync_callback=sync_callback
+    )
 
     # Process existing files first
     console.print("[blue]Processing existing files...[/blue]")
@@ -359,20 +444,14 @@ def _detect_migration_status(config: CKCConfig) -> dict[str, Any]:
             if md_file.is_file():
                 total_files += 1
                 try:
-                    content = md_file.read_text(encoding="utf-8")
                     # Check for frontmatter
-                    if content.startswith("---"):
-                        frontmatter_end = content.find("\n---\n", 3)
-                        if frontmatter_end > 0:
-                            frontmatter = content[3:frontmatter_end]
-                            # Check for legacy vs modern format
-                            if (
-                                "category:" in frontmatter
-                                or "subcategory:" in frontmatter
-                            ):
-                                legacy_count += 1
-                            elif "type:" in frontmatter:
-                                modern_count += 1
+                    frontmatter = read_frontmatter_text(md_file)
+                    if frontmatter is not None:
+                        # Check for legacy vs modern format
+                        if "category:" in frontmatter or "subcategory:" in frontmatter:
+                            legacy_count += 1
+                        elif "type:" in frontmatter:
+                            modern_count += 1
                 except Exception:
                     continue
 
@@ -468,7 +547,6 @@ def analyze(
     file_path: str = typer.Argument(..., help="Path to file to analyze"),
 ) -> None:
     """Analyze a knowledge file and show its metadata."""
-    metadata_manager = get_metadata_manager()
 
     path = Path(file_path)
     if not path.exists():
@@ -476,7 +554,8 @@ def analyze(
         raise typer.Exit(1)
 
     try:
-        metadata = metadata_manager.extract_metadata_from_file(path)
+        with trace_span("analyze.file", path=path):
+            metadata = get_metadata_index(get_config().project_root).get(path)
 
         console.print(f"[bold]Analysis of: {path}[/bold]\n")
 
@@ -555,14 +634,9 @@ def _list_projects(config: CKCConfig, metadata_manager: MetadataManager) -> None
     # Check sync targets for existing projects (minimal structure)
     for target in config.get_enabled_sync_targets():
         # In pure tag system, projects are tracked via metadata only
-        for md_file in target.path.rglob("*.md"):
-            if md_file.name != "README.md" and not md_file.name.startswith("."):
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    if metadata.projects:
-                        projects.update(metadata.projects)
-                except Exception:
-                    continue
+        for _md_file, metadata in _scan_knowledge_files(target.path):
+            if metadata.projects:
+                projects.update(metadata.projects)
 
     # Also check .claude directory for potential projects
     claude_dir = config.project_root / ".claude"
@@ -571,18 +645,6 @@ def _list_projects(config: CKCConfig, metadata_manager: MetadataManager) -> None
             if item.is_dir() and not item.name.startswith("."):
                 projects.add(item.name)
 
-    # Check for files that indicate project organization
-    for target in config.get_enabled_sync_targets():
-        # Look for project-tagged files throughout the vault
-        for md_file in target.path.rglob("*.md"):
-            if md_file.name != "README.md" and not md_file.name.startswith("."):
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    if metadata.projects:
-                        projects.update(metadata.projects)
-                except Exception:
-                    continue
-
     if not projects:
         console.print("[yellow]No projects found[/yellow]")
         console.print("\nProjects can be found by:")
@@ -600,29 +662,29 @@ def _list_project_files(
     config: CKCConfig, metadata_manager: MetadataManager, project_name: str
 ) -> None:
     """List all files for a specific project."""
-    files_found = []
+    files_found: dict[Path, KnowledgeMetadata | None] = {}
 
     # Search in tag-centered structure
     for target in config.get_enabled_sync_targets():
         # Search all files by metadata (no dedicated project directories)
 
         # 2. Search all files with matching project metadata
-        for md_file in target.path.rglob("*.md"):
-            if md_file.name != "README.md" and not md_file.name.startswith("."):
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    if project_name in metadata.projects:
-                        if md_file not in files_found:  # Avoid duplicates
-                            files_found.append(md_file)
-                except Exception:
-                    continue
+        for md_file, metadata in _scan_knowledge_files(target.path):
+            if project_name in metadata.projects:
+                files_found.setdefault(md_file, metadata)
 
     # Also check .claude directory
     claude_project_dir = config.project_root / ".claude" / project_name
     if claude_project_dir.exists():
-        for file_path in claude_project_dir.rglob("*.md"):
-            if not file_path.name.startswith("."):
-                files_found.append(file_path)
+        source_files = [
+            file_path
+            for file_path in claude_project_dir.rglob("*.md")
+            if not file_path.name.startswith(".")
+        ]
+        for file_path in source_files:
+            files_found[file_path] = None
+        source_index = get_metadata_index(config.project_root)
+        files_found.update(source_index.get_many(source_files))
 
     if not files_found:
         console.print(f"[yellow]No files found for project: {project_name}[/yellow]")
@@ -633,17 +695,15 @@ def _list_project_files(
         return
 
     console.print(f"[bold]Files in project '{project_name}':[/bold]\n")
-    for file_path in sorted(files_found):
-        try:
-            metadata = metadata_manager.extract_metadata_from_file(file_path)
-            location = (
-                "vault" if str(file_path).find("demo/shared_vault") != -1 else "source"
-            )
-            console.print(f"  📄 {metadata.title} ({metadata.type}) [{location}]")
-        except Exception:
-            location = (
-                "vault" if str(file_path).find("demo/shared_vault") != -1 else "source"
+    for file_path, file_metadata in sorted(files_found.items()):
+        location = (
+            "vault" if str(file_path).find("demo/shared_vault") != -1 else "source"
+        )
+        if file_metadata is not None:
+            console.print(
+                f"  📄 {file_metadata.title} ({file_metadata.type}) [{location}]"
             )
+        else:
             console.print(f"  📄 {file_path.name} [{location}]")
 
 
@@ -659,45 +719,39 @@ def _show_project_stats(
     # Search in tag-centered structure
     for target in config.get_enabled_sync_targets():
         # Search all files by metadata (no dedicated project directories)
-        for md_file in target.path.rglob("*.md"):
-            if md_file.name != "README.md" and not md_file.name.startswith("."):
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    if project_name in metadata.projects:
-                        files_found.append(metadata)
-                        locations["vault"] += 1
+        for _md_file, metadata in _scan_knowledge_files(target.path):
+            if project_name in metadata.projects:
+                files_found.append(metadata)
+                locations["vault"] += 1
 
-                        # Count types
-                        content_type = metadata.type
-                        categories[content_type] = categories.get(content_type, 0) + 1
+                # Count types
+                content_type = metadata.type
+                categories[content_type] = categories.get(content_type, 0) + 1
 
-                        # Count statuses
-                        statuses[metadata.status] = statuses.get(metadata.status, 0) + 1
-
-                except Exception:
-                    continue
+                # Count statuses
+                statuses[metadata.status] = statuses.get(metadata.status, 0) + 1
 
         # Files are already processed above in the tag-centered search
 
     # Also check .claude directory
     claude_project_dir = config.project_root / ".claude" / project_name
     if claude_project_dir.exists():
-        for file_path in claude_project_dir.rglob("*.md"):
-            if not file_path.name.startswith("."):
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(file_path)
-                    files_found.append(metadata)
-                    locations["source"] += 1
+        source_files = [
+            file_path
+            for file_path in claude_project_dir.rglob("*.md")
+            if not file_path.name.startswith(".")
+        ]
+        source_index = get_metadata_index(config.project_root)
+        for _file_path, metadata in source_index.get_many(source_files):
+            files_found.append(metadata)
+            locations["source"] += 1
 
-                    # Count types
-                    content_type = metadata.type
-                    categories[content_type] = categories.get(content_type, 0) + 1
+            # Count types
+            content_type = metadata.type
+            categories[content_type] = categories.get(content_type, 0) + 1
 
-                    # Count statuses
-                    statuses[metadata.status] = statuses.get(metadata.status, 0) + 1
-
-                except Exception:
-                    continue
+            # Count statuses
+            statuses[metadata.status] = statuses.get(metadata.status, 0) + 1
 
     if not files_found:
         console.print(f"[yellow]No files found for project: {project_name}[/yellow]")
@@ -774,6 +828,8 @@ def smart_sync(
                 return
             console.print("")
 
+    from .smart_sync import smart_sync_command
+
     smart_sync_command(
         auto_apply=auto_apply,
         dry_run=dry_run,
@@ -852,6 +908,8 @@ def migrate_legacy(
             console.print("Migration cancelled.")
             raise typer.Exit(0)
 
+    from .smart_sync import migrate_to_tag_centered_cli
+
     # Perform migration
     try:
         result = migrate_to_tag_centered_cli(
@@ -930,8 +988,9 @@ def search(
         ckc search --status production --domain web-dev --team frontend
         ckc search --min-success 80 --claude-feature code-generation
     """
+    from ..obsidian.query_builder import ObsidianQueryBuilder, QueryComparison
+
     config = get_config()
-    metadata_manager = get_metadata_manager()
 
     # Build query
     query_builder = ObsidianQueryBuilder()
@@ -953,8 +1012,6 @@ def search(
     if confidence:
         query_builder = query_builder.confidence(confidence)
     if min_success_rate:
-        from ..obsidian.query_builder import QueryComparison
-
         query_builder = query_builder.success_rate(
             min_success_rate, QueryComparison.GREATER_EQUAL
         )
@@ -978,56 +1035,81 @@ def search(
         console.print("```")
         return
 
-    # Search in vault files
-    results = []
-    for target in config.get_enabled_sync_targets():
-        for md_file in target.path.rglob("*.md"):
-            if md_file.name.startswith(".") or md_file.name == "README.md":
-                continue
+    # Search in vault files: each filter is a posting list in the index
+    filters = {
+        "type": content_type,
+        "status": status,
+        "tech": tech,
+        "domain": domain,
+        "team": team,
+        "projects": project,
+        "complexity": complexity,
+        "confidence": confidence,
+        "claude_model": claude_model,
+        "claude_feature": claude_feature,
+    }
 
-            try:
-                metadata = metadata_manager.extract_metadata_from_file(md_file)
-                if _matches_criteria(
-                    metadata,
-                    content_type,
-                    status,
-                    tech,
-                    domain,
-                    team,
-                    project,
-                    complexity,
-                    confidence,
-                    min_success_rate,
-                    claude_model,
-                    claude_feature,
+    def skip(md_file: Path) -> bool:
+        return not _is_knowledge_file(md_file)
+
+    # Free text is ranked by BM25 over title, tags and body; a query with no
+    # indexable terms falls back to matching titles and tags
+    ranked = bool(query and tokenize(query))
+    results: list[tuple[Path, KnowledgeMetadata, float]] = []
+    for target in config.get_enabled_sync_targets():
+        index = get_metadata_index(target.path)
+        index.refresh(target.path, skip=skip)
+        if ranked and query:
+            results.extend(
+                index.search_text(
+                    target.path,
                     query,
-                ):
-                    results.append((md_file, metadata))
-            except Exception:
-                continue
+                    filters,
+                    min_success_rate=min_success_rate,
+                    skip=skip,
+                    limit=limit,
+                )
+            )
+            continue
+
+        matches = index.search(
+            target.path,
+            filters,
+            min_success_rate=min_success_rate,
+            skip=skip,
+            predicate=(lambda metadata: _matches_query(metadata, query))
+            if query
+            else None,
+            limit=limit,
+        )
+        results.extend((path, metadata, 0.0) for path, metadata in matches)
 
-    # Sort by update date (newest first)
-    results.sort(key=lambda x: x[1].updated, reverse=True)
+    # Best match first, otherwise newest first
+    if ranked:
+        results.sort(key=lambda x: x[2], reverse=True)
+    else:
+        results.sort(key=lambda x: x[1].updated, reverse=True)
     results = results[:limit]
 
     if format_output == "json":
         import json
 
         json_results = []
-        for file_path, metadata in results:
-            json_results.append(
-                {
-                    "file": str(file_path),
-                    "title": metadata.title,
-                    "type": metadata.type,
-                    "status": metadata.status,
-                    "tech": metadata.tech,
-                    "domain": metadata.domain,
-                    "team": metadata.team,
-                    "projects": metadata.projects,
-                    "updated": metadata.updated.isoformat(),
-                }
-            )
+        for file_path, metadata, score in results:
+            json_result: dict[str, Any] = {
+                "file": str(file_path),
+                "title": metadata.title,
+                "type": metadata.type,
+                "status": metadata.status,
+                "tech": metadata.tech,
+                "domain": metadata.domain,
+                "team": metadata.team,
+                "projects": metadata.projects,
+                "updated": metadata.updated.isoformat(),
+            }
+            if ranked:
+                json_result["score"] = round(score, 4)
+            json_results.append(json_result)
         console.print(json.dumps(json_results, indent=2))
         return
 
@@ -1066,7 +1148,7 @@ def search(
     table.add_column("Domain", style="magenta")
     table.add_column("Updated", style="dim")
 
-    for _file_path, metadata in results:
+    for _file_path, metadata, _score in results:
         tech_str = ", ".join(metadata.tech[:2]) + (
             "..." if len(metadata.tech) > 2 else ""
         )
@@ -1090,55 +1172,11 @@ def search(
     console.print("\n[dim]💡 Use --format query to see the Obsidian search query[/dim]")
 
 
-def _matches_criteria(  # type: ignore
-    metadata,
-    content_type,
-    status,
-    tech,
-    domain,
-    team,
-    project,
-    complexity,
-    confidence,
-    min_success_rate,
-    claude_model,
-    claude_feature,
-    query,
-) -> bool:
-    """Check if metadata matches search criteria."""
-
-    if content_type and metadata.type != content_type:
-        return False
-    if status and metadata.status != status:
-        return False
-    if tech and tech not in metadata.tech:
-        return False
-    if domain and domain not in metadata.domain:
-        return False
-    if team and team not in metadata.team:
-        return False
-    if project and project not in metadata.projects:
-        return False
-    if complexity and metadata.complexity != complexity:
-        return False
-    if confidence and metadata.confidence != confidence:
-        return False
-    if min_success_rate and (
-        not metadata.success_rate or metadata.success_rate < min_success_rate
-    ):
-        return False
-    if claude_model and claude_model not in metadata.claude_model:
-        return False
-    if claude_feature and claude_feature not in metadata.claude_feature:
-        return False
-    if query:
-        # Check if any query terms match tags or title
-        query_terms = query.lower().split()
-        searchable_text = (metadata.title + " " + " ".join(metadata.tags)).lower()
-        if not any(term in searchable_text for term in query_terms):
-            return False
-
-    return True
+def _matches_query(metadata: KnowledgeMetadata, query: str) -> bool:
+    """Check if any query term matches the title or tags."""
+    query_terms = query.lower().split()
+    searchable_text = (metadata.title + " " + " ".join(metadata.tags)).lower()
+    return any(term in searchable_text for term in query_terms)
 
 
 @app.command()
@@ -1164,6 +1202,7 @@ def query(
         ckc query python
         ckc query successful-prompts
     """
+    from ..obsidian.query_builder import PredefinedQueries
 
     presets = {
         "high-quality": PredefinedQueries.high_quality_content(),
@@ -1265,14 +1304,8 @@ def tags(
         # Collect metadata from all files
         all_metadata = []
         for target in config.get_enabled_sync_targets():
-            for md_file in target.path.rglob("*.md"):
-                if md_file.name.startswith(".") or md_file.name == "README.md":
-                    continue
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    all_metadata.append(metadata.model_dump())
-                except Exception:
-                    continue
+            for _md_file, metadata in _scan_knowledge_files(target.path):
+                all_metadata.append(metadata.model_dump())
 
         if not all_metadata:
             console.print("[yellow]No files found for analysis[/yellow]")
@@ -1413,6 +1446,11 @@ def interactive(
         ckc interactive tag --file path/to/file.md
         ckc interactive wizard
     """
+    from .interactive import (
+        InteractiveTagManager,
+        interactive_search_session,
+        quick_tag_wizard,
+    )
 
     if action == "search":
         interactive_search_session()
@@ -1646,24 +1684,17 @@ def quick_commands(
 
         # Run the search
         config = get_config()
-        metadata_manager = get_metadata_manager()
 
         results = []
         for target in config.get_enabled_sync_targets():
-            for md_file in target.path.rglob("*.md"):
-                if md_file.name.startswith(".") or md_file.name == "README.md":
-                    continue
-                try:
-                    metadata = metadata_manager.extract_metadata_from_file(md_file)
-                    # Simple matching for quick search
-                    searchable = (
-                        f"{metadata.title} {' '.join(metadata.tech)} "
-                        f"{' '.join(metadata.domain)} {' '.join(metadata.tags)}"
-                    ).lower()
-                    if query.lower() in searchable:
-                        results.append((md_file, metadata))
-                except Exception:
-                    continue
+            for md_file, metadata in _scan_knowledge_files(target.path):
+                # Simple matching for quick search
+                searchable = (
+                    f"{metadata.title} {' '.join(metadata.tech)} "
+                    f"{' '.join(metadata.domain)} {' '.join(metadata.tags)}"
+                ).lower()
+                if query.lower() in searchable:
+                    results.append((md_file, metadata))
 
         if results:
             console.print(f"\n[green]Found {len(results)} results:[/green]")
@@ -1783,6 +1814,8 @@ def classify(
         ckc classify --auto-apply --min-confidence 0.8  # Auto-apply high confidence
         ckc classify --format json               # JSON output for automation
     """
+    from ..ai.smart_classifier import SmartContentClassifier
+
     get_config()
     metadata_manager = get_metadata_manager()
     classifier = SmartContentClassifier()
@@ -1826,7 +1859,7 @@ def classify(
 
 def _run_batch_classification(
     files: list[Path],
-    classifier: SmartContentClassifier,
+    classifier: "SmartContentClassifier",
     metadata_manager: MetadataManager,
     auto_apply: bool,
     min_confidence: float,
@@ -1925,7 +1958,7 @@ def _run_batch_classification(
 
 def _run_interactive_classification(
     files: list[Path],
-    classifier: SmartContentClassifier,
+    classifier: "SmartContentClassifier",
     metadata_manager: MetadataManager,
     auto_apply: bool,
     min_confidence: float,
@@ -2176,16 +2209,11 @@ def migrate(
         for md_file in full_path.rglob("*.md"):
             if md_file.is_file():
                 try:
-                    content = md_file.read_text(encoding="utf-8")
-                    if content.startswith("---"):
-                        frontmatter_end = content.find("\n---\n", 3)
-                        if frontmatter_end > 0:
-                            frontmatter = content[3:frontmatter_end]
-                            if (
-                                "category:" in frontmatter
-                                or "subcategory:" in frontmatter
-                            ):
-                                files_to_migrate.append(md_file)
+                    frontmatter = read_frontmatter_text(md_file)
+                    if frontmatter is not None and (
+                        "category:" in frontmatter or "subcategory:" in frontmatter
+                    ):
+                        files_to_migrate.append(md_file)
                 except Exception:
                     continue
 
@@ -2461,9 +2489,9 @@ Tags: git, version-control, workflow, best-practices
             try:
                 # Perform sync
                 metadata_manager = get_metadata_manager()
-                for target in config.get_enabled_sync_targets():
-                    vault_manager = ObsidianVaultManager(target.path, metadata_manager)
-                    vault_manager.sync_directory(claude_dir)
+                create_sync_pipeline(
+                    config.get_enabled_sync_targets(), metadata_manager
+                ).sync_directory(claude_dir)
                 console.print("[green]✅ Initial sync completed![/green]")
             except Exception as e:
                 console.print(f"[yellow]⚠️ Sync had issues: {e}[/yellow]")
@@ -2610,6 +2638,8 @@ def diagnose() -> None:
     console.print("\n[bold]6. AI Classification System[/bold]")
 
     try:
+        from ..ai.smart_classifier import SmartContentClassifier
+
         classifier = SmartContentClassifier()
         test_content = "import pandas as pd\nfrom fastapi import FastAPI"
         results = classifier.classify_content(test_content)
@@ -2663,6 +2693,204 @@ def diagnose() -> None:
     console.print("4. Use [bold]ckc watch[/bold] for automatic syncing")
 
 
+@app.command(
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True}
+)
+def profile(
+    command: list[str] = typer.Argument(  # noqa: B008
+        ..., help="CKC command to profile, e.g. sync or search python"
+    ),
+    top: int = typer.Option(25, "--top", help="Functions listed in the summary"),
+    memory: bool = typer.Option(
+        False, "--memory", help="Also trace memory allocations (slower)"
+    ),
+    output_dir: str | None = typer.Option(
+        None, "--output-dir", help="Directory for reports (default: .ckc/profiles)"
+    ),
+) -> None:
+    """Profile a CKC command and save reports for performance tickets."""
+    import click
+
+    from ..analytics.profiler import PROFILES_DIR_NAME, CommandProfiler
+
+    if command[0] == "profile":
+        console.print("[red]✗[/red] Cannot profile the profile command")
+        raise typer.Exit(1)
+
+    if output_dir is not None:
+        reports_dir = Path(output_dir)
+    else:
+        reports_dir = get_config().project_root / ".ckc" / PROFILES_DIR_NAME
+
+    cli_command = typer.main.get_command(app)
+
+    def run_command() -> int:
+        try:
+            # Without standalone mode, typer.Exit comes back as the return value
+            result = cli_command.main(command, prog_name="ckc", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            return 1
+        return result if isinstance(result, int) else 0
+
+    profiler = CommandProfiler(reports_dir, top_n=top, trace_memory=memory)
+    exit_code, report = profiler.run(" ".join(command), run_command)
+
+    console.print(f"\n[bold]Profile of:[/bold] ckc {report.label}")
+    console.print(f"Elapsed: {report.elapsed_seconds:.3f}s")
+    if report.peak_memory_bytes is not None:
+        peak_mib = report.peak_memory_bytes / (1024 * 1024)
+        console.print(f"Peak traced memory: {peak_mib:.1f} MiB")
+
+    table = Table(title="Hottest functions (own time)")
+    table.add_column("Function", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Own (s)", justify="right")
+    table.add_column("Cumulative (s)", justify="right", style="green")
+    for hot in report.hot_functions[: min(top, 10)]:
+        table.add_row(
+            hot.location,
+            str(hot.calls),
+            f"{hot.total_seconds:.3f}",
+            f"{hot.cumulative_seconds:.3f}",
+        )
+    console.print(table)
+
+    console.print(f"[dim]Stats: {report.stats_path}[/dim]")
+    console.print(f"[dim]Summary: {report.summary_path}[/dim]")
+    if exit_code:
+        raise typer.Exit(exit_code)
+
+
+@app.command()
+def benchmark(
+    notes: str = typer.Option(
+        "1k", "--notes", "-n", help="Vault size: 1k, 10k, 100k or a note count"
+    ),
+    only: str | None = typer.Option(
+        None, "--only", help="Comma-separated benchmarks to run (default: all)"
+    ),
+    seed: int = typer.Option(0, "--seed", help="Seed for the synthetic vault"),
+    classify_sample: int = typer.Option(
+        500, "--classify-sample", help="Notes classified by the classify benchmark"
+    ),
+    baseline: str | None = typer.Option(
+        None,
+        "--baseline",
+        help="Baseline JSON to compare with (default: .ckc/benchmarks/baseline.json)",
+    ),
+    update_baseline: bool = typer.Option(
+        False, "--update-baseline", help="Store this run as the new baseline"
+    ),
+    tolerance: float = typer.Option(
+        0.25, "--tolerance", help="Allowed slowdown per item before flagging"
+    ),
+    workdir: str | None = typer.Option(
+        None,
+        "--workdir",
+        help="Keep the generated vault in this directory (replaced on each run)",
+    ),
+) -> None:
+    """Benchmark CKC on a synthetic vault and check for regressions."""
+    import tempfile
+
+    from ..benchmarks import VAULT_SIZES, BenchmarkRun, BenchmarkSuite
+    from ..benchmarks.suite import (
+        BASELINE_FILE_NAME,
+        BENCHMARKS_DIR_NAME,
+        find_regressions,
+    )
+
+    note_count = VAULT_SIZES.get(notes.lower())
+    if note_count is None:
+        try:
+            note_count = int(notes)
+        except ValueError:
+            console.print(f"[red]✗[/red] Invalid vault size: {notes}")
+            raise typer.Exit(1) from None
+
+    results_dir = get_config().project_root / ".ckc" / BENCHMARKS_DIR_NAME
+    baseline_path = Path(baseline) if baseline else results_dir / BASELINE_FILE_NAME
+    selected = [name.strip() for name in only.split(",")] if only else None
+
+    console.print(f"[blue]Benchmarking on {note_count:,} synthetic notes...[/blue]")
+    with tempfile.TemporaryDirectory(prefix="ckc-bench-") as temp_dir:
+        suite = BenchmarkSuite(
+            Path(workdir) if workdir else Path(temp_dir),
+            note_count,
+            seed=seed,
+            classify_sample=classify_sample,
+        )
+        try:
+            run = suite.run(selected)
+        except ValueError as e:
+            console.print(f"[red]✗[/red] {e}")
+            raise typer.Exit(1) from e
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output_path = run.save(results_dir / f"{stamp}-{note_count}.json")
+
+    reference = None
+    if baseline_path.exists() and not update_baseline:
+        try:
+            reference = BenchmarkRun.load(baseline_path)
+        except (OSError, ValueError, KeyError) as e:
+            console.print(f"[yellow]Warning: Ignoring baseline: {e}[/yellow]")
+        if reference is not None and not run.is_comparable(reference):
+            console.print(
+                f"[yellow]Warning: Ignoring baseline recorded on "
+                f"{reference.notes:,} notes (seed {reference.seed}); "
+                f"compare runs of the same --notes and --seed[/yellow]"
+            )
+            reference = None
+    regressions = (
+        {r.name: r for r in find_regressions(run, reference, tolerance)}
+        if reference
+        else {}
+    )
+
+    table = Table(title=f"Benchmarks ({note_count:,} notes)")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("ms/item", justify="right")
+    table.add_column("vs baseline", justify="right")
+    for result in run.results:
+        comparison = "-"
+        previous = reference.result(result.name) if reference else None
+        if previous is not None and previous.ms_per_item:
+            change = result.ms_per_item / previous.ms_per_item - 1
+            style = "red" if result.name in regressions else "green"
+            comparison = f"[{style}]{change:+.0%}[/{style}]"
+        table.add_row(
+            result.name,
+            f"{result.items:,}",
+            f"{result.seconds:.3f}",
+            f"{result.ms_per_item:.3f}",
+            comparison,
+        )
+    console.print(table)
+    console.print(f"[dim]Results: {output_path}[/dim]")
+
+    if update_baseline:
+        run.save(baseline_path)
+        console.print(f"[green]✓[/green] Baseline updated: {baseline_path}")
+    elif not baseline_path.exists():
+        console.print(
+            "[dim]No baseline to compare with; store one with --update-baseline[/dim]"
+        )
+
+    if regressions:
+        for regression in regressions.values():
+            console.print(
+                f"[red]✗ Regression:[/red] {regression.name} is "
+                f"{regression.slowdown:.0%} slower than the baseline"
+            )
+        raise typer.Exit(1)
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     app()
@@ -1,7 +1,6 @@
 """Smart sync functionality for CKC CLI."""
 
 import glob
-import re
 import shutil
 import subprocess
 from datetime import datetime
@@ -16,6 +15,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..core.config import CKCConfig
+from ..core.frontmatter_reader import has_frontmatter
 from ..core.metadata import KnowledgeMetadata, MetadataManager
 from ..sync.hybrid_manager import KnowledgeClassifier
 
@@ -39,19 +39,6 @@ def scan_metadata_status(directory: str = ".claude") -> tuple[list[Path], list[P
     return has_metadata, needs_classification
 
 
-def has_frontmatter(file_path: Path) -> bool:
-    """フロントマターの存在確認"""
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # YAML frontmatter pattern
-        pattern = r"^---\s*\n.*?\n---\s*\n"
-        return bool(re.match(pattern, content, re.DOTALL))
-    except Exception:
-        return False
-
-
 def classify_file_intelligent(
     file_path: Path, config: CKCConfig, metadata_manager: MetadataManager
 ) -> dict[str, Any]:
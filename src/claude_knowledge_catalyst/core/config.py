@@ -73,6 +73,11 @@ class WatchConfig(BaseModel):
     debounce_seconds: float = Field(
         default=1.0, description="Debounce time for file change events"
     )
+    debounce_cache_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum number of paths tracked for debouncing",
+    )
     # CLAUDE.md sync configuration
     include_claude_md: bool = Field(
         default=False, description="Include CLAUDE.md files in synchronization"
@@ -88,6 +93,24 @@ class WatchConfig(BaseModel):
             "(e.g., '# secrets', '# private')"
         ),
     )
+    metadata_refresh: str = Field(
+        default="on_change",
+        description=(
+            "When watched files get their frontmatter rewritten: 'on_change' "
+            "(only if the metadata changed) or 'always' (on every change)"
+        ),
+    )
+
+    @field_validator("metadata_refresh")
+    @classmethod
+    def validate_metadata_refresh(cls, v: str) -> str:
+        """Validate metadata refresh mode."""
+        valid_modes = ["on_change", "always"]
+        if v.lower() not in valid_modes:
+            raise ValueError(
+                f"Invalid metadata_refresh: {v}. Valid options: {valid_modes}"
+            )
+        return v.lower()
 
 
 class MigrationConfig(BaseModel):
@@ -0,0 +1,270 @@
+"""Coalescing, batching dispatcher for file system events."""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+FileEvent = tuple[str, Path]
+
+
+@dataclass
+class _PendingEvent:
+    """Latest state of a path waiting for its debounce window to close."""
+
+    event_type: str
+    path: Path
+    # Dispatched at the latest by this time, even if events keep arriving
+    deadline: float
+
+
+class CoalescingEventDispatcher:
+    """Queue that debounces events per path and hands them out in batches.
+
+    Events are recorded from the observer thread in constant time. Pending
+    paths are dispatched once no event has arrived for ``debounce_seconds``
+    (trailing edge), so the final state after a burst of saves is always
+    processed and a burst touching many files - such as ``git checkout`` -
+    becomes a single batch. A path that keeps changing is dispatched anyway
+    after ``max_wait_seconds``. Batches run on a small worker pool, and a
+    path is never processed by two workers at once; events arriving while it
+    is in flight wait for the next batch.
+
+    At most ``max_pending`` paths wait at a time: beyond that the oldest
+    pending paths are dispatched early instead of waiting for the burst to
+    settle, so debounce state stays bounded without losing any event.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[FileEvent]], None],
+        debounce_seconds: float,
+        max_workers: int = 2,
+        max_batch_size: int = 500,
+        max_wait_seconds: float | None = None,
+        max_pending: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize event dispatcher.
+
+        Args:
+            handler: Called on a worker thread with each batch of
+                (event_type, path) pairs
+            debounce_seconds: Quiet period required before a path is dispatched
+            max_workers: Worker threads running the handler
+            max_batch_size: Maximum number of paths per batch
+            max_wait_seconds: Upper bound on how long a continuously changing
+                path can be deferred (defaults to ten debounce periods)
+            max_pending: Maximum number of paths waiting for their debounce
+                window; older ones are dispatched early beyond this
+            clock: Monotonic time source
+        """
+        self.handler = handler
+        self.debounce_seconds = max(debounce_seconds, 0.0)
+        self.max_workers = max(max_workers, 1)
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait_seconds = (
+            max_wait_seconds
+            if max_wait_seconds is not None
+            else self.debounce_seconds * 10
+        )
+        self.max_pending = max(max_pending, 1)
+        self.clock = clock
+
+        self._pending: dict[str, _PendingEvent] = {}
+        self._quiet_at = 0.0
+        self._in_flight: set[str] = set()
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._scheduler: threading.Thread | None = None
+        self._stopping = False
+        self._active_batches = 0
+
+        self.events_received = 0
+        self.events_coalesced = 0
+        self.batches_dispatched = 0
+        self.events_dispatched = 0
+        self.handler_errors = 0
+        # Paths dispatched before their burst settled
+        self.deadline_dispatches = 0
+        self.capacity_dispatches = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the scheduler thread is active."""
+        return self._scheduler is not None and self._scheduler.is_alive()
+
+    def start(self) -> None:
+        """Start the scheduler thread and worker pool."""
+        with self._condition:
+            if self.is_running:
+                return
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ckc-watch"
+            )
+            self._scheduler = threading.Thread(
+                target=self._run, name="ckc-watch-scheduler", daemon=True
+            )
+            self._scheduler.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop dispatching.
+
+        Args:
+            flush: Dispatch events still waiting for their debounce window
+                before returning; otherwise they are discarded
+        """
+        with self._condition:
+            if not flush:
+                self._pending.clear()
+            self._stopping = True
+            self._condition.notify_all()
+
+        if self._scheduler is not None:
+            self._scheduler.join()
+            self._scheduler = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, event_type: str, path: Path) -> None:
+        """Record an event, merging it with any pending event for the path."""
+        key = str(path)
+        now = self.clock()
+
+        with self._condition:
+            self.events_received += 1
+            self._quiet_at = now + self.debounce_seconds
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = _PendingEvent(
+                    event_type, path, now + self.max_wait_seconds
+                )
+            else:
+                self.events_coalesced += 1
+                # A file created and then edited within one burst is still new
+                if not (pending.event_type == "created" and event_type == "modified"):
+                    pending.event_type = event_type
+                pending.path = path
+            self._condition.notify()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Dispatch every pending event now and wait until all are handled.
+
+        Without a running scheduler the events are handled on this thread.
+
+        Args:
+            timeout: Maximum seconds to wait for in-flight batches
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        if not self.is_running:
+            while True:
+                with self._condition:
+                    batch = self._take_batch(self.clock(), ready_only=False)
+                if not batch:
+                    return True
+                self._run_batch(batch)
+
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._condition:
+            self._quiet_at = self.clock()
+            self._condition.notify_all()
+
+            while self._pending or self._active_batches:
+                remaining = None if deadline is None else deadline - self.clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue statistics."""
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "in_flight": len(self._in_flight),
+                "events_received": self.events_received,
+                "events_coalesced": self.events_coalesced,
+                "batches_dispatched": self.batches_dispatched,
+                "events_dispatched": self.events_dispatched,
+                "handler_errors": self.handler_errors,
+                "deadline_dispatches": self.deadline_dispatches,
+                "capacity_dispatches": self.capacity_dispatches,
+            }
+
+    def _run(self) -> None:
+        """Scheduler loop: hand ready paths to the worker pool."""
+        with self._condition:
+            while True:
+                now = self.clock()
+                batch = self._take_batch(now, ready_only=not self._stopping)
+                if batch and self._executor is not None:
+                    self._active_batches += 1
+                    self._executor.submit(self._run_batch, batch, True)
+                    continue
+
+                if self._stopping and not self._pending and not self._in_flight:
+                    return
+
+                self._condition.wait(self._next_wakeup(now))
+
+    def _take_batch(self, now: float, ready_only: bool) -> list[FileEvent]:
+        """Remove and return up to one batch of dispatchable events."""
+        batch: list[FileEvent] = []
+        settled = not ready_only or now >= self._quiet_at
+        # Pending paths are in arrival order, so the oldest overflow first
+        for key, pending in list(self._pending.items()):
+            if len(batch) >= self.max_batch_size:
+                break
+            if key in self._in_flight:
+                continue
+            if not settled:
+                if now >= pending.deadline:
+                    self.deadline_dispatches += 1
+                elif len(self._pending) > self.max_pending:
+                    self.capacity_dispatches += 1
+                else:
+                    continue
+            del self._pending[key]
+            self._in_flight.add(key)
+            batch.append((pending.event_type, pending.path))
+        return batch
+
+    def _next_wakeup(self, now: float) -> float | None:
+        """Seconds until the next pending path becomes ready."""
+        deadlines = [
+            pending.deadline
+            for key, pending in self._pending.items()
+            if key not in self._in_flight
+        ]
+        if not deadlines:
+            return None
+        if len(self._pending) > self.max_pending:
+            return 0.0
+        return max(min(self._quiet_at, *deadlines) - now, 0.0)
+
+    def _run_batch(self, batch: list[FileEvent], scheduled: bool = False) -> None:
+        """Run the handler for one batch and release its paths."""
+        failed = False
+        try:
+            self.handler(batch)
+        except Exception as e:
+            failed = True
+            print(f"Error processing file events: {e}")
+        finally:
+            with self._condition:
+                self.batches_dispatched += 1
+                self.events_dispatched += len(batch)
+                self.handler_errors += failed
+                for _, path in batch:
+                    self._in_flight.discard(str(path))
+                if scheduled:
+                    self._active_batches -= 1
+                self._condition.notify_all()
@@ -0,0 +1,110 @@
+"""Bounded, time-expiring mapping for long-running watcher state."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ExpiringCache(MutableMapping[K, V], Generic[K, V]):
+    """Mapping whose entries expire after a TTL and whose size is capped.
+
+    Entries are kept in write order, so expired entries are always at the
+    front and are dropped in amortized constant time as the cache is used.
+    When the cache is full the least recently written entry is evicted;
+    without a size cap entries leave only by expiring or being removed.
+    Safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 10_000,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize expiring cache.
+
+        Args:
+            max_entries: Maximum number of entries kept, or None for no cap
+            ttl_seconds: Seconds after its last write that an entry expires
+            clock: Monotonic time source
+        """
+        self.max_entries = max(max_entries, 1) if max_entries is not None else None
+        self.ttl_seconds = max(ttl_seconds, 0.0)
+        self.clock = clock
+        self.expired_evictions = 0
+        self.capacity_evictions = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            self.purge_expired()
+            return self._data[key][1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (self.clock(), value)
+            self.purge_expired()
+            while self.max_entries is not None and len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.capacity_evictions += 1
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            self.purge_expired()
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.purge_expired()
+            return len(self._data)
+
+    def pop(self, key: K, *default: Any) -> Any:
+        """Remove a live entry and return its value."""
+        with self._lock:
+            self.purge_expired()
+            if key in self._data:
+                return self._data.pop(key)[1]
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            cutoff = self.clock() - self.ttl_seconds
+            dropped = 0
+            while self._data:
+                written_at, _ = next(iter(self._data.values()))
+                if written_at > cutoff:
+                    break
+                self._data.popitem(last=False)
+                dropped += 1
+            self.expired_evictions += dropped
+            return dropped
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and eviction counts."""
+        with self._lock:
+            self.purge_expired()
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "expired_evictions": self.expired_evictions,
+                "capacity_evictions": self.capacity_evictions,
+            }
@@ -0,0 +1,111 @@
+"""Frontmatter-only reader that stops at the closing delimiter.
+
+Scans that only need to know whether a note has frontmatter, or what its
+header says, read the leading ``---`` block and never touch the body, so
+their cost is bounded by header size rather than file size.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+FRONTMATTER_DELIMITER = b"---"
+# Headers larger than this are treated as unterminated
+MAX_FRONTMATTER_BYTES = 64 * 1024
+_BOM = b"\xef\xbb\xbf"
+
+
+def read_frontmatter_text(
+    file_path: Path, max_bytes: int = MAX_FRONTMATTER_BYTES
+) -> str | None:
+    """Read the raw YAML text of a file's frontmatter block.
+
+    Args:
+        file_path: Markdown file to read
+        max_bytes: Give up once this many header bytes have been read
+
+    Returns:
+        Text between the opening and closing ``---`` lines, or None when the
+        file has no complete frontmatter block
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the header is not valid UTF-8
+    """
+    with open(file_path, "rb") as f:
+        first_line = f.readline(max_bytes + 1)
+        if first_line.startswith(_BOM):
+            first_line = first_line[len(_BOM) :]
+        if first_line.rstrip() != FRONTMATTER_DELIMITER:
+            return None
+
+        lines: list[bytes] = []
+        consumed = len(first_line)
+        while consumed <= max_bytes:
+            line = f.readline(max_bytes + 1 - consumed)
+            if not line:
+                return None
+            if line.rstrip() == FRONTMATTER_DELIMITER:
+                return b"".join(lines).decode("utf-8")
+            lines.append(line)
+            consumed += len(line)
+    return None
+
+
+def has_frontmatter(file_path: Path) -> bool:
+    """Check whether a file starts with a complete frontmatter block.
+
+    Args:
+        file_path: Markdown file to check
+
+    Returns:
+        True if the file has frontmatter; False otherwise or if unreadable
+    """
+    try:
+        return read_frontmatter_text(file_path) is not None
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def read_frontmatter(file_path: Path) -> dict[str, Any] | None:
+    """Read and parse a file's frontmatter without reading its body.
+
+    Args:
+        file_path: Markdown file to read
+
+    Returns:
+        Parsed header mapping (empty if the block is empty or not a mapping),
+        or None when the file has no frontmatter
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the header is not valid UTF-8
+        yaml.YAMLError: If the header is not valid YAML
+    """
+    text = read_frontmatter_text(file_path)
+    if text is None:
+        return None
+
+    data = yaml.safe_load(text)
+    return data if isinstance(data, dict) else {}
+
+
+def strip_frontmatter(text: str) -> str:
+    """Remove a leading frontmatter block from already loaded text.
+
+    Args:
+        text: Full file content
+
+    Returns:
+        The body after the closing ``---`` line, or the text unchanged when
+        it has no complete frontmatter block
+    """
+    lines = text.lstrip("\ufeff").splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != "---":
+        return text
+
+    for index, line in enumerate(lines[1:], start=1):
+        if line.rstrip() == "---":
+            return "".join(lines[index + 1 :])
+    return text
@@ -0,0 +1,94 @@
+"""Single-pass multi-keyword matching for content inference."""
+
+from collections import deque
+from collections.abc import Hashable, Iterable
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton that finds every keyword in one pass.
+
+    Keywords are compiled once into a deterministic automaton, so scanning a
+    document costs one step per character regardless of how many keywords
+    (and labels) are registered. Each keyword maps to one or more labels and
+    :meth:`find_labels` returns the labels of all keywords occurring anywhere
+    in the text, including overlapping occurrences.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[tuple[str, Hashable]],
+        ignore_case: bool = True,
+    ) -> None:
+        """Compile keywords into an automaton.
+
+        Args:
+            keywords: (keyword, label) pairs; a keyword may carry several labels
+            ignore_case: Match case-insensitively (keywords and text lowercased)
+        """
+        self.ignore_case = ignore_case
+        self.keyword_count = 0
+
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[set[Hashable]] = [set()]
+
+        for keyword, label in keywords:
+            if not keyword:
+                continue
+            if ignore_case:
+                keyword = keyword.lower()
+
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    goto.append({})
+                    outputs.append(set())
+                    next_state = len(goto) - 1
+                    goto[state][char] = next_state
+                state = next_state
+            outputs[state].add(label)
+            self.keyword_count += 1
+
+        # Fold failure links into a complete transition table (breadth-first,
+        # so every state's failure target is finished before the state itself)
+        fail = [0] * len(goto)
+        transitions: list[dict[str, int]] = [{} for _ in goto]
+        transitions[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {**transitions[fail[state]], **goto[state]}
+            outputs[state] |= outputs[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+
+        self._transitions = transitions
+        self._outputs: list[frozenset[Hashable] | None] = [
+            frozenset(labels) if labels else None for labels in outputs
+        ]
+
+    @property
+    def state_count(self) -> int:
+        """Number of automaton states."""
+        return len(self._transitions)
+
+    def find_labels(self, text: str) -> set[Hashable]:
+        """Return the labels of every keyword that occurs in the text."""
+        if self.ignore_case:
+            text = text.lower()
+
+        transitions = self._transitions
+        outputs = self._outputs
+        root = transitions[0]
+        found: set[Hashable] = set()
+        state = 0
+
+        for char in text:
+            state = transitions[state].get(char, 0) if state else root.get(char, 0)
+            labels = outputs[state]
+            if labels is not None:
+                found |= labels
+
+        return found
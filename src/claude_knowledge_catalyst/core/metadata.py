@@ -1,14 +1,24 @@
 """Metadata management for knowledge files."""
 
+import multiprocessing
+import os
+import pickle
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import frontmatter
 from pydantic import BaseModel, Field
 
+from .keyword_matcher import KeywordMatcher
+from .project_resolver import ProjectResolutionCache, default_project_cache
 from .tag_standards import TagStandardsManager
+from .tracing import trace_span
 
 
 class KnowledgeMetadata(BaseModel):
@@ -91,13 +101,155 @@ class KnowledgeMetadata(BaseModel):
     model_config = {"json_encoders": {datetime: lambda v: v.isoformat()}}
 
 
+# Content inference keyword tables, all matched in a single pass per document
+TYPE_PATTERNS: dict[str, list[str]] = {
+    "prompt": ["prompt", "claude", "ask", "request", "generate"],
+    "concept": ["concept", "theory", "principle", "methodology", "approach"],
+    "resource": ["resource", "link", "reference", "documentation", "guide"],
+}
+
+# Code markers are matched case-sensitively
+CODE_PATTERNS = ["```", "def ", "function ", "class ", "import ", "const ", "let "]
+
+TECH_PATTERNS: dict[str, list[str]] = {
+    "python": [
+        "python",
+        "pip",
+        "conda",
+        "pytest",
+        "django",
+        "flask",
+        "fastapi",
+        "asyncio",
+    ],
+    "javascript": [
+        "javascript",
+        "js",
+        "node.js",
+        "npm",
+        "yarn",
+        "const ",
+        "let ",
+        "=>",
+    ],
+    "typescript": ["typescript", "ts", "interface", "type ", ".ts", ".tsx"],
+    "react": ["react", "jsx", "component", "usestate", "useeffect", "props"],
+    "nodejs": ["node.js", "nodejs", "express", "npm", "package.json"],
+    "api": ["api", "rest", "graphql", "endpoint", "json", "http"],
+    "docker": ["docker", "dockerfile", "container", "image", "compose"],
+    "git": ["git", "commit", "branch", "merge", "pull request", "github"],
+    "aws": ["aws", "s3", "ec2", "lambda", "cloudformation"],
+    "database": ["sql", "mongodb", "postgres", "mysql", "redis"],
+}
+
+DOMAIN_PATTERNS: dict[str, list[str]] = {
+    "web-dev": [
+        "web",
+        "html",
+        "css",
+        "frontend",
+        "backend",
+        "server",
+        "client",
+    ],
+    "data-science": [
+        "data",
+        "analysis",
+        "pandas",
+        "numpy",
+        "ml",
+        "ai",
+        "analytics",
+    ],
+    "automation": ["automation", "script", "cron", "task", "batch", "workflow"],
+    "devops": [
+        "deploy",
+        "ci/cd",
+        "infrastructure",
+        "monitoring",
+        "kubernetes",
+        "docker",
+    ],
+    "ai-ml": ["ai", "ml", "machine learning", "neural", "model", "training"],
+    "mobile": ["mobile", "ios", "android", "app", "react native", "flutter"],
+    "database": ["database", "sql", "mongodb", "postgres", "mysql", "redis"],
+    "security": ["security", "auth", "encryption", "vulnerability", "secure"],
+    "testing": ["test", "testing", "unit test", "integration", "qa", "quality"],
+}
+
+CONFIDENCE_PATTERNS: dict[str, list[str]] = {
+    "high": ["tested", "proven", "validated", "production"],
+    "low": ["experimental", "draft", "wip", "todo"],
+}
+
+CLAUDE_FEATURE_PATTERNS: dict[str, list[str]] = {
+    "code-generation": ["generate", "create", "build", "implement"],
+    "analysis": ["analyze", "review", "examine", "evaluate"],
+    "debugging": ["debug", "error", "fix", "troubleshoot"],
+    "documentation": ["document", "readme", "guide", "explanation"],
+    "optimization": ["optimize", "improve", "enhance", "performance"],
+}
+
+KeywordMatches = set[Any]
+
+
+@cache
+def get_inference_matcher() -> KeywordMatcher:
+    """Compile every inference keyword table into one shared automaton."""
+    tables = {
+        "type": TYPE_PATTERNS,
+        "tech": TECH_PATTERNS,
+        "domain": DOMAIN_PATTERNS,
+        "confidence": CONFIDENCE_PATTERNS,
+        "claude_feature": CLAUDE_FEATURE_PATTERNS,
+    }
+    keywords = [
+        (pattern, (field, value))
+        for field, table in tables.items()
+        for value, patterns in table.items()
+        for pattern in patterns
+    ]
+    keywords.extend((pattern, ("code", pattern)) for pattern in CODE_PATTERNS)
+    return KeywordMatcher(keywords)
+
+
+class MetadataExtractionResult(NamedTuple):
+    """Outcome of extracting metadata from one file in a bulk run."""
+
+    path: Path
+    metadata: KnowledgeMetadata | None
+    error: Exception | None
+
+
+# Below this many files a process pool costs more than it saves
+BULK_PARALLEL_THRESHOLD = 32
+
+# Default worker count: at most this many, and at least this many files per
+# worker so each spawned process earns back its interpreter startup
+MAX_DEFAULT_BULK_WORKERS = 8
+BULK_FILES_PER_WORKER = 500
+
+
 class MetadataManager:
     """Pure tag-centered metadata manager for knowledge items."""
 
-    def __init__(self, tag_config: dict[str, list[str]] | None = None):
-        """Initialize metadata manager with tag configuration."""
+    def __init__(
+        self,
+        tag_config: dict[str, list[str]] | None = None,
+        project_cache: ProjectResolutionCache | None = None,
+    ):
+        """Initialize metadata manager with tag configuration.
+
+        Args:
+            tag_config: Tag vocabulary, defaults to the pure tag system
+            project_cache: Directory-level project detection cache, shared
+                process-wide by default
+        """
         self.tag_config = tag_config or self._get_default_tag_config()
         self.tag_standards = TagStandardsManager()
+        self.project_cache = (
+            project_cache if project_cache is not None else default_project_cache
+        )
 
     def _get_default_tag_config(self) -> dict[str, list[str]]:
         """Get default tag configuration for pure tag system."""
@@ -164,6 +316,11 @@ class MetadataManager:
 
     def extract_metadata_from_file(self, file_path: Path) -> KnowledgeMetadata:
         """Extract pure tag-centered metadata from a markdown file."""
+        with trace_span("extract.file", file=file_path.name):
+            return self._extract_file_metadata(file_path)
+
+    def _extract_file_metadata(self, file_path: Path) -> KnowledgeMetadata:
+        """Parse a markdown file and build its metadata."""
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -177,22 +334,29 @@ class MetadataManager:
         # Extract title from metadata or content
         title = self._extract_title(metadata, content)
 
+        # Find every inference keyword in one pass over the content
+        matches = self._match_keywords(content)
+
         # Extract pure tag-centered metadata
-        tag_metadata = self._extract_tag_metadata(metadata, content)
+        tag_metadata = self._extract_tag_metadata(metadata, content, matches)
 
         # Auto-detect projects if not specified
         projects = self._extract_projects(metadata, file_path)
 
         # Infer missing metadata from content analysis
-        inferred_metadata = self._infer_metadata_from_content(content)
+        inferred_metadata = self._infer_metadata_from_content(content, matches)
+
+        # Missing timestamps fall back to the file's mtime rather than now, so
+        # unchanged files always yield the same metadata and rendered output
+        modified = datetime.fromtimestamp(file_path.stat().st_mtime)
 
         # Merge all metadata sources (pure tag system only)
         final_metadata = {
             **tag_metadata,
             **inferred_metadata,
             "title": title,
-            "created": self._parse_datetime(metadata.get("created")),
-            "updated": self._parse_datetime(metadata.get("updated")),
+            "created": self._parse_datetime(metadata.get("created"), modified),
+            "updated": self._parse_datetime(metadata.get("updated"), modified),
             "version": metadata.get("version", "1.0"),
             "projects": projects,
             "purpose": metadata.get("purpose"),
@@ -203,12 +367,86 @@ class MetadataManager:
 
         return KnowledgeMetadata(**final_metadata)
 
+    def extract_metadata_bulk(
+        self, paths: Iterable[Path], workers: int | None = None
+    ) -> list[MetadataExtractionResult]:
+        """Extract metadata from many files using a process pool.
+
+        Workers are started with the ``spawn`` method: callers often run
+        other threads (log writer, watcher, sync pipeline), and forking a
+        process with live threads can deadlock on locks the child inherits.
+
+        Args:
+            paths: Files to extract metadata from
+            workers: Number of worker processes (defaults to the CPU count,
+                capped at ``MAX_DEFAULT_BULK_WORKERS`` and one worker per
+                ``BULK_FILES_PER_WORKER`` files); 1 forces serial extraction
+                in this process
+
+        Returns:
+            One result per input path, in input order, with per-file errors
+            captured instead of raised
+        """
+        paths = list(paths)
+        if workers is None:
+            workers = min(
+                os.cpu_count() or 1,
+                MAX_DEFAULT_BULK_WORKERS,
+                len(paths) // BULK_FILES_PER_WORKER,
+            )
+        workers = min(workers, len(paths))
+
+        if workers > 1 and len(paths) >= BULK_PARALLEL_THRESHOLD:
+            try:
+                with (
+                    trace_span("extract.parallel", files=len(paths), workers=workers),
+                    ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_bulk_worker,
+                        initargs=(self.tag_config,),
+                    ) as executor,
+                ):
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    outcomes = list(
+                        executor.map(_extract_in_worker, paths, chunksize=chunksize)
+                    )
+                return [
+                    MetadataExtractionResult(path, metadata, error)
+                    for path, (metadata, error) in zip(paths, outcomes, strict=True)
+                ]
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                print(
+                    f"Warning: Parallel extraction unavailable, running serially: {e}"
+                )
+
+        results = []
+        for path in paths:
+            try:
+                metadata = self.extract_metadata_from_file(path)
+                results.append(MetadataExtractionResult(path, metadata, None))
+            except Exception as e:
+                results.append(MetadataExtractionResult(path, None, e))
+        return results
+
+    def _match_keywords(self, content: str) -> KeywordMatches:
+        """Find all inference keywords present in the content."""
+        return get_inference_matcher().find_labels(content)
+
     def _extract_tag_metadata(
-        self, metadata: dict[str, Any], content: str
+        self,
+        metadata: dict[str, Any],
+        content: str,
+        matches: KeywordMatches | None = None,
     ) -> dict[str, Any]:
         """Extract pure tag-centered metadata from file frontmatter and content."""
+        if matches is None:
+            matches = self._match_keywords(content)
+
         result = {
-            "type": metadata.get("type", self._infer_type_from_content(content)),
+            "type": metadata.get(
+                "type", self._infer_type_from_content(content, matches)
+            ),
             "status": metadata.get("status", "draft"),
             "tech": self._ensure_list(metadata.get("tech", [])),
             "domain": self._ensure_list(metadata.get("domain", [])),
@@ -227,11 +465,11 @@ class MetadataManager:
         result["tags"].extend(hashtags)
 
         # Infer technical tags from content
-        inferred_tech = self._infer_tech_tags(content)
+        inferred_tech = self._infer_tech_tags(content, matches)
         result["tech"].extend(inferred_tech)
 
         # Infer domain tags from content
-        inferred_domain = self._infer_domain_tags(content)
+        inferred_domain = self._infer_domain_tags(content, matches)
         result["domain"].extend(inferred_domain)
 
         # Deduplicate and validate all tag lists
@@ -241,98 +479,51 @@ class MetadataManager:
 
         return result
 
-    def _infer_type_from_content(self, content: str) -> str:
+    def _infer_type_from_content(
+        self, content: str, matches: KeywordMatches | None = None
+    ) -> str:
         """Infer content type from content analysis."""
-        content_lower = content.lower()
+        if matches is None:
+            matches = self._match_keywords(content)
 
         # Check for prompt patterns
-        if any(
-            pattern in content_lower
-            for pattern in ["prompt", "claude", "ask", "request", "generate"]
-        ):
+        if ("type", "prompt") in matches:
             return "prompt"
 
-        # Check for code patterns
+        # Check for code patterns (confirm case-sensitive hits in original text)
         if any(
-            pattern in content
-            for pattern in [
-                "```",
-                "def ",
-                "function ",
-                "class ",
-                "import ",
-                "const ",
-                "let ",
-            ]
+            ("code", pattern) in matches and pattern in content
+            for pattern in CODE_PATTERNS
         ):
             return "code"
 
         # Check for concept patterns
-        if any(
-            pattern in content_lower
-            for pattern in ["concept", "theory", "principle", "methodology", "approach"]
-        ):
+        if ("type", "concept") in matches:
             return "concept"
 
         # Check for resource patterns
-        if any(
-            pattern in content_lower
-            for pattern in ["resource", "link", "reference", "documentation", "guide"]
-        ):
+        if ("type", "resource") in matches:
             return "resource"
 
         # Default to prompt if unclear
         return "prompt"
 
-    def _infer_domain_tags(self, content: str) -> list[str]:
+    def _infer_domain_tags(
+        self, content: str, matches: KeywordMatches | None = None
+    ) -> list[str]:
         """Infer domain tags from content analysis."""
-        content_lower = content.lower()
-        domain_tags = []
-
-        # Domain detection patterns
-        domain_patterns = {
-            "web-dev": [
-                "web",
-                "html",
-                "css",
-                "frontend",
-                "backend",
-                "server",
-                "client",
-            ],
-            "data-science": [
-                "data",
-                "analysis",
-                "pandas",
-                "numpy",
-                "ml",
-                "ai",
-                "analytics",
-            ],
-            "automation": ["automation", "script", "cron", "task", "batch", "workflow"],
-            "devops": [
-                "deploy",
-                "ci/cd",
-                "infrastructure",
-                "monitoring",
-                "kubernetes",
-                "docker",
-            ],
-            "ai-ml": ["ai", "ml", "machine learning", "neural", "model", "training"],
-            "mobile": ["mobile", "ios", "android", "app", "react native", "flutter"],
-            "database": ["database", "sql", "mongodb", "postgres", "mysql", "redis"],
-            "security": ["security", "auth", "encryption", "vulnerability", "secure"],
-            "testing": ["test", "testing", "unit test", "integration", "qa", "quality"],
-        }
-
-        for domain, patterns in domain_patterns.items():
-            if any(pattern in content_lower for pattern in patterns):
-                domain_tags.append(domain)
+        if matches is None:
+            matches = self._match_keywords(content)
 
-        return domain_tags
+        return [domain for domain in DOMAIN_PATTERNS if ("domain", domain) in matches]
 
-    def _infer_metadata_from_content(self, content: str) -> dict[str, Any]:
+    def _infer_metadata_from_content(
+        self, content: str, matches: KeywordMatches | None = None
+    ) -> dict[str, Any]:
         """Infer metadata from content analysis."""
+        if matches is None:
+            matches = self._match_keywords(content)
+
         inferred = {}
 
         # Infer complexity from content length and structure
@@ -344,15 +535,9 @@ class MetadataManager:
             inferred["complexity"] = "advanced"
 
         # Infer confidence from content quality indicators
-        if any(
-            indicator in content.lower()
-            for indicator in ["tested", "proven", "validated", "production"]
-        ):
+        if ("confidence", "high") in matches:
             inferred["confidence"] = "high"
-        elif any(
-            indicator in content.lower()
-            for indicator in ["experimental", "draft", "wip", "todo"]
-        ):
+        elif ("confidence", "low") in matches:
             inferred["confidence"] = "low"
         else:
             inferred["confidence"] = "medium"
@@ -377,48 +562,14 @@ class MetadataManager:
         hashtags = re.findall(hashtag_pattern, content)
         return list(set(hashtags))
 
-    def _infer_tech_tags(self, content: str) -> list[str]:
+    def _infer_tech_tags(
+        self, content: str, matches: KeywordMatches | None = None
+    ) -> list[str]:
         """Infer technology tags from content."""
-        content_lower = content.lower()
-        tech_tags = []
-
-        # Enhanced technology detection
-        tech_patterns = {
-            "python": [
-                "python",
-                "pip",
-                "conda",
-                "pytest",
-                "django",
-                "flask",
-                "fastapi",
-                "asyncio",
-            ],
-            "javascript": [
-                "javascript",
-                "js",
-                "node.js",
-                "npm",
-                "yarn",
-                "const ",
-                "let ",
-                "=>",
-            ],
-            "typescript": ["typescript", "ts", "interface", "type ", ".ts", ".tsx"],
-            "react": ["react", "jsx", "component", "useState", "useEffect", "props"],
-            "nodejs": ["node.js", "nodejs", "express", "npm", "package.json"],
-            "api": ["api", "rest", "graphql", "endpoint", "json", "http"],
-            "docker": ["docker", "dockerfile", "container", "image", "compose"],
-            "git": ["git", "commit", "branch", "merge", "pull request", "github"],
-            "aws": ["aws", "s3", "ec2", "lambda", "cloudformation"],
-            "database": ["sql", "mongodb", "postgres", "mysql", "redis"],
-        }
+        if matches is None:
+            matches = self._match_keywords(content)
 
-        for tech, patterns in tech_patterns.items():
-            if any(pattern in content_lower for pattern in patterns):
-                tech_tags.append(tech)
-
-        return tech_tags
+        return [tech for tech in TECH_PATTERNS if ("tech", tech) in matches]
 
     def _deduplicate_and_validate_tags(self, tags: list[str]) -> list[str]:
         """Remove duplicates and validate tag format."""
@@ -469,9 +620,24 @@ class MetadataManager:
         return self._deduplicate_and_validate_tags(projects)
 
     def update_file_metadata(
-        self, file_path: Path, metadata: KnowledgeMetadata
-    ) -> None:
-        """Update metadata in a markdown file."""
+        self,
+        file_path: Path,
+        metadata: KnowledgeMetadata,
+        only_if_changed: bool = False,
+        ignore_fields: Iterable[str] = ("updated",),
+    ) -> bool:
+        """Update metadata in a markdown file.
+
+        Args:
+            file_path: File to update
+            metadata: Metadata to write into the frontmatter
+            only_if_changed: Leave the file untouched unless the frontmatter
+                would change in a field other than ``ignore_fields``
+            ignore_fields: Fields that don't count as a change on their own
+
+        Returns:
+            True if the file was written
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -480,12 +646,21 @@ class MetadataManager:
             post = frontmatter.load(f)
 
         # Update metadata
+        previous = dict(post.metadata)
         post.metadata.update(metadata.model_dump(exclude={"checksum", "source"}))
 
+        if only_if_changed:
+            ignored = set(ignore_fields)
+            if {k: v for k, v in previous.items() if k not in ignored} == {
+                k: v for k, v in post.metadata.items() if k not in ignored
+            }:
+                return False
+
         # Write back to file
         content = frontmatter.dumps(post)
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
+        return True
 
     def _extract_title(self, metadata: dict[str, Any], content: str) -> str:
         """Extract title from metadata or content."""
@@ -507,10 +682,19 @@ class MetadataManager:
 
         return "Untitled"
 
-    def _parse_datetime(self, dt_value: Any) -> datetime:
-        """Parse datetime from various formats."""
+    def _parse_datetime(
+        self, dt_value: Any, default: datetime | None = None
+    ) -> datetime:
+        """Parse datetime from various formats.
+
+        Args:
+            dt_value: Frontmatter value to parse
+            default: Returned when the value is missing or unparseable
+                (defaults to now)
+        """
+        fallback = default if default is not None else datetime.now()
         if dt_value is None:
-            return datetime.now()
+            return fallback
 
         if isinstance(dt_value, datetime):
             return dt_value
@@ -536,7 +720,7 @@ class MetadataManager:
                 except ValueError:
                     continue
 
-        return datetime.now()
+        return fallback
 
     def _calculate_checksum(self, content: str) -> str:
         """Calculate checksum for content change detection."""
@@ -589,34 +773,28 @@ class MetadataManager:
             "tags": [],
         }
 
+        matches = self._match_keywords(content)
+
         # Infer technical tags
-        inferred_tech = self._infer_tech_tags(content)
+        inferred_tech = self._infer_tech_tags(content, matches)
         existing_tech = self._ensure_list(existing_metadata.get("tech", []))
         suggestions["tech"] = [tag for tag in inferred_tech if tag not in existing_tech]
 
         # Infer domain tags
-        inferred_domain = self._infer_domain_tags(content)
+        inferred_domain = self._infer_domain_tags(content, matches)
         existing_domain = self._ensure_list(existing_metadata.get("domain", []))
         suggestions["domain"] = [
             tag for tag in inferred_domain if tag not in existing_domain
         ]
 
         # Suggest Claude features based on content
-        feature_patterns = {
-            "code-generation": ["generate", "create", "build", "implement"],
-            "analysis": ["analyze", "review", "examine", "evaluate"],
-            "debugging": ["debug", "error", "fix", "troubleshoot"],
-            "documentation": ["document", "readme", "guide", "explanation"],
-            "optimization": ["optimize", "improve", "enhance", "performance"],
-        }
-
-        content_lower = content.lower()
         existing_features = self._ensure_list(
             existing_metadata.get("claude_feature", [])
         )
-        for feature, patterns in feature_patterns.items():
-            if feature not in existing_features and any(
-                pattern in content_lower for pattern in patterns
+        for feature in CLAUDE_FEATURE_PATTERNS:
+            if (
+                feature not in existing_features
+                and ("claude_feature", feature) in matches
             ):
                 suggestions["claude_feature"].append(feature)
 
@@ -629,91 +807,33 @@ class MetadataManager:
 
     def _auto_detect_project(self, file_path: Path) -> str | None:
         """Auto-detect project name from file path and git context."""
-        # Method 1: Check for .claude/project.yaml
-        claude_dir = self._find_claude_directory(file_path)
-        if claude_dir:
-            project_config = claude_dir / "project.yaml"
-            if project_config.exists():
-                try:
-                    import yaml
-
-                    with open(project_config, encoding="utf-8") as f:
-                        config = yaml.safe_load(f)
-                        project_name = config.get("project_name")
-                        return str(project_name) if project_name else None
-                except Exception:
-                    pass
+        return self.project_cache.resolve_project(self._start_directory(file_path))
 
-        # Method 2: Extract from git repository name
-        git_project = self._detect_project_from_git(file_path)
-        if git_project:
-            return git_project
+    def invalidate_project_cache(self, path: Path | None = None) -> None:
+        """Forget project detection results affected by a change at path."""
+        self.project_cache.invalidate(path)
 
-        # Method 3: Use parent directory name as fallback
-        return self._detect_project_from_path(file_path)
+    def _start_directory(self, file_path: Path) -> Path:
+        """Directory from which project detection walks upwards."""
+        return file_path.parent if file_path.is_file() else file_path
 
     def _find_claude_directory(self, file_path: Path) -> Path | None:
         """Find the nearest .claude directory walking up the tree."""
-        current = file_path.parent if file_path.is_file() else file_path
-
-        while current != current.parent:  # Stop at filesystem root
-            claude_dir = current / ".claude"
-            if claude_dir.exists() and claude_dir.is_dir():
-                return claude_dir
-            current = current.parent
-
-        return None
+        return self.project_cache.find_claude_directory(
+            self._start_directory(file_path)
+        )
 
     def _detect_project_from_git(self, file_path: Path) -> str | None:
         """Detect project name from git repository."""
-        try:
-            import subprocess
-
-            current = file_path.parent if file_path.is_file() else file_path
-
-            # Find git root
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                cwd=current,
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode == 0:
-                git_root = Path(result.stdout.strip())
-                return git_root.name
-
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-
-        return None
+        git_root = self.project_cache.find_git_root(self._start_directory(file_path))
+        return git_root.name if git_root else None
 
     def _detect_project_from_path(self, file_path: Path) -> str | None:
         """Detect project name from file path structure."""
-        # Look for common project indicators
-        current = file_path.parent if file_path.is_file() else file_path
-
-        # Walk up to find a directory that looks like a project root
-        while current != current.parent:
-            # Check for common project files
-            project_indicators = [
-                "package.json",
-                "pyproject.toml",
-                "Cargo.toml",
-                "go.mod",
-                "pom.xml",
-                "build.gradle",
-                "requirements.txt",
-                ".git",
-                "README.md",
-            ]
-
-            if any((current / indicator).exists() for indicator in project_indicators):
-                return current.name
-
-            current = current.parent
-
-        return None
+        project_root = self.project_cache.find_indicator_root(
+            self._start_directory(file_path)
+        )
+        return project_root.name if project_root else None
 
     def validate_tag_metadata(self, metadata: dict[str, Any]) -> tuple[bool, list[str]]:
         """Validate tag-centered metadata structure and return errors."""
@@ -857,3 +977,31 @@ class MetadataManager:
     def export_tag_documentation(self) -> str:
         """Export tag standards as markdown documentation."""
         return self.tag_standards.export_standards_as_markdown()
+
+
+# Per-process manager used by extract_metadata_bulk worker processes
+_worker_manager: MetadataManager | None = None
+
+
+def _init_bulk_worker(tag_config: dict[str, list[str]]) -> None:
+    """Create the worker's metadata manager once per process."""
+    global _worker_manager
+    _worker_manager = MetadataManager(tag_config)
+
+
+def _extract_in_worker(
+    file_path: Path,
+) -> tuple[KnowledgeMetadata | None, Exception | None]:
+    """Extract metadata for one file inside a worker process."""
+    if _worker_manager is None:
+        raise RuntimeError("Bulk extraction worker was not initialized")
+
+    try:
+        return _worker_manager.extract_metadata_from_file(file_path), None
+    except Exception as e:
+        # Exceptions travel back through pickle; keep unpicklable ones readable
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            return None, RuntimeError(f"{type(e).__name__}: {e}")
+        return None, e
@@ -0,0 +1,776 @@
+"""Persistent on-disk metadata index for knowledge files."""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .frontmatter_reader import strip_frontmatter
+from .metadata import KnowledgeMetadata, MetadataManager
+from .text_tokenizer import tokenize
+
+INDEX_DIR_NAME = ".ckc"
+INDEX_FILE_NAME = "metadata_index.db"
+
+# Bump when the stored representation or extraction semantics change
+INDEX_SCHEMA_VERSION = "5"
+
+# Metadata fields with a posting list per value, for set-algebra search
+POSTING_FIELDS = (
+    "type",
+    "status",
+    "tech",
+    "domain",
+    "team",
+    "projects",
+    "complexity",
+    "confidence",
+    "claude_model",
+    "claude_feature",
+    "tags",
+)
+
+# BM25 term-frequency saturation and document-length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SearchHit = tuple[Path, KnowledgeMetadata, float]
+
+# (key, mtime_ns, size, auto-detected project, metadata) of a fresh entry
+_Update = tuple[str, int, int, str | None, KnowledgeMetadata]
+
+
+class MetadataIndex:
+    """SQLite-backed cache of resolved metadata keyed by path, mtime and size.
+
+    Files whose modification time and size are unchanged since they were last
+    indexed are served from the index without being opened or re-parsed.
+    Each entry also records the project auto-detected for its directory, so
+    adding, editing or removing a ``project.yaml`` or repository root
+    re-extracts the affected files even though the files themselves did not
+    change.
+    Every value of the ``POSTING_FIELDS`` is also kept as a posting list of
+    entry ids, so multi-criteria searches are intersections answered by
+    SQLite without decoding non-matching entries. Title, tags and body are
+    tokenized into a term index for BM25-ranked full-text search.
+    """
+
+    def __init__(
+        self, index_path: Path | None, metadata_manager: MetadataManager
+    ) -> None:
+        """Initialize metadata index.
+
+        Args:
+            index_path: Location of the SQLite database, or None for an
+                in-memory index that lives only for this process
+            metadata_manager: Manager used to extract metadata on cache misses
+        """
+        self.metadata_manager = metadata_manager
+        self.index_path = index_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = self._connect(index_path)
+        self._ensure_schema()
+
+    @classmethod
+    def for_directory(
+        cls, root: Path, metadata_manager: MetadataManager
+    ) -> "MetadataIndex":
+        """Open the index stored under ``<root>/.ckc/``."""
+        return cls(root / INDEX_DIR_NAME / INDEX_FILE_NAME, metadata_manager)
+
+    def _connect(self, index_path: Path | None) -> sqlite3.Connection:
+        """Open the database, falling back to memory if the path is unusable."""
+        if index_path is not None:
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                return sqlite3.connect(
+                    str(index_path), timeout=30, check_same_thread=False
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Metadata index unavailable at {index_path}: {e}")
+                self.index_path = None
+
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    def _fingerprint(self) -> str:
+        """Fingerprint of everything that influences extracted metadata."""
+        tag_config = json.dumps(self.metadata_manager.tag_config, sort_keys=True)
+        digest = hashlib.md5(tag_config.encode("utf-8")).hexdigest()
+        return f"{INDEX_SCHEMA_VERSION}:{digest}"
+
+    def _ensure_schema(self) -> None:
+        """Create tables, rebuilding them when written by another version."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS index_info "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+            fingerprint = self._fingerprint()
+            row = self._conn.execute(
+                "SELECT value FROM index_info WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self._conn.execute("DROP TABLE IF EXISTS postings")
+                self._conn.execute("DROP TABLE IF EXISTS terms")
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO index_info (key, value) "
+                    "VALUES ('fingerprint', ?)",
+                    (fingerprint,),
+                )
+
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "id INTEGER PRIMARY KEY, "
+                "path TEXT NOT NULL UNIQUE, "
+                "mtime_ns INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "project TEXT, "
+                "updated REAL NOT NULL, "
+                "success_rate INTEGER, "
+                "length INTEGER NOT NULL, "
+                "metadata TEXT NOT NULL)"
+            )
+            # Clustered by (field, value), so each posting list is a sorted
+            # range of entry ids
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "field TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "entry_id INTEGER NOT NULL, "
+                "PRIMARY KEY (field, value, entry_id)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS postings_by_entry ON postings (entry_id)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS terms ("
+                "term TEXT NOT NULL, "
+                "entry_id INTEGER NOT NULL, "
+                "tf INTEGER NOT NULL, "
+                "PRIMARY KEY (term, entry_id)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS terms_by_entry ON terms (entry_id)"
+            )
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """Index key for a file path."""
+        return os.path.abspath(file_path)
+
+    def get(self, file_path: Path) -> KnowledgeMetadata:
+        """Get metadata for a single file, extracting it only if it changed."""
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        key = self._key(file_path)
+        stat = file_path.stat()
+        project = self._project(file_path)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, project, metadata FROM entries WHERE path = ?",
+                (key,),
+            ).fetchone()
+
+        if row is not None and row[:3] == (stat.st_mtime_ns, stat.st_size, project):
+            self.hits += 1
+            return KnowledgeMetadata.model_validate_json(row[3])
+
+        self.misses += 1
+        metadata = self.metadata_manager.extract_metadata_from_file(file_path)
+        self._store([(key, stat.st_mtime_ns, stat.st_size, project, metadata)])
+        return metadata
+
+    def get_many(
+        self,
+        file_paths: Iterable[Path],
+        on_error: Callable[[Path, Exception], None] | None = None,
+        workers: int | None = None,
+    ) -> list[tuple[Path, KnowledgeMetadata]]:
+        """Get metadata for many files using a single index lookup.
+
+        Args:
+            file_paths: Files to resolve
+            on_error: Called with (path, exception) for files that fail to parse
+            workers: Worker processes for extracting cache misses
+
+        Returns:
+            List of (file_path, metadata) in input order, skipping failures
+        """
+        paths = list(file_paths)
+        keys = [self._key(path) for path in paths]
+        cached, resolved = self._update(paths, keys, on_error, workers)
+        for key, metadata_json in cached.items():
+            resolved[key] = KnowledgeMetadata.model_validate_json(metadata_json)
+
+        return [
+            (path, resolved[key])
+            for path, key in zip(paths, keys, strict=True)
+            if key in resolved
+        ]
+
+    def refresh(
+        self,
+        root: Path,
+        pattern: str = "*.md",
+        skip: Callable[[Path], bool] | None = None,
+        on_error: Callable[[Path, Exception], None] | None = None,
+        workers: int | None = None,
+    ) -> int:
+        """Bring the index up to date for a directory without decoding it.
+
+        Like :meth:`scan`, but unchanged entries are only compared by mtime
+        and size and never deserialized, which makes it the cheap way to
+        prepare for :meth:`search`.
+
+        Args:
+            root: Directory to scan recursively
+            pattern: Glob pattern for files to include
+            skip: Optional predicate; matching files are excluded
+            on_error: Called with (path, exception) for files that fail to parse
+            workers: Worker processes for extracting cache misses
+
+        Returns:
+            Number of files that had to be extracted
+        """
+        if not root.exists():
+            return 0
+
+        all_files = [path for path in root.rglob(pattern) if path.is_file()]
+        files = [path for path in all_files if not (skip and skip(path))]
+        _, extracted = self._update(
+            files, [self._key(path) for path in files], on_error, workers
+        )
+        self._prune(root, {self._key(path) for path in all_files})
+        return len(extracted)
+
+    def search(
+        self,
+        root: Path,
+        filters: Mapping[str, str | None] | None = None,
+        min_success_rate: int | None = None,
+        skip: Callable[[Path], bool] | None = None,
+        predicate: Callable[[KnowledgeMetadata], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[Path, KnowledgeMetadata]]:
+        """Find indexed files under a directory matching every filter.
+
+        Each filter selects one posting list; the result is their
+        intersection, newest ``updated`` first. Only matching entries are
+        decoded. The index is not refreshed; call :meth:`refresh` first.
+
+        Args:
+            root: Directory whose entries are searched
+            filters: Field name (one of ``POSTING_FIELDS``) to required value;
+                None values are ignored
+            min_success_rate: Minimum success rate, if any
+            skip: Optional predicate on paths; matching files are excluded
+            predicate: Optional extra test applied to decoded metadata
+            limit: Maximum number of results
+
+        Returns:
+            List of (file_path, metadata), newest first
+        """
+        where, params = self._filter_sql(root, filters, min_success_rate)
+        sql = f"SELECT e.path, e.metadata FROM entries e WHERE {where}"
+        sql += " ORDER BY e.updated DESC"
+        # Without Python-side filters the limit can be applied by SQLite
+        if limit is not None and skip is None and predicate is None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        results: list[tuple[Path, KnowledgeMetadata]] = []
+        with self._lock:
+            # Rows are streamed so filtering stops as soon as the limit is hit
+            for path_text, metadata_json in self._conn.execute(sql, params):
+                if limit is not None and len(results) >= limit:
+                    break
+                path = Path(path_text)
+                if skip is not None and skip(path):
+                    continue
+                metadata = KnowledgeMetadata.model_validate_json(metadata_json)
+                if predicate is not None and not predicate(metadata):
+                    continue
+                results.append((path, metadata))
+        return results
+
+    def search_text(
+        self,
+        root: Path,
+        text: str,
+        filters: Mapping[str, str | None] | None = None,
+        min_success_rate: int | None = None,
+        skip: Callable[[Path], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        """Rank indexed files under a directory by BM25 relevance to a query.
+
+        The query is tokenized like the documents, and a file matches if it
+        contains any query term. Filters work as in :meth:`search` and
+        restrict the candidates before scoring; the top ``limit`` files are
+        selected by SQLite. The index is not refreshed; call :meth:`refresh`
+        first.
+
+        Args:
+            root: Directory whose entries are searched
+            text: Free-text query (English, Japanese or mixed)
+            filters: Field name (one of ``POSTING_FIELDS``) to required value
+            min_success_rate: Minimum success rate, if any
+            skip: Optional predicate on paths; matching files are excluded
+            limit: Maximum number of results
+
+        Returns:
+            List of (file_path, metadata, score), best match first
+        """
+        query_terms = sorted(set(tokenize(text)))
+        if not query_terms:
+            return []
+
+        where, filter_params = self._filter_sql(root, filters, min_success_rate)
+        placeholders = ",".join("?" * len(query_terms))
+
+        with self._lock:
+            total, average_length = self._conn.execute(
+                "SELECT COUNT(*), AVG(length) FROM entries"
+            ).fetchone()
+            document_frequency = dict(
+                self._conn.execute(
+                    "SELECT term, COUNT(*) FROM terms "
+                    f"WHERE term IN ({placeholders}) GROUP BY term",
+                    query_terms,
+                ).fetchall()
+            )
+            if not document_frequency:
+                return []
+
+            # Lucene's non-negative idf variant
+            idf_case = " ".join("WHEN ? THEN ?" for _ in document_frequency)
+            idf_params: list[Any] = []
+            for term, frequency in document_frequency.items():
+                idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+                idf_params.extend([term, idf])
+
+            sql = (
+                "SELECT e.path, e.metadata, SUM("
+                f"(CASE t.term {idf_case} END) * t.tf * {BM25_K1 + 1} / "
+                f"(t.tf + {BM25_K1} * (1 - {BM25_B} + {BM25_B} * e.length / ?))"
+                ") AS score "
+                "FROM terms t JOIN entries e ON e.id = t.entry_id "
+                f"WHERE t.term IN ({placeholders}) AND {where} "
+                "GROUP BY e.id ORDER BY score DESC"
+            )
+            params = [
+                *idf_params,
+                average_length or 1.0,
+                *query_terms,
+                *filter_params,
+            ]
+            if limit is not None and skip is None:
+                sql += " LIMIT ?"
+                params.append(limit)
+
+            results: list[SearchHit] = []
+            for path_text, metadata_json, score in self._conn.execute(sql, params):
+                if limit is not None and len(results) >= limit:
+                    break
+                path = Path(path_text)
+                if skip is not None and skip(path):
+                    continue
+                metadata = KnowledgeMetadata.model_validate_json(metadata_json)
+                results.append((path, metadata, score))
+        return results
+
+    def related(
+        self,
+        root: Path,
+        tags: Iterable[str],
+        exclude: Path | None = None,
+        skip: Callable[[Path], bool] | None = None,
+        limit: int = 10,
+    ) -> list[SearchHit]:
+        """Find indexed files under a directory whose tags overlap the given ones.
+
+        Candidates come from the ``tags`` posting lists, so the cost grows
+        with the number of files sharing a tag rather than with the vault.
+        Files are ranked by the Jaccard similarity of their tag sets; ties go
+        to the file sharing rarer tags, each shared tag weighing
+        ``1 / log(1 + df)`` for a tag on ``df`` files. Only the top ``limit``
+        files are decoded. The index is not refreshed; call :meth:`refresh`
+        first.
+
+        Args:
+            root: Directory whose entries are considered
+            tags: Tags of the note to find neighbours for
+            exclude: File left out of the results, usually the note itself
+            skip: Optional predicate on paths; matching files are excluded
+            limit: Maximum number of results
+
+        Returns:
+            List of (file_path, metadata, jaccard), most similar first
+        """
+        query_tags = sorted({tag for tag in tags if tag})
+        if not query_tags or limit <= 0:
+            return []
+
+        where, params = self._filter_sql(root, None, None)
+        placeholders = ",".join("?" * len(query_tags))
+        excluded = self._key(exclude) if exclude is not None else None
+
+        with self._lock:
+            document_frequency = dict(
+                self._conn.execute(
+                    "SELECT value, COUNT(*) FROM postings "
+                    f"WHERE field = 'tags' AND value IN ({placeholders}) "
+                    "GROUP BY value",
+                    query_tags,
+                ).fetchall()
+            )
+            if not document_frequency:
+                return []
+
+            weight_case = " ".join("WHEN ? THEN ?" for _ in document_frequency)
+            weight_params: list[Any] = []
+            for tag, frequency in document_frequency.items():
+                weight_params.extend([tag, 1 / math.log(1 + frequency)])
+
+            sql = (
+                "SELECT e.id, e.path, COUNT(*), "
+                f"SUM(CASE p.value {weight_case} END), "
+                "(SELECT COUNT(*) FROM postings q "
+                "WHERE q.entry_id = e.id AND q.field = 'tags') "
+                "FROM postings p JOIN entries e ON e.id = p.entry_id "
+                f"WHERE p.field = 'tags' AND p.value IN ({placeholders}) "
+                f"AND {where} GROUP BY e.id"
+            )
+            candidates = []
+            for entry_id, path_text, shared, weight, tag_count in self._conn.execute(
+                sql, [*weight_params, *query_tags, *params]
+            ):
+                if path_text == excluded:
+                    continue
+                if skip is not None and skip(Path(path_text)):
+                    continue
+                jaccard = shared / (len(query_tags) + tag_count - shared)
+                candidates.append((jaccard, weight, entry_id))
+
+            top = heapq.nlargest(limit, candidates)
+            if not top:
+                return []
+            rows = {
+                entry_id: (path_text, metadata_json)
+                for entry_id, path_text, metadata_json in self._conn.execute(
+                    "SELECT id, path, metadata FROM entries "
+                    f"WHERE id IN ({','.join('?' * len(top))})",
+                    [entry_id for _, _, entry_id in top],
+                )
+            }
+
+        results: list[SearchHit] = []
+        for jaccard, _, entry_id in top:
+            path_text, metadata_json = rows[entry_id]
+            metadata = KnowledgeMetadata.model_validate_json(metadata_json)
+            results.append((Path(path_text), metadata, jaccard))
+        return results
+
+    def scan(
+        self,
+        root: Path,
+        pattern: str = "*.md",
+        skip: Callable[[Path], bool] | None = None,
+        on_error: Callable[[Path, Exception], None] | None = None,
+        workers: int | None = None,
+    ) -> list[tuple[Path, KnowledgeMetadata]]:
+        """Resolve metadata for every matching file under a directory.
+
+        Entries for files under ``root`` that no longer exist are dropped.
+
+        Args:
+            root: Directory to scan recursively
+            pattern: Glob pattern for files to include
+            skip: Optional predicate; matching files are excluded
+            on_error: Called with (path, exception) for files that fail to parse
+            workers: Worker processes for extracting cache misses
+
+        Returns:
+            List of (file_path, metadata) for successfully resolved files
+        """
+        if not root.exists():
+            return []
+
+        all_files = [path for path in root.rglob(pattern) if path.is_file()]
+        files = [path for path in all_files if not (skip and skip(path))]
+        results = self.get_many(files, on_error, workers)
+        self._prune(root, {self._key(path) for path in all_files})
+        return results
+
+    def invalidate(self, file_path: Path) -> None:
+        """Remove a file from the index."""
+        with self._lock, self._conn:
+            self._delete_entries([self._key(file_path)])
+
+    def clear(self) -> None:
+        """Remove all entries from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM postings")
+            self._conn.execute("DELETE FROM terms")
+            self._conn.execute("DELETE FROM entries")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            (entry_count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+            (term_count,) = self._conn.execute(
+                "SELECT COUNT(DISTINCT term) FROM terms"
+            ).fetchone()
+
+        return {
+            "index_path": str(self.index_path) if self.index_path else None,
+            "entries": entry_count,
+            "terms": term_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _filter_sql(
+        self,
+        root: Path,
+        filters: Mapping[str, str | None] | None,
+        min_success_rate: int | None,
+    ) -> tuple[str, list[Any]]:
+        """WHERE clause (entries aliased as ``e``) for a root and filters."""
+        active = {field: value for field, value in (filters or {}).items() if value}
+        unknown = set(active) - set(POSTING_FIELDS)
+        if unknown:
+            raise ValueError(f"Unsupported search fields: {sorted(unknown)}")
+
+        prefix = self._key(root).rstrip(os.sep) + os.sep
+        where = "e.path >= ? AND e.path < ?"
+        params: list[Any] = [prefix, prefix[:-1] + chr(ord(os.sep) + 1)]
+
+        if active:
+            posting = "SELECT entry_id FROM postings WHERE field = ? AND value = ?"
+            where += f" AND e.id IN ({' INTERSECT '.join([posting] * len(active))})"
+            for field, value in active.items():
+                params.extend([field, value])
+        if min_success_rate:
+            where += " AND e.success_rate >= ?"
+            params.append(min_success_rate)
+        return where, params
+
+    def _update(
+        self,
+        paths: list[Path],
+        keys: list[str],
+        on_error: Callable[[Path, Exception], None] | None,
+        workers: int | None,
+    ) -> tuple[dict[str, str], dict[str, KnowledgeMetadata]]:
+        """Re-extract changed files and store them.
+
+        Returns:
+            Stored JSON of unchanged entries and freshly extracted metadata,
+            both keyed by index key
+        """
+        cached = self._load_rows(keys)
+
+        unchanged: dict[str, str] = {}
+        stale: list[tuple[Path, str, os.stat_result, str | None]] = []
+        projects: dict[Path, str | None] = {}
+
+        for path, key in zip(paths, keys, strict=True):
+            try:
+                stat = path.stat()
+                if path.parent not in projects:
+                    projects[path.parent] = self._project(path)
+                project = projects[path.parent]
+                row = cached.get(key)
+                if row is not None and row[:3] == (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    project,
+                ):
+                    self.hits += 1
+                    unchanged[key] = row[3]
+                else:
+                    stale.append((path, key, stat, project))
+            except Exception as e:
+                if on_error is not None:
+                    on_error(path, e)
+
+        # Cache misses are extracted together so large rebuilds can fan out
+        self.misses += len(stale)
+        extracted = self.metadata_manager.extract_metadata_bulk(
+            [path for path, _, _, _ in stale], workers=workers
+        )
+        resolved: dict[str, KnowledgeMetadata] = {}
+        updates: list[_Update] = []
+        for (path, key, stat, project), result in zip(stale, extracted, strict=True):
+            if result.metadata is not None:
+                resolved[key] = result.metadata
+                updates.append(
+                    (key, stat.st_mtime_ns, stat.st_size, project, result.metadata)
+                )
+            elif on_error is not None and result.error is not None:
+                on_error(path, result.error)
+
+        self._store(updates)
+        return unchanged, resolved
+
+    def _project(self, file_path: Path) -> str | None:
+        """Project auto-detected for a file's directory (memoized per directory)."""
+        return self.metadata_manager.project_cache.resolve_project(file_path.parent)
+
+    def _load_rows(
+        self, keys: list[str]
+    ) -> dict[str, tuple[int, int, str | None, str]]:
+        """Load stored rows for the given keys."""
+        rows: dict[str, tuple[int, int, str | None, str]] = {}
+        if not keys:
+            return rows
+
+        # Stay well below SQLite's bound-parameter limit
+        batch_size = 500
+        with self._lock:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start : start + batch_size]
+                placeholders = ",".join("?" * len(batch))
+                for path, mtime_ns, size, project, metadata in self._conn.execute(
+                    "SELECT path, mtime_ns, size, project, metadata FROM entries "
+                    f"WHERE path IN ({placeholders})",
+                    batch,
+                ):
+                    rows[path] = (mtime_ns, size, project, metadata)
+
+        return rows
+
+    def _store(self, updates: list[_Update]) -> None:
+        """Persist freshly extracted metadata in one transaction."""
+        if not updates:
+            return
+
+        # Files are tokenized before taking the lock
+        term_counts = [
+            Counter(tokenize(_document_text(Path(key), metadata)))
+            for key, _, _, _, metadata in updates
+        ]
+
+        with self._lock, self._conn:
+            for (key, mtime_ns, size, project, metadata), counts in zip(
+                updates, term_counts, strict=True
+            ):
+                # Upsert keeps the entry id stable across re-extractions
+                self._conn.execute(
+                    "INSERT INTO entries "
+                    "(path, mtime_ns, size, project, updated, success_rate, "
+                    "length, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(path) DO UPDATE SET "
+                    "mtime_ns = excluded.mtime_ns, size = excluded.size, "
+                    "project = excluded.project, "
+                    "updated = excluded.updated, "
+                    "success_rate = excluded.success_rate, "
+                    "length = excluded.length, "
+                    "metadata = excluded.metadata",
+                    (
+                        key,
+                        mtime_ns,
+                        size,
+                        project,
+                        metadata.updated.timestamp(),
+                        metadata.success_rate,
+                        counts.total(),
+                        metadata.model_dump_json(),
+                    ),
+                )
+                (entry_id,) = self._conn.execute(
+                    "SELECT id FROM entries WHERE path = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "DELETE FROM postings WHERE entry_id = ?", (entry_id,)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO postings (field, value, entry_id) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (field, value, entry_id)
+                        for field, value in _posting_values(metadata)
+                    ],
+                )
+                self._conn.execute("DELETE FROM terms WHERE entry_id = ?", (entry_id,))
+                self._conn.executemany(
+                    "INSERT INTO terms (term, entry_id, tf) VALUES (?, ?, ?)",
+                    [(term, entry_id, tf) for term, tf in counts.items()],
+                )
+
+    def _delete_entries(self, keys: list[str]) -> None:
+        """Delete entries and their postings; caller holds the lock."""
+        for key in keys:
+            row = self._conn.execute(
+                "SELECT id FROM entries WHERE path = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM postings WHERE entry_id = ?", row)
+                self._conn.execute("DELETE FROM terms WHERE entry_id = ?", row)
+                self._conn.execute("DELETE FROM entries WHERE id = ?", row)
+
+    def _prune(self, root: Path, live_keys: set[str]) -> None:
+        """Drop entries under root whose files have disappeared."""
+        prefix = self._key(root).rstrip(os.sep) + os.sep
+        # Range query over the primary key matches every path under prefix
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+
+        with self._lock, self._conn:
+            stale = [
+                path
+                for (path,) in self._conn.execute(
+                    "SELECT path FROM entries WHERE path >= ? AND path < ?",
+                    (prefix, upper),
+                )
+                if path not in live_keys
+            ]
+            self._delete_entries(stale)
+
+    def __enter__(self) -> "MetadataIndex":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        """Context manager exit."""
+        self.close()
+
+
+def _posting_values(metadata: KnowledgeMetadata) -> set[tuple[str, str]]:
+    """(field, value) pairs of the posting lists an entry belongs to."""
+    pairs: set[tuple[str, str]] = set()
+    for field in POSTING_FIELDS:
+        value = getattr(metadata, field)
+        values = value if isinstance(value, list) else [value]
+        pairs.update((field, str(item)) for item in values if item)
+    return pairs
+
+
+def _document_text(file_path: Path, metadata: KnowledgeMetadata) -> str:
+    """Searchable text of a note: title, tags and body."""
+    try:
+        body = strip_frontmatter(file_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        body = ""
+    return "\n".join([metadata.title, " ".join(metadata.tags), body])
@@ -0,0 +1,210 @@
+"""Directory-level project resolution cache for metadata extraction."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Files whose presence marks a directory as a project root
+PROJECT_INDICATORS = (
+    "package.json",
+    "pyproject.toml",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "requirements.txt",
+    ".git",
+    "README.md",
+)
+
+# Names whose creation, deletion or edit can change a resolution result
+RESOLUTION_SENSITIVE_NAMES = frozenset({".claude", "project.yaml", *PROJECT_INDICATORS})
+
+
+class ProjectResolutionCache:
+    """Memoizes project auto-detection per directory.
+
+    Each directory is examined at most once: results for a directory are
+    derived from its own entries plus the memoized result of its parent, so
+    resolving thousands of files in one tree costs one lookup per directory
+    instead of one ancestor walk (and ``git`` subprocess) per file.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty resolution cache."""
+        self._lock = threading.RLock()
+        self._claude_dirs: dict[Path, Path | None] = {}
+        self._git_roots: dict[Path, Path | None] = {}
+        self._indicator_roots: dict[Path, Path | None] = {}
+        self._project_names: dict[Path, str | None] = {}
+        self._projects: dict[Path, str | None] = {}
+        self.lookups = 0
+
+    @staticmethod
+    def _normalize(directory: Path) -> Path:
+        """Normalize a directory to an absolute key without touching disk."""
+        return Path(os.path.abspath(directory))
+
+    def find_claude_directory(self, directory: Path) -> Path | None:
+        """Find the nearest .claude directory at or above a directory."""
+        directory = self._normalize(directory)
+        with self._lock:
+            return self._find_claude_directory(directory)
+
+    def _find_claude_directory(self, directory: Path) -> Path | None:
+        if directory in self._claude_dirs:
+            return self._claude_dirs[directory]
+
+        # The filesystem root is never searched
+        if directory == directory.parent:
+            result = None
+        else:
+            self.lookups += 1
+            claude_dir = directory / ".claude"
+            if claude_dir.is_dir():
+                result = claude_dir
+            else:
+                result = self._find_claude_directory(directory.parent)
+
+        self._claude_dirs[directory] = result
+        return result
+
+    def find_git_root(self, directory: Path) -> Path | None:
+        """Find the enclosing git working tree root, if any."""
+        directory = self._normalize(directory)
+        with self._lock:
+            return self._find_git_root(directory)
+
+    def _find_git_root(self, directory: Path) -> Path | None:
+        if directory in self._git_roots:
+            return self._git_roots[directory]
+
+        self.lookups += 1
+        # .git is a directory for normal clones and a file for worktrees
+        if (directory / ".git").exists():
+            result: Path | None = directory
+        elif directory == directory.parent:
+            result = None
+        else:
+            result = self._find_git_root(directory.parent)
+
+        self._git_roots[directory] = result
+        return result
+
+    def find_indicator_root(self, directory: Path) -> Path | None:
+        """Find the nearest directory containing a project indicator file."""
+        directory = self._normalize(directory)
+        with self._lock:
+            return self._find_indicator_root(directory)
+
+    def _find_indicator_root(self, directory: Path) -> Path | None:
+        if directory in self._indicator_roots:
+            return self._indicator_roots[directory]
+
+        if directory == directory.parent:
+            result = None
+        else:
+            self.lookups += 1
+            if any(
+                (directory / indicator).exists() for indicator in PROJECT_INDICATORS
+            ):
+                result = directory
+            else:
+                result = self._find_indicator_root(directory.parent)
+
+        self._indicator_roots[directory] = result
+        return result
+
+    def read_project_name(self, claude_dir: Path) -> str | None:
+        """Read ``project_name`` from ``.claude/project.yaml``."""
+        claude_dir = self._normalize(claude_dir)
+        with self._lock:
+            if claude_dir in self._project_names:
+                return self._project_names[claude_dir]
+
+            result = None
+            project_config = claude_dir / "project.yaml"
+            if project_config.exists():
+                try:
+                    with open(project_config, encoding="utf-8") as f:
+                        config = yaml.safe_load(f)
+                    project_name = config.get("project_name")
+                    result = str(project_name) if project_name else None
+                except Exception:
+                    pass
+
+            self._project_names[claude_dir] = result
+            return result
+
+    def resolve_project(self, directory: Path) -> str | None:
+        """Resolve the project name for files in a directory.
+
+        Resolution order: ``.claude/project.yaml``, git repository name,
+        then the nearest directory holding a project indicator file.
+        """
+        directory = self._normalize(directory)
+        with self._lock:
+            if directory in self._projects:
+                return self._projects[directory]
+
+            result = None
+            claude_dir = self._find_claude_directory(directory)
+            if claude_dir:
+                result = self.read_project_name(claude_dir)
+
+            if result is None:
+                git_root = self._find_git_root(directory)
+                if git_root:
+                    result = git_root.name
+
+            if result is None:
+                indicator_root = self._find_indicator_root(directory)
+                result = indicator_root.name if indicator_root else None
+
+            self._projects[directory] = result
+            return result
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop cached results affected by a change at ``path``.
+
+        A change to an entry inside a directory can alter the results for that
+        directory and all of its descendants, so the whole subtree is dropped.
+        Passing None clears the cache entirely.
+        """
+        with self._lock:
+            if path is None:
+                for cache in self._caches():
+                    cache.clear()
+                return
+
+            path = self._normalize(path)
+            affected = path.parent
+            # .claude/project.yaml is consulted on behalf of the parent of .claude
+            if affected.name == ".claude":
+                affected = affected.parent
+
+            for cache in self._caches():
+                for key in [
+                    key for key in cache if key == affected or affected in key.parents
+                ]:
+                    del cache[key]
+
+    def _caches(self) -> list[dict[Path, Any]]:
+        return [
+            self._claude_dirs,
+            self._git_roots,
+            self._indicator_roots,
+            self._project_names,
+            self._projects,
+        ]
+
+    def __len__(self) -> int:
+        """Number of directories with a memoized project resolution."""
+        return len(self._projects)
+
+
+# Shared across all MetadataManager instances in a process by default
+default_project_cache = ProjectResolutionCache()
@@ -5,7 +5,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .frontmatter_reader import read_frontmatter_text
 from .hybrid_config import DirectoryTier, HybridStructureConfig
+from .vault_snapshot import VaultSnapshot
 
 
 class ValidationResult:
@@ -78,39 +80,55 @@ class StructureValidator:
         self.vault_path = vault_path
         self.config = hybrid_config
 
-    def validate_full_structure(self) -> ValidationResult:
-        """Perform comprehensive structure validation."""
+    def validate_full_structure(
+        self, snapshot: VaultSnapshot | None = None
+    ) -> ValidationResult:
+        """Perform comprehensive structure validation.
+
+        Args:
+            snapshot: Pre-computed vault snapshot; the vault is walked once
+                here when not given
+
+        Returns:
+            Validation result with statistics
+        """
         result = ValidationResult()
 
         if not self.vault_path.exists():
             result.add_error(f"Vault directory does not exist: {self.vault_path}")
             return result
 
+        # Every check reads the same single-pass walk of the vault
+        if snapshot is None:
+            snapshot = VaultSnapshot.scan(self.vault_path)
+
         # Core validation checks
-        self._validate_directory_structure(result)
-        self._validate_numbering_consistency(result)
-        self._validate_tier_compliance(result)
-        self._validate_readme_coverage(result)
-        self._validate_metadata_compliance(result)
+        self._validate_directory_structure(result, snapshot)
+        self._validate_numbering_consistency(result, snapshot)
+        self._validate_tier_compliance(result, snapshot)
+        self._validate_readme_coverage(result, snapshot)
+        self._validate_metadata_compliance(result, snapshot)
 
         # Generate statistics
-        stats = self._generate_statistics()
+        stats = self._generate_statistics(snapshot)
         result.set_statistics(stats)
 
         return result
 
-    def _validate_directory_structure(self, result: ValidationResult) -> None:
+    def _validate_directory_structure(
+        self, result: ValidationResult, snapshot: VaultSnapshot
+    ) -> None:
         """Validate directory structure against configuration."""
         expected_structure = self.config.get_default_structure()
 
         # Validate system directories
         if "system_dirs" in expected_structure:
             for dir_name, _description in expected_structure["system_dirs"].items():
-                dir_path = self.vault_path / dir_name
+                is_dir = snapshot.top_level_entries.get(dir_name)
 
-                if not dir_path.exists():
+                if is_dir is None:
                     result.add_error(f"Missing system directory: {dir_name}")
-                elif not dir_path.is_dir():
+                elif not is_dir:
                     result.add_error(f"System path is not a directory: {dir_name}")
                 else:
                     result.add_info(f"System directory verified: {dir_name}")
@@ -118,11 +136,11 @@ class StructureValidator:
         # Validate core directories
         if "core_dirs" in expected_structure:
             for dir_name, _description in expected_structure["core_dirs"].items():
-                dir_path = self.vault_path / dir_name
+                is_dir = snapshot.top_level_entries.get(dir_name)
 
-                if not dir_path.exists():
+                if is_dir is None:
                     result.add_error(f"Missing core directory: {dir_name}")
-                elif not dir_path.is_dir():
+                elif not is_dir:
                     result.add_error(f"Core path is not a directory: {dir_name}")
                 else:
                     result.add_info(f"Core directory verified: {dir_name}")
@@ -130,27 +148,28 @@ class StructureValidator:
         # Validate auxiliary directories
         if "auxiliary_dirs" in expected_structure:
             for dir_name, _description in expected_structure["auxiliary_dirs"].items():
-                dir_path = self.vault_path / dir_name
+                is_dir = snapshot.top_level_entries.get(dir_name)
 
-                if not dir_path.exists():
+                if is_dir is None:
                     result.add_warning(f"Missing auxiliary directory: {dir_name}")
-                elif not dir_path.is_dir():
+                elif not is_dir:
                     result.add_warning(f"Auxiliary path is not a directory: {dir_name}")
                 else:
                     result.add_info(f"Auxiliary directory verified: {dir_name}")
 
         # Check for unexpected directories
-        self._check_unexpected_directories(result, expected_structure)
+        self._check_unexpected_directories(result, expected_structure, snapshot)
 
-    def _validate_numbering_consistency(self, result: ValidationResult) -> None:
+    def _validate_numbering_consistency(
+        self, result: ValidationResult, snapshot: VaultSnapshot
+    ) -> None:
         """Validate numbering system consistency."""
         numbered_dirs = []
 
-        for item in self.vault_path.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                classification = self.config.classify_directory(item.name)
-                if classification.number is not None:
-                    numbered_dirs.append((item.name, classification.number))
+        for directory in snapshot.content_directories():
+            classification = self.config.classify_directory(directory.name)
+            if classification.number is not None:
+                numbered_dirs.append((directory.name, classification.number))
 
         # Sort by number
         numbered_dirs.sort(key=lambda x: x[1])
@@ -212,33 +231,31 @@ class StructureValidator:
                 f"Numbering doesn't start from 00, starts from {numbers[0]:02d}"
             )
 
-    def _validate_tier_compliance(self, result: ValidationResult) -> None:
+    def _validate_tier_compliance(
+        self, result: ValidationResult, snapshot: VaultSnapshot
+    ) -> None:
         """Validate directory tier compliance."""
         tier_counts = dict.fromkeys(DirectoryTier, 0)
 
-        for item in self.vault_path.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                classification = self.config.classify_directory(item.name)
-                tier_counts[classification.tier] += 1
-
-                # Validate tier-specific rules
-                if classification.tier == DirectoryTier.SYSTEM:
-                    if not item.name.startswith("_"):
-                        result.add_error(
-                            f"System directory doesn't start with '_': {item.name}"
-                        )
-
-                elif classification.tier == DirectoryTier.CORE:
-                    if classification.number is None:
-                        result.add_error(
-                            f"Core directory missing number prefix: {item.name}"
-                        )
-
-                elif classification.tier == DirectoryTier.AUXILIARY:
-                    if item.name.startswith("_") or classification.number is not None:
-                        result.add_warning(
-                            f"Auxiliary directory has unexpected prefix: {item.name}"
-                        )
+        for directory in snapshot.content_directories():
+            name = directory.name
+            classification = self.config.classify_directory(name)
+            tier_counts[classification.tier] += 1
+
+            # Validate tier-specific rules
+            if classification.tier == DirectoryTier.SYSTEM:
+                if not name.startswith("_"):
+                    result.add_error(f"System directory doesn't start with '_': {name}")
+
+            elif classification.tier == DirectoryTier.CORE:
+                if classification.number is None:
+                    result.add_error(f"Core directory missing number prefix: {name}")
+
+            elif classification.tier == DirectoryTier.AUXILIARY:
+                if name.startswith("_") or classification.number is not None:
+                    result.add_warning(
+                        f"Auxiliary directory has unexpected prefix: {name}"
+                    )
 
         # Report tier distribution
         result.add_info(
@@ -247,15 +264,15 @@ class StructureValidator:
             f"Auxiliary: {tier_counts[DirectoryTier.AUXILIARY]}"
         )
 
-    def _validate_readme_coverage(self, result: ValidationResult) -> None:
+    def _validate_readme_coverage(
+        self, result: ValidationResult, snapshot: VaultSnapshot
+    ) -> None:
         """Validate README.md coverage."""
-        missing_readmes = []
-
-        for item in self.vault_path.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                readme_path = item / "README.md"
-                if not readme_path.exists():
-                    missing_readmes.append(item.name)
+        missing_readmes = [
+            directory.name
+            for directory in snapshot.content_directories()
+            if not directory.has_readme
+        ]
 
         if missing_readmes:
             result.add_warning(
@@ -264,9 +281,11 @@ class StructureValidator:
         else:
             result.add_info("All directories have README.md files")
 
-    def _validate_metadata_compliance(self, result: ValidationResult) -> None:
+    def _validate_metadata_compliance(
+        self, result: ValidationResult, snapshot: VaultSnapshot
+    ) -> None:
         """Validate metadata compliance in files."""
-        markdown_files = list(self.vault_path.rglob("*.md"))
+        markdown_files = snapshot.markdown_files
         files_without_frontmatter = 0
 
         for md_file in markdown_files:
@@ -274,15 +293,12 @@ class StructureValidator:
                 continue  # Skip README files
 
             try:
-                content = md_file.read_text(encoding="utf-8")
-                if not content.startswith("---"):
+                if read_frontmatter_text(md_file) is None:
                     files_without_frontmatter += 1
             except (OSError, UnicodeDecodeError):
                 result.add_warning(f"Could not read file for metadata check: {md_file}")
 
-        total_content_files = len(markdown_files) - len(
-            list(self.vault_path.rglob("README.md"))
-        )
+        total_content_files = len(markdown_files) - len(snapshot.readme_files)
 
         if total_content_files > 0:
             metadata_coverage = (
@@ -302,7 +318,10 @@ class StructureValidator:
                 )
 
     def _check_unexpected_directories(
-        self, result: ValidationResult, expected_structure: dict[str, dict[str, str]]
+        self,
+        result: ValidationResult,
+        expected_structure: dict[str, dict[str, str]],
+        snapshot: VaultSnapshot,
     ) -> None:
         """Check for unexpected directories in vault root."""
         expected_names: set[str] = set()
@@ -313,14 +332,16 @@ class StructureValidator:
         # Add standard allowed directories
         expected_names.update([".obsidian", ".git"])
 
-        actual_dirs = {d.name for d in self.vault_path.iterdir() if d.is_dir()}
+        actual_dirs = set(snapshot.directories)
         unexpected = actual_dirs - expected_names
 
         if unexpected:
             result.add_warning(f"Unexpected directories found: {', '.join(unexpected)}")
 
-    def _generate_statistics(self) -> dict[str, Any]:
-        """Generate structure statistics."""
+    def _generate_statistics(
+        self, snapshot: VaultSnapshot | None = None
+    ) -> dict[str, Any]:
+        """Generate structure statistics from a vault snapshot."""
         tier_distribution: dict[str, int] = {tier.value: 0 for tier in DirectoryTier}
 
         stats: dict[str, Any] = {
@@ -337,32 +358,24 @@ class StructureValidator:
         if not self.vault_path.exists():
             return stats
 
-        for item in self.vault_path.rglob("*"):
-            if item.is_file():
-                stats["total_files"] += 1
-                if item.suffix == ".md":
-                    stats["markdown_files"] += 1
-                    if item.name == "README.md":
-                        stats["readme_files"] += 1
-
-        for item in self.vault_path.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                stats["total_directories"] += 1
-
-                # Count tier distribution
-                classification = self.config.classify_directory(item.name)
-                stats["tier_distribution"][classification.tier.value] += 1
-
-                # Find largest directory
-                try:
-                    dir_size = sum(
-                        f.stat().st_size for f in item.rglob("*") if f.is_file()
-                    )
-                    if dir_size > stats["largest_directory_size"]:
-                        stats["largest_directory_size"] = dir_size
-                        stats["largest_directory"] = item.name
-                except OSError:
-                    pass
+        if snapshot is None:
+            snapshot = VaultSnapshot.scan(self.vault_path)
+
+        stats["total_files"] = snapshot.total_files
+        stats["markdown_files"] = snapshot.suffix_counts[".md"]
+        stats["readme_files"] = len(snapshot.readme_files)
+
+        for directory in snapshot.content_directories():
+            stats["total_directories"] += 1
+
+            # Count tier distribution
+            classification = self.config.classify_directory(directory.name)
+            stats["tier_distribution"][classification.tier.value] += 1
+
+            # Find largest directory
+            if directory.total_size > stats["largest_directory_size"]:
+                stats["largest_directory_size"] = directory.total_size
+                stats["largest_directory"] = directory.name
 
         return stats
 
@@ -376,9 +389,18 @@ class StructureHealthMonitor:
         self.validator = StructureValidator(vault_path, hybrid_config)
         self.health_log_path = vault_path / ".ckc" / "health_log.json"
 
-    def run_health_check(self) -> ValidationResult:
-        """Run health check and log results."""
-        result = self.validator.validate_full_structure()
+    def run_health_check(
+        self, snapshot: VaultSnapshot | None = None
+    ) -> ValidationResult:
+        """Run health check and log results.
+
+        Args:
+            snapshot: Pre-computed vault snapshot to validate against
+
+        Returns:
+            Validation result of the health check
+        """
+        result = self.validator.validate_full_structure(snapshot)
 
         # Log results
         self._log_health_result(result)
@@ -0,0 +1,59 @@
+"""Script-aware tokenizer for full-text search over English and Japanese."""
+
+import re
+import unicodedata
+
+# Scripts indexed as character bigrams, since words are not separated by
+# spaces (Hangul is included as in common CJK analyzers)
+CJK_CHARACTERS = (
+    "\u3005"  # 々
+    "\u3040-\u30ff"  # Hiragana, Katakana
+    "\u31f0-\u31ff"  # Katakana phonetic extensions
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"  # CJK ideographs
+    "\uac00-\ud7af"  # Hangul syllables
+)
+
+_TOKEN_PATTERN = re.compile(
+    rf"(?P<cjk>[{CJK_CHARACTERS}]+)|(?P<word>[^\W_{CJK_CHARACTERS}]+)"
+)
+
+ENGLISH_STOPWORDS = frozenset(
+    """
+    a an and are as at be but by can do does for from has have how if in into
+    is it its not of on or that the their then there these this to was were
+    what when where which while who will with you your
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into search terms.
+
+    Text is NFKC-normalized and lowercased, so full-width and half-width
+    forms match. Runs of Latin letters and digits become words, with
+    single characters and English stopwords dropped. Japanese (and other
+    CJK) runs have no word boundaries and are split into overlapping
+    character bigrams; a lone CJK character is kept as is. Documents and
+    queries go through the same function, so mixed-language notes need no
+    per-document language switch.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in document order, with repeats
+    """
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    tokens: list[str] = []
+
+    for match in _TOKEN_PATTERN.finditer(normalized):
+        run = match.group()
+        if match.lastgroup == "word":
+            if len(run) > 1 and run not in ENGLISH_STOPWORDS:
+                tokens.append(run)
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+
+    return tokens
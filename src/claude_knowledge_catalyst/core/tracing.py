@@ -0,0 +1,227 @@
+"""Hierarchical span tracing with Chrome/Perfetto trace export."""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Finished spans kept per tracer; older ones are dropped beyond this
+DEFAULT_MAX_SPANS = 200_000
+
+
+@dataclass
+class Span:
+    """A timed, named region of work."""
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    thread_id: int
+    start_ns: int
+    end_ns: int | None = None
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ns(self) -> int:
+        """Elapsed time, up to now while the span is still open."""
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return end_ns - self.start_ns
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "ckc_current_span", default=None
+)
+
+
+class Tracer:
+    """Collects nested spans and exports them as a Chrome trace.
+
+    The parent of a new span is the innermost open span of the current
+    context, so spans nest across function boundaries without being passed
+    around. Threads started through ``contextvars.copy_context().run`` keep
+    their caller's span as parent.
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS) -> None:
+        """Initialize tracer.
+
+        Args:
+            max_spans: Number of finished spans kept in memory
+        """
+        self.max_spans = max_spans
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+        self.origin_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread_names: dict[int, str] = {}
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        """Record a span around the enclosed block.
+
+        Args:
+            name: Span name, e.g. ``sync.extract``
+            **args: Extra attributes shown with the span
+
+        Yields:
+            The open span; attributes may be added to ``span.args``
+        """
+        parent = _current_span.get()
+        thread = threading.current_thread()
+        current = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            thread_id=thread.ident or 0,
+            start_ns=time.perf_counter_ns(),
+            args=args,
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        finally:
+            current.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            self._finish(current, thread.name)
+
+    def _finish(self, span: Span, thread_name: str) -> None:
+        """Store a finished span."""
+        with self._lock:
+            self._thread_names.setdefault(span.thread_id, thread_name)
+            if len(self.spans) >= self.max_spans:
+                self.dropped_spans += 1
+                return
+            self.spans.append(span)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace event document (also read by Perfetto).
+
+        Returns:
+            Trace with one complete (``"X"``) event per span, timestamps in
+            microseconds since the tracer was created
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+            thread_names = dict(self._thread_names)
+
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in thread_names.items()
+        ]
+        for span in sorted(spans, key=lambda s: s.start_ns):
+            args = {key: _json_safe(value) for key, value in span.args.items()}
+            args["span_id"] = span.span_id
+            if span.parent_id is not None:
+                args["parent_id"] = span.parent_id
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (span.start_ns - self.origin_ns) / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped_spans},
+        }
+
+    def export_chrome_trace(self, path: Path) -> Path:
+        """Write the trace as JSON for chrome://tracing or ui.perfetto.dev.
+
+        Args:
+            path: Output file
+
+        Returns:
+            The written path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+
+_active_tracer: Tracer | None = None
+
+
+def start_tracing(tracer: Tracer | None = None) -> Tracer:
+    """Make a tracer active for ``trace_span`` calls.
+
+    Args:
+        tracer: Tracer to activate; a new one is created if None
+
+    Returns:
+        The active tracer
+    """
+    global _active_tracer
+    _active_tracer = tracer or Tracer()
+    return _active_tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Deactivate tracing.
+
+    Returns:
+        The tracer that was active, if any
+    """
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+def get_tracer() -> Tracer | None:
+    """The active tracer, or None when tracing is off."""
+    return _active_tracer
+
+
+@contextmanager
+def trace_span(name: str, **args: Any) -> Iterator[Span | None]:
+    """Record a span with the active tracer; a no-op when tracing is off.
+
+    Args:
+        name: Span name
+        **args: Extra attributes shown with the span
+
+    Yields:
+        The open span, or None when tracing is off
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        yield None
+        return
+
+    with tracer.span(name, **args) as span:
+        yield span
+
+
+def current_span() -> Span | None:
+    """The innermost open span of the current context."""
+    return _current_span.get()
+
+
+def _json_safe(value: Any) -> Any:
+    """Span attribute as a JSON-serializable value."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
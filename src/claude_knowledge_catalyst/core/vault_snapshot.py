@@ -0,0 +1,156 @@
+"""Single-pass snapshot of a vault directory tree."""
+
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class SnapshotFile:
+    """A file found while walking the vault."""
+
+    path: Path
+    size: int
+    # Name of the top-level vault entry containing the file
+    top_level: str
+
+
+@dataclass
+class DirectoryAggregate:
+    """Totals for one top-level directory, including all subdirectories."""
+
+    name: str
+    file_count: int = 0
+    total_size: int = 0
+    markdown_files: int = 0
+    has_readme: bool = False
+
+
+@dataclass
+class VaultSnapshot:
+    """Everything structure validation needs, gathered in one walk.
+
+    The tree is traversed once with ``os.scandir``. Symlinked directories are
+    listed but not descended into, matching ``Path.rglob``.
+    """
+
+    root: Path
+    files: list[SnapshotFile] = field(default_factory=list)
+    directory_count: int = 0
+    # Top-level entry name -> whether it is a directory
+    top_level_entries: dict[str, bool] = field(default_factory=dict)
+    directories: dict[str, DirectoryAggregate] = field(default_factory=dict)
+    suffix_counts: Counter[str] = field(default_factory=Counter)
+    unreadable: list[Path] = field(default_factory=list)
+
+    @classmethod
+    def scan(cls, root: Path) -> "VaultSnapshot":
+        """Walk a vault once and collect its snapshot.
+
+        Args:
+            root: Vault directory
+
+        Returns:
+            Snapshot of the vault; empty if the directory does not exist
+        """
+        snapshot = cls(root)
+        if not root.is_dir():
+            return snapshot
+
+        for entry in snapshot._list(root):
+            is_dir = _is_dir(entry)
+            snapshot.top_level_entries[entry.name] = is_dir
+            if is_dir:
+                aggregate = DirectoryAggregate(entry.name)
+                snapshot.directories[entry.name] = aggregate
+                snapshot.directory_count += 1
+                if not entry.is_symlink():
+                    snapshot._walk(Path(entry.path), entry.name, aggregate)
+            else:
+                snapshot._add_file(entry, entry.name, None)
+        return snapshot
+
+    @property
+    def total_files(self) -> int:
+        """Number of files in the vault."""
+        return len(self.files)
+
+    @property
+    def markdown_files(self) -> list[Path]:
+        """Markdown files in the vault."""
+        return [file.path for file in self.files if file.path.suffix == ".md"]
+
+    @property
+    def readme_files(self) -> list[Path]:
+        """README.md files in the vault."""
+        return [file.path for file in self.files if file.path.name == "README.md"]
+
+    def content_directories(self) -> list[DirectoryAggregate]:
+        """Top-level directories that are not hidden, in listing order."""
+        return [
+            aggregate
+            for name, aggregate in self.directories.items()
+            if not name.startswith(".")
+        ]
+
+    def _walk(
+        self, directory: Path, top_level: str, aggregate: DirectoryAggregate
+    ) -> None:
+        """Recursively record everything below a top-level directory."""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            for entry in self._list(current):
+                if _is_dir(entry):
+                    self.directory_count += 1
+                    if entry.name == "README.md" and current == directory:
+                        aggregate.has_readme = True
+                    if not entry.is_symlink():
+                        stack.append(Path(entry.path))
+                    continue
+
+                if entry.name == "README.md" and current == directory:
+                    aggregate.has_readme = True
+                self._add_file(entry, top_level, aggregate)
+
+    def _add_file(
+        self,
+        entry: os.DirEntry[str],
+        top_level: str,
+        aggregate: DirectoryAggregate | None,
+    ) -> None:
+        """Record a file entry (broken symlinks and specials are skipped)."""
+        try:
+            if not entry.is_file():
+                return
+            size = entry.stat().st_size
+        except OSError:
+            self.unreadable.append(Path(entry.path))
+            return
+
+        path = Path(entry.path)
+        self.files.append(SnapshotFile(path, size, top_level))
+        self.suffix_counts[path.suffix] += 1
+        if aggregate is not None:
+            aggregate.file_count += 1
+            aggregate.total_size += size
+            if path.suffix == ".md":
+                aggregate.markdown_files += 1
+
+    def _list(self, directory: Path) -> list[os.DirEntry[str]]:
+        """List a directory, recording it as unreadable on failure."""
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            self.unreadable.append(directory)
+            return []
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    """Whether an entry is a directory, following symlinks."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
@@ -1,5 +1,7 @@
 """File system watcher for monitoring .claude directory changes."""
 
+import hashlib
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -10,7 +12,15 @@ from watchdog.observers import Observer
 
 from .claude_md_processor import ClaudeMdProcessor
 from .config import WatchConfig
+from .event_dispatcher import CoalescingEventDispatcher, FileEvent
+from .expiring_cache import ExpiringCache
 from .metadata import MetadataManager
+from .project_resolver import RESOLUTION_SENSITIVE_NAMES
+from .tracing import trace_span
+
+# Self-write records outlive any echo event, which arrives within one
+# debounce window plus the dispatcher's maximum deferral
+SELF_WRITE_TTL_SECONDS = 300.0
 
 
 class KnowledgeFileEventHandler(FileSystemEventHandler):
@@ -21,6 +31,7 @@ class KnowledgeFileEventHandler(FileSystemEventHandler):
         callback: Callable[[str, Path], None],
         watch_config: WatchConfig,
         metadata_manager: MetadataManager,
+        dispatcher: CoalescingEventDispatcher | None = None,
     ):
         """Initialize event handler.
 
@@ -28,12 +39,21 @@ class KnowledgeFileEventHandler(FileSystemEventHandler):
             callback: Function to call when files change (event_type, file_path)
             watch_config: Configuration for file watching
             metadata_manager: Manager for metadata operations
+            dispatcher: Queue that debounces and batches events off the
+                observer thread; without one the callback runs synchronously
         """
         super().__init__()
         self.callback = callback
         self.watch_config = watch_config
         self.metadata_manager = metadata_manager
-        self.debounce_cache: dict[str, float] = {}
+        self.dispatcher = dispatcher
+        # Leading-edge debounce for handlers without a dispatcher only; with
+        # one, debounce state lives in the dispatcher's bounded pending queue.
+        # Only entries younger than the debounce window can suppress an event
+        self.debounce_cache: ExpiringCache[str, float] = ExpiringCache(
+            max_entries=watch_config.debounce_cache_size,
+            ttl_seconds=watch_config.debounce_seconds,
+        )
         # Initialize CLAUDE.md processor
         self.claude_md_processor = ClaudeMdProcessor(
             sections_exclude=watch_config.claude_md_sections_exclude
@@ -42,34 +62,55 @@ class KnowledgeFileEventHandler(FileSystemEventHandler):
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
         if not event.is_directory:
-            self._handle_file_event("modified", Path(str(event.src_path)))
+            src_path = Path(str(event.src_path))
+            if src_path.name == "project.yaml":
+                self._invalidate_project_cache(src_path)
+            self._handle_file_event("modified", src_path)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
+        self._invalidate_project_cache(Path(str(event.src_path)), event.is_directory)
         if not event.is_directory:
             self._handle_file_event("created", Path(str(event.src_path)))
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion events."""
+        self._invalidate_project_cache(Path(str(event.src_path)), event.is_directory)
         if not event.is_directory:
             self._handle_file_event("deleted", Path(str(event.src_path)))
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file move events."""
+        self._invalidate_project_cache(Path(str(event.src_path)), event.is_directory)
+        if hasattr(event, "dest_path"):
+            self._invalidate_project_cache(
+                Path(str(event.dest_path)), event.is_directory
+            )
         if not event.is_directory and hasattr(event, "dest_path"):
             self._handle_file_event("moved", Path(str(event.dest_path)))
 
+    def _invalidate_project_cache(self, path: Path, is_directory: bool = True) -> None:
+        """Drop memoized project detection affected by a structural change."""
+        if is_directory or path.name in RESOLUTION_SENSITIVE_NAMES:
+            self.metadata_manager.invalidate_project_cache(path)
+
     def _handle_file_event(self, event_type: str, file_path: Path) -> None:
         """Handle file system events with debouncing."""
         if not self._should_process_file(file_path):
             return
 
-        # Debouncing logic
+        # Queue for trailing-edge debounce and batched processing
+        if self.dispatcher is not None:
+            self.dispatcher.submit(event_type, file_path)
+            return
+
+        # Synchronous fallback: leading-edge debouncing on the observer thread
         file_key = str(file_path)
         current_time = time.time()
 
-        if file_key in self.debounce_cache:
-            time_diff = current_time - self.debounce_cache[file_key]
+        last_seen = self.debounce_cache.get(file_key)
+        if last_seen is not None:
+            time_diff = current_time - last_seen
             if time_diff < self.watch_config.debounce_seconds:
                 return
 
@@ -112,6 +153,8 @@ class KnowledgeWatcher:
         watch_config: WatchConfig,
         metadata_manager: MetadataManager,
         sync_callback: Callable[[str, Path], None] | None = None,
+        batch_sync_callback: Callable[[list[FileEvent]], None] | None = None,
+        max_workers: int = 2,
     ):
         """Initialize knowledge watcher.
 
@@ -119,15 +162,26 @@ class KnowledgeWatcher:
             watch_config: Configuration for file watching
             metadata_manager: Manager for metadata operations
             sync_callback: Callback function for sync operations
+            batch_sync_callback: Callback receiving every (event_type, path)
+                of a debounced batch at once; replaces per-file sync_callback
+            max_workers: Worker threads processing event batches
         """
         self.watch_config = watch_config
         self.metadata_manager = metadata_manager
         self.sync_callback = sync_callback or self._default_sync_callback
+        self.batch_sync_callback = batch_sync_callback
         self.observer = Observer()
+        self.dispatcher = CoalescingEventDispatcher(
+            self._handle_file_changes,
+            watch_config.debounce_seconds,
+            max_workers=max_workers,
+            max_pending=watch_config.debounce_cache_size,
+        )
         self.event_handler = KnowledgeFileEventHandler(
             self._handle_file_change,
             watch_config,
             metadata_manager,
+            dispatcher=self.dispatcher,
         )
         # Initialize CLAUDE.md processor
         self.claude_md_processor = ClaudeMdProcessor(
@@ -135,6 +189,15 @@ class KnowledgeWatcher:
         )
         self.is_running = False
         self.watched_paths: set[Path] = set()
+        # (mtime_ns, size, md5) of files last written by this watcher. Not
+        # size-capped: evicting a record before its echo arrives would let the
+        # echo through, and records leave once consumed or expired anyway
+        self._self_writes: ExpiringCache[str, tuple[int, int, str]] = ExpiringCache(
+            max_entries=None,
+            ttl_seconds=max(SELF_WRITE_TTL_SECONDS, watch_config.debounce_seconds * 20),
+        )
+        self._self_writes_lock = threading.Lock()
+        self.suppressed_self_writes = 0
 
     def start(self) -> None:
         """Start watching for file changes."""
@@ -145,6 +208,7 @@ class KnowledgeWatcher:
         for watch_path in self.watch_config.watch_paths:
             self.add_watch_path(watch_path)
 
+        self.dispatcher.start()
         self.observer.start()
         self.is_running = True
         print(f"Started watching {len(self.watched_paths)} paths")
@@ -156,6 +220,8 @@ class KnowledgeWatcher:
 
         self.observer.stop()
         self.observer.join()
+        # Process whatever is still inside its debounce window
+        self.dispatcher.stop(flush=True)
         self.is_running = False
         print("Stopped file watching")
 
@@ -204,18 +270,48 @@ class KnowledgeWatcher:
 
     def _handle_file_change(self, event_type: str, file_path: Path) -> None:
         """Handle file change events."""
+        self._refresh_metadata(event_type, file_path)
+
+        # Trigger sync callback
+        self.sync_callback(event_type, file_path)
+
+    def _handle_file_changes(self, events: list[FileEvent]) -> None:
+        """Handle a debounced batch of file change events."""
+        # Echoes of our own metadata writes need neither a refresh nor a sync
+        events = [
+            (event_type, file_path)
+            for event_type, file_path in events
+            if not self._is_self_write(file_path)
+        ]
+        if not events:
+            return
+
+        if self.batch_sync_callback is None:
+            for event_type, file_path in events:
+                try:
+                    self._handle_file_change(event_type, file_path)
+                except Exception as e:
+                    print(f"Error processing file event for {file_path}: {e}")
+            return
+
+        with trace_span("watch.batch", events=len(events)):
+            with trace_span("watch.refresh"):
+                for event_type, file_path in events:
+                    self._refresh_metadata(event_type, file_path)
+
+            # One sync call covers the whole batch
+            self.batch_sync_callback(events)
+
+    def _refresh_metadata(self, event_type: str, file_path: Path) -> None:
+        """Log a change and update metadata of files that still exist."""
         print(f"File {event_type}: {file_path}")
 
-        # Update metadata for existing files
         if event_type in ["modified", "created"] and file_path.exists():
             try:
                 self._update_file_metadata(file_path)
             except Exception as e:
                 print(f"Error updating metadata for {file_path}: {e}")
 
-        # Trigger sync callback
-        self.sync_callback(event_type, file_path)
-
     def _update_file_metadata(self, file_path: Path) -> None:
         """Update metadata for a file."""
         if file_path.suffix.lower() not in [".md", ".txt"]:
@@ -254,11 +350,55 @@ class KnowledgeWatcher:
                 metadata.updated = datetime.now()
 
             # Update metadata in file
-            self.metadata_manager.update_file_metadata(file_path, metadata)
+            written = self.metadata_manager.update_file_metadata(
+                file_path,
+                metadata,
+                only_if_changed=self.watch_config.metadata_refresh == "on_change",
+            )
+            if written:
+                self._record_self_write(file_path)
 
         except Exception as e:
             print(f"Error updating metadata for {file_path}: {e}")
 
+    def _record_self_write(self, file_path: Path) -> None:
+        """Remember a file this watcher just wrote so its echo is ignored."""
+        try:
+            stat = file_path.stat()
+            checksum = hashlib.md5(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return
+
+        with self._self_writes_lock:
+            self._self_writes[str(file_path)] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                checksum,
+            )
+
+    def _is_self_write(self, file_path: Path) -> bool:
+        """Whether a file still holds exactly what this watcher last wrote.
+
+        The record is consumed, so any later change is processed normally.
+        """
+        with self._self_writes_lock:
+            signature = self._self_writes.pop(str(file_path), None)
+        if signature is None:
+            return False
+
+        try:
+            stat = file_path.stat()
+            if (stat.st_mtime_ns, stat.st_size) != signature[:2]:
+                return False
+            if hashlib.md5(file_path.read_bytes()).hexdigest() != signature[2]:
+                return False
+        except OSError:
+            return False
+
+        with self._self_writes_lock:
+            self.suppressed_self_writes += 1
+        return True
+
     def _default_sync_callback(self, event_type: str, file_path: Path) -> None:
         """Default sync callback that just logs events."""
         print(f"Sync trigger: {event_type} - {file_path}")
@@ -299,6 +439,10 @@ class KnowledgeWatcher:
             "file_patterns": self.watch_config.file_patterns,
             "ignore_patterns": self.watch_config.ignore_patterns,
             "debounce_seconds": self.watch_config.debounce_seconds,
+            "event_queue": self.dispatcher.get_stats(),
+            "metadata_refresh": self.watch_config.metadata_refresh,
+            "suppressed_self_writes": self.suppressed_self_writes,
+            "self_write_cache": self._self_writes.get_stats(),
         }
 
     def __enter__(self) -> "KnowledgeWatcher":
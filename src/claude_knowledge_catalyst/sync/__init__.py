@@ -1,5 +1,11 @@
 """Synchronization functionality for knowledge management tools."""
 
 from .obsidian import ObsidianSyncManager, ObsidianVaultManager
+from .pipeline import MultiTargetSyncPipeline, TargetSyncResult
 
-__all__ = ["ObsidianSyncManager", "ObsidianVaultManager"]
+__all__ = [
+    "MultiTargetSyncPipeline",
+    "ObsidianSyncManager",
+    "ObsidianVaultManager",
+    "TargetSyncResult",
+]
@@ -0,0 +1,207 @@
+"""Per-vault sync manifest for incremental synchronization."""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+MANIFEST_DIR_NAME = ".ckc"
+MANIFEST_FILE_NAME = "sync_manifest.json"
+
+# Bump when rendering or the stored representation changes
+SYNC_MANIFEST_VERSION = 2
+
+
+@dataclass
+class ManifestEntry:
+    """What was last synced for one source file."""
+
+    source_mtime_ns: int
+    source_size: int
+    source_checksum: str
+    target: str
+    output_hash: str
+    target_mtime_ns: int
+    target_size: int
+    project: str | None = None
+    # Project auto-detected from .claude/project.yaml, git root or indicators
+    detected_project: str | None = None
+
+    def source_unchanged(self, stat: os.stat_result) -> bool:
+        """Whether the source still has the recorded modification time and size."""
+        return (
+            self.source_mtime_ns == stat.st_mtime_ns
+            and self.source_size == stat.st_size
+        )
+
+    def target_intact(self) -> bool:
+        """Whether the synced file is still in place and untouched."""
+        try:
+            stat = Path(self.target).stat()
+        except OSError:
+            return False
+        return (
+            self.target_mtime_ns == stat.st_mtime_ns
+            and self.target_size == stat.st_size
+        )
+
+
+@dataclass
+class SyncSummary:
+    """Counts reported by an incremental directory sync."""
+
+    updated: int = 0
+    skipped: int = 0
+    removed: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Summary counts as a dictionary."""
+        return {
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "removed": self.removed,
+            "failed": self.failed,
+        }
+
+
+class SyncManifest:
+    """JSON manifest mapping source files to their synced vault output.
+
+    Entries are keyed by absolute source path and record the source checksum,
+    the target path and a hash of the rendered output, so a sync run can skip
+    unchanged sources without reading them and avoid rewriting targets whose
+    content would be byte-identical.
+    """
+
+    def __init__(self, manifest_path: Path, fingerprint: str) -> None:
+        """Initialize sync manifest.
+
+        Args:
+            manifest_path: Location of the manifest JSON file
+            fingerprint: Identifies the rendering setup; entries written with
+                a different fingerprint are discarded
+        """
+        self.manifest_path = manifest_path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, ManifestEntry] = {}
+        self._dirty = False
+
+    @classmethod
+    def for_vault(cls, vault_path: Path, fingerprint: str) -> "SyncManifest":
+        """Load the manifest stored under ``<vault>/.ckc/``."""
+        manifest = cls(vault_path / MANIFEST_DIR_NAME / MANIFEST_FILE_NAME, fingerprint)
+        manifest.load()
+        return manifest
+
+    @staticmethod
+    def key(source_path: Path) -> str:
+        """Manifest key for a source path."""
+        return os.path.abspath(source_path)
+
+    def load(self) -> None:
+        """Read entries from disk, starting empty if missing or stale."""
+        self.entries = {}
+        self._dirty = False
+
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(
+                f"Warning: Ignoring unreadable sync manifest {self.manifest_path}: {e}"
+            )
+            return
+
+        if (
+            data.get("version") != SYNC_MANIFEST_VERSION
+            or data.get("fingerprint") != self.fingerprint
+        ):
+            # Rendering changed since the last run, so everything is re-synced
+            self._dirty = True
+            return
+
+        for source, entry in data.get("entries", {}).items():
+            try:
+                self.entries[source] = ManifestEntry(**entry)
+            except TypeError:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically if it changed."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": SYNC_MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "entries": {
+                source: asdict(entry) for source, entry in sorted(self.entries.items())
+            },
+        }
+
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.manifest_path.parent, prefix=".sync_manifest-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1)
+                os.replace(temp_path, self.manifest_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not save sync manifest {self.manifest_path}: {e}")
+            return
+
+        self._dirty = False
+
+    def get(self, source_path: Path) -> ManifestEntry | None:
+        """Get the entry for a source file."""
+        return self.entries.get(self.key(source_path))
+
+    def set(self, source_path: Path, entry: ManifestEntry) -> None:
+        """Record the entry for a source file."""
+        self.entries[self.key(source_path)] = entry
+        self._dirty = True
+
+    def pop(self, source: str) -> ManifestEntry | None:
+        """Remove and return the entry stored under a manifest key."""
+        entry = self.entries.pop(source, None)
+        if entry is not None:
+            self._dirty = True
+        return entry
+
+    def sources_under(self, root: Path) -> list[str]:
+        """Manifest keys for sources located under a directory."""
+        prefix = self.key(root).rstrip(os.sep) + os.sep
+        return [source for source in self.entries if source.startswith(prefix)]
+
+    def __len__(self) -> int:
+        """Number of tracked source files."""
+        return len(self.entries)
+
+
+@dataclass
+class SyncPlan:
+    """Work decided by the manifest before any metadata is extracted."""
+
+    source_dir: Path
+    project_name: str | None
+    manifest: SyncManifest
+    md_files: list[Path]
+    # (source, stat, checksum) for files that must be rendered again
+    pending: list[tuple[Path, os.stat_result, str]] = field(default_factory=list)
+    results: dict[str, bool] = field(default_factory=dict)
+    summary: SyncSummary = field(default_factory=SyncSummary)
+
+    @property
+    def pending_paths(self) -> list[Path]:
+        """Source files that need metadata extraction."""
+        return [source for source, _, _ in self.pending]
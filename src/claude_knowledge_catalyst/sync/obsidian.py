@@ -1,12 +1,21 @@
 """Obsidian vault synchronization functionality."""
 
+import hashlib
+import json
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 from ..core.config import SyncTarget
-from ..core.metadata import KnowledgeMetadata, MetadataManager
+from ..core.metadata import (
+    KnowledgeMetadata,
+    MetadataExtractionResult,
+    MetadataManager,
+)
+from ..core.tracing import trace_span
 from ..obsidian.query_builder import generate_obsidian_queries_file
 from ..templates.tag_centered_templates import TagCenteredTemplateManager
+from .manifest import ManifestEntry, SyncManifest, SyncPlan, SyncSummary
 
 
 class ObsidianVaultManager:
@@ -22,6 +31,7 @@ class ObsidianVaultManager:
         self.vault_path = Path(vault_path)
         self.metadata_manager = metadata_manager
         self.template_manager = TagCenteredTemplateManager()
+        self.last_sync_summary = SyncSummary()
 
         # Pure tag-centered minimal directory structure
         self.vault_structure = {
@@ -64,12 +74,18 @@ class ObsidianVaultManager:
             print(f"Error initializing vault: {e}")
             return False
 
-    def sync_file(self, source_path: Path, project_name: str | None = None) -> bool:
+    def sync_file(
+        self,
+        source_path: Path,
+        project_name: str | None = None,
+        metadata: KnowledgeMetadata | None = None,
+    ) -> bool:
         """Sync a single file to the Obsidian vault.
 
         Args:
             source_path: Path to the source file
             project_name: Name of the project (for organization)
+            metadata: Already extracted metadata for the file, if available
 
         Returns:
             True if sync successful, False otherwise
@@ -80,19 +96,10 @@ class ObsidianVaultManager:
                 return False
 
             # Extract metadata to determine target location
-            metadata = self.metadata_manager.extract_metadata_from_file(source_path)
-            target_path = self._determine_target_path(
-                metadata, source_path, project_name
-            )
-
-            # Ensure target directory exists
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file with enhanced metadata
-            enhanced_content = self._enhance_content_for_obsidian(
-                source_path, metadata, project_name
-            )
-            target_path.write_text(enhanced_content, encoding="utf-8")
+            if metadata is None:
+                metadata = self.metadata_manager.extract_metadata_from_file(source_path)
+            target_path, output = self._render_file(source_path, metadata, project_name)
+            self._write_if_changed(target_path, output)
 
             print(f"Synced: {source_path} -> {target_path}")
             return True
@@ -104,7 +111,13 @@ class ObsidianVaultManager:
     def sync_directory(
         self, source_dir: Path, project_name: str | None = None
     ) -> dict[str, bool]:
-        """Sync an entire directory to the Obsidian vault.
+        """Sync an entire directory to the Obsidian vault incrementally.
+
+        A per-vault manifest records what each source was last synced to.
+        Sources whose size and modification time are unchanged are skipped
+        without being read, targets are only rewritten when the rendered
+        output differs, and targets of deleted sources are removed. Counts
+        are available afterwards in ``last_sync_summary``.
 
         Args:
             source_dir: Path to the source directory
@@ -113,21 +126,242 @@ class ObsidianVaultManager:
         Returns:
             Dictionary mapping file paths to sync results
         """
-        results: dict[str, bool] = {}
+        plan = self.plan_directory_sync(source_dir, project_name)
+        if plan is None:
+            return {}
+
+        # Parse changed files up front so extraction can use every core
+        extractions = self.metadata_manager.extract_metadata_bulk(plan.pending_paths)
+        return self.apply_directory_sync(
+            plan, {extraction.path: extraction for extraction in extractions}
+        )
+
+    def plan_directory_sync(
+        self, source_dir: Path, project_name: str | None = None
+    ) -> SyncPlan | None:
+        """Decide which files of a directory need syncing, using the manifest.
+
+        Args:
+            source_dir: Path to the source directory
+            project_name: Name of the project
+
+        Returns:
+            Sync plan, or None if the source directory does not exist
+        """
+        self.last_sync_summary = SyncSummary()
 
         if not source_dir.exists():
             print(f"Source directory does not exist: {source_dir}")
-            return results
+            return None
+
+        manifest = SyncManifest.for_vault(self.vault_path, self._manifest_fingerprint())
 
         # Find all markdown files
-        md_files = list(source_dir.rglob("*.md"))
+        plan = SyncPlan(
+            source_dir=source_dir,
+            project_name=project_name,
+            manifest=manifest,
+            md_files=list(source_dir.rglob("*.md")),
+        )
+        results = plan.results
+        summary = plan.summary
+
+        for md_file in plan.md_files:
+            try:
+                stat = md_file.stat()
+                entry = manifest.get(md_file)
+                if entry is not None and self._entry_current(
+                    entry, project_name, self._detected_project(md_file)
+                ):
+                    if entry.source_unchanged(stat):
+                        results[str(md_file)] = True
+                        summary.skipped += 1
+                        continue
+
+                    # Touched but not edited: refresh the recorded stat only
+                    checksum = hashlib.md5(md_file.read_bytes()).hexdigest()
+                    if checksum == entry.source_checksum:
+                        entry.source_mtime_ns = stat.st_mtime_ns
+                        entry.source_size = stat.st_size
+                        manifest.set(md_file, entry)
+                        results[str(md_file)] = True
+                        summary.skipped += 1
+                        continue
+                else:
+                    checksum = hashlib.md5(md_file.read_bytes()).hexdigest()
+
+                plan.pending.append((md_file, stat, checksum))
+            except OSError as e:
+                print(f"Error syncing file {md_file}: {e}")
+                results[str(md_file)] = False
+                summary.failed += 1
+
+        return plan
+
+    def apply_directory_sync(
+        self,
+        plan: SyncPlan,
+        extractions: Mapping[Path, MetadataExtractionResult],
+    ) -> dict[str, bool]:
+        """Render and write the files of a sync plan and update the manifest.
 
-        for file_path in md_files:
-            success = self.sync_file(file_path, project_name)
-            results[str(file_path)] = success
+        Args:
+            plan: Plan returned by :meth:`plan_directory_sync`
+            extractions: Extracted metadata for at least the plan's pending files
 
+        Returns:
+            Dictionary mapping file paths to sync results
+        """
+        manifest = plan.manifest
+        project_name = plan.project_name
+        results = plan.results
+        summary = plan.summary
+        self.last_sync_summary = summary
+
+        for md_file, stat, checksum in plan.pending:
+            extraction = extractions.get(md_file)
+            if extraction is None or extraction.metadata is None:
+                error = extraction.error if extraction else "metadata not extracted"
+                print(f"Error syncing file {md_file}: {error}")
+                results[str(md_file)] = False
+                summary.failed += 1
+                continue
+
+            try:
+                target_path, output = self._render_file(
+                    md_file, extraction.metadata, project_name
+                )
+                written = self._write_if_changed(target_path, output)
+
+                previous = manifest.get(md_file)
+                if previous is not None and previous.target != str(target_path):
+                    if self._remove_synced_target(previous):
+                        summary.removed += 1
+
+                target_stat = target_path.stat()
+                manifest.set(
+                    md_file,
+                    ManifestEntry(
+                        source_mtime_ns=stat.st_mtime_ns,
+                        source_size=stat.st_size,
+                        source_checksum=checksum,
+                        target=str(target_path),
+                        output_hash=hashlib.md5(output).hexdigest(),
+                        target_mtime_ns=target_stat.st_mtime_ns,
+                        target_size=target_stat.st_size,
+                        project=project_name,
+                        detected_project=self._detected_project(md_file),
+                    ),
+                )
+
+                if written:
+                    print(f"Synced: {md_file} -> {target_path}")
+                    summary.updated += 1
+                else:
+                    summary.skipped += 1
+                results[str(md_file)] = True
+
+            except Exception as e:
+                print(f"Error syncing file {md_file}: {e}")
+                results[str(md_file)] = False
+                summary.failed += 1
+
+        # Sources that disappeared take their synced copies with them
+        live_sources = {SyncManifest.key(md_file) for md_file in plan.md_files}
+        for source in manifest.sources_under(plan.source_dir):
+            if source not in live_sources:
+                entry = manifest.pop(source)
+                if entry is not None and self._remove_synced_target(entry):
+                    summary.removed += 1
+
+        manifest.save()
         return results
 
+    def _manifest_fingerprint(self) -> str:
+        """Fingerprint of everything besides the source that shapes the output."""
+        tag_config = json.dumps(self.metadata_manager.tag_config, sort_keys=True)
+        digest = hashlib.md5(tag_config.encode("utf-8")).hexdigest()
+        return f"{type(self).__name__}:{digest}"
+
+    def _detected_project(self, source_path: Path) -> str | None:
+        """Project auto-detected for a source (memoized per directory)."""
+        return self.metadata_manager.project_cache.resolve_project(source_path.parent)
+
+    def _entry_current(
+        self,
+        entry: ManifestEntry,
+        project_name: str | None,
+        detected_project: str | None,
+    ) -> bool:
+        """Whether a manifest entry still describes the file in the vault."""
+        return (
+            entry.project == project_name
+            and entry.detected_project == detected_project
+            and entry.target_intact()
+        )
+
+    def _remove_synced_target(self, entry: ManifestEntry) -> bool:
+        """Delete a previously synced file unless it was edited in the vault.
+
+        Returns:
+            True if the file was removed
+        """
+        target_path = Path(entry.target)
+        try:
+            if hashlib.md5(target_path.read_bytes()).hexdigest() != entry.output_hash:
+                return False
+            target_path.unlink()
+        except OSError:
+            return False
+
+        print(f"Removed: {target_path}")
+        return True
+
+    def _render_file(
+        self,
+        source_path: Path,
+        metadata: KnowledgeMetadata,
+        project_name: str | None = None,
+    ) -> tuple[Path, bytes]:
+        """Render a source file for the vault.
+
+        Args:
+            source_path: Path to the source file
+            metadata: Extracted metadata for the file
+            project_name: Optional project name
+
+        Returns:
+            Tuple of (target path, encoded file content)
+        """
+        with trace_span("sync.render", file=source_path.name):
+            target_path = self._determine_target_path(
+                metadata, source_path, project_name
+            )
+            enhanced_content = self._enhance_content_for_obsidian(
+                source_path, metadata, project_name
+            )
+            return target_path, enhanced_content.encode("utf-8")
+
+    def _write_if_changed(self, target_path: Path, output: bytes) -> bool:
+        """Write rendered output unless the target already holds it.
+
+        Returns:
+            True if the file was written
+        """
+        with trace_span("sync.write", file=target_path.name) as span:
+            try:
+                if target_path.read_bytes() == output:
+                    return False
+            except OSError:
+                pass
+
+            # Ensure target directory exists
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_path.write_bytes(output)
+            if span is not None:
+                span.args["bytes"] = len(output)
+            return True
+
     def _determine_target_path(
         self, metadata: KnowledgeMetadata, source_path: Path, project_name: str | None
     ) -> Path:
@@ -0,0 +1,188 @@
+"""Multi-target sync pipeline: parse sources once, write to every vault."""
+
+import contextvars
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..core.metadata import MetadataExtractionResult, MetadataManager
+from ..core.tracing import trace_span
+from .manifest import SyncPlan, SyncSummary
+from .obsidian import ObsidianVaultManager
+
+TargetTask = Callable[[str, ObsidianVaultManager], Any]
+
+
+@dataclass
+class TargetSyncResult:
+    """Outcome of syncing to one target."""
+
+    target_name: str
+    results: dict[str, bool] = field(default_factory=dict)
+    summary: SyncSummary = field(default_factory=SyncSummary)
+    error: Exception | None = None
+
+    @property
+    def success_count(self) -> int:
+        """Number of files synced successfully."""
+        return sum(1 for success in self.results.values() if success)
+
+    @property
+    def failed_files(self) -> list[str]:
+        """Files that failed to sync."""
+        return [path for path, success in self.results.items() if not success]
+
+
+class MultiTargetSyncPipeline:
+    """Syncs sources to several vaults while extracting metadata only once.
+
+    Each run has three phases: every vault consults its own manifest to plan
+    which files it needs, the union of those files is parsed once, and the
+    rendered output is written to all vaults concurrently. Vault work is
+    file I/O, so it runs on a thread pool with one task per target.
+    """
+
+    def __init__(
+        self,
+        vault_managers: Mapping[str, ObsidianVaultManager],
+        metadata_manager: MetadataManager,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize sync pipeline.
+
+        Args:
+            vault_managers: Vault manager per target name
+            metadata_manager: Manager used to extract metadata once per file
+            max_workers: Threads for per-target I/O (defaults to one per target)
+        """
+        self.vault_managers = dict(vault_managers)
+        self.metadata_manager = metadata_manager
+        self.max_workers = max_workers
+
+    def sync_directory(
+        self, source_dir: Path, project_name: str | None = None
+    ) -> dict[str, TargetSyncResult]:
+        """Incrementally sync a directory to every target.
+
+        Args:
+            source_dir: Path to the source directory
+            project_name: Name of the project
+
+        Returns:
+            Result per target name, in target order
+        """
+        with trace_span("sync.directory", source=str(source_dir)):
+            plans = self._run_per_target(
+                lambda _, vault: vault.plan_directory_sync(source_dir, project_name),
+                "sync.plan",
+            )
+
+            # A file needed by several vaults is still parsed only once
+            pending: dict[Path, None] = {}
+            for plan in plans.values():
+                if isinstance(plan, SyncPlan):
+                    pending.update(dict.fromkeys(plan.pending_paths))
+            extractions = self._extract(list(pending))
+
+            def apply(name: str, vault: ObsidianVaultManager) -> TargetSyncResult:
+                plan = plans[name]
+                if isinstance(plan, Exception):
+                    raise plan
+                if plan is None:
+                    return TargetSyncResult(name)
+                results = vault.apply_directory_sync(plan, extractions)
+                return TargetSyncResult(name, results, plan.summary)
+
+            return self._collect(self._run_per_target(apply, "sync.apply"))
+
+    def sync_files(
+        self, file_paths: list[Path], project_name: str | None = None
+    ) -> dict[str, TargetSyncResult]:
+        """Sync individual files to every target.
+
+        Args:
+            file_paths: Source files to sync
+            project_name: Optional project name
+
+        Returns:
+            Result per target name, in target order
+        """
+        with trace_span("sync.files", files=len(file_paths)):
+            extractions = self._extract(file_paths)
+
+            def sync(name: str, vault: ObsidianVaultManager) -> TargetSyncResult:
+                result = TargetSyncResult(name)
+                for file_path in file_paths:
+                    extraction = extractions.get(file_path)
+                    if extraction is None or extraction.metadata is None:
+                        error = extraction.error if extraction else "not extracted"
+                        print(f"Error syncing file {file_path}: {error}")
+                        result.results[str(file_path)] = False
+                        result.summary.failed += 1
+                        continue
+
+                    success = vault.sync_file(
+                        file_path, project_name, metadata=extraction.metadata
+                    )
+                    result.results[str(file_path)] = success
+                    if success:
+                        result.summary.updated += 1
+                    else:
+                        result.summary.failed += 1
+                return result
+
+            return self._collect(self._run_per_target(sync, "sync.apply"))
+
+    def _extract(self, file_paths: list[Path]) -> dict[Path, MetadataExtractionResult]:
+        """Extract metadata for existing files, keyed by path."""
+        existing = [path for path in file_paths if path.exists()]
+        missing = [path for path in file_paths if not path.exists()]
+
+        with trace_span("sync.extract", files=len(existing)):
+            extractions = {
+                extraction.path: extraction
+                for extraction in self.metadata_manager.extract_metadata_bulk(existing)
+            }
+        for path in missing:
+            extractions[path] = MetadataExtractionResult(
+                path, None, FileNotFoundError(f"Source file does not exist: {path}")
+            )
+        return extractions
+
+    def _run_per_target(self, task: TargetTask, span_name: str) -> dict[str, Any]:
+        """Run a task for every vault, concurrently when there are several.
+
+        Exceptions are captured and returned in place of the task result.
+        Each task runs in a copy of the caller's context, so its trace span
+        nests under the caller's even on a worker thread.
+        """
+
+        def run(name: str, vault: ObsidianVaultManager) -> Any:
+            with trace_span(span_name, target=name):
+                try:
+                    return task(name, vault)
+                except Exception as e:
+                    return e
+
+        items = list(self.vault_managers.items())
+        if len(items) <= 1:
+            return {name: run(name, vault) for name, vault in items}
+
+        max_workers = self.max_workers or len(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(contextvars.copy_context().run, run, name, vault)
+                for name, vault in items
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def _collect(self, outcomes: dict[str, Any]) -> dict[str, TargetSyncResult]:
+        """Convert raw task outcomes into per-target results."""
+        return {
+            name: outcome
+            if isinstance(outcome, TargetSyncResult)
+            else TargetSyncResult(name, error=outcome)
+            for name, outcome in outcomes.items()
+        }
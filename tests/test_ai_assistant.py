@@ -0,0 +1,99 @@
+"""Tests for AIKnowledgeAssistant related-content suggestions."""
+
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.ai.ai_assistant import AIKnowledgeAssistant
+from claude_knowledge_catalyst.core.config import CKCConfig
+
+
+class TestRelatedContent:
+    """Test cases for index-backed related-content lookups."""
+
+    @pytest.fixture
+    def assistant(self, tmp_path):
+        """Create an assistant over a vault of tagged notes."""
+        notes = {
+            "target.md": ["python", "testing"],
+            "twin.md": ["python", "testing"],
+            "partial.md": ["python", "docker", "web"],
+            "unrelated.md": ["design"],
+        }
+        for name, tags in notes.items():
+            (tmp_path / name).write_text(
+                f"---\ntitle: {name[:-3]}\ntags: [{', '.join(tags)}]\n---\n\n"
+                "# Heading\n\nSome content.\n"
+            )
+        (tmp_path / "README.md").write_text("---\ntags: [python]\n---\n# Vault\n")
+
+        with AIKnowledgeAssistant(
+            tmp_path, CKCConfig(project_root=tmp_path)
+        ) as assistant:
+            yield assistant
+
+    def test_similar_content_ranked_without_self(self, assistant, tmp_path):
+        """Test neighbours are ordered by overlap and exclude the note itself."""
+        similar = assistant._find_similar_content(
+            ["python", "testing"], exclude=tmp_path / "target.md"
+        )
+
+        assert similar == ["twin.md", "partial.md"]
+
+    def test_index_opened_lazily(self, tmp_path):
+        """Test no index is created until related content is requested."""
+        with AIKnowledgeAssistant(tmp_path, CKCConfig(project_root=tmp_path)):
+            pass
+
+        assert not (tmp_path / ".ckc" / "metadata_index.db").exists()
+
+    def test_repeat_lookups_do_not_reparse_vault(self, assistant, tmp_path):
+        """Test unchanged notes are not parsed again on later lookups."""
+        assistant._find_similar_content(["python"])
+
+        with patch.object(
+            assistant.metadata_manager, "extract_metadata_from_file"
+        ) as mock_extract:
+            similar = assistant._find_similar_content(["testing"])
+
+        mock_extract.assert_not_called()
+        assert set(similar) == {"target.md", "twin.md"}
+
+    def test_later_lookups_do_not_walk_vault(self, assistant, tmp_path):
+        """Test only the first lookup refreshes the whole vault."""
+        assistant._find_similar_content(["python"])
+
+        with patch.object(assistant._metadata_index, "refresh") as mock_refresh:
+            assistant._find_similar_content(["testing"], exclude=tmp_path / "target.md")
+
+        mock_refresh.assert_not_called()
+
+    def test_analyzed_note_is_reindexed(self, assistant, tmp_path):
+        """Test the analyzed note's new tags are used by later lookups."""
+        assert assistant._find_similar_content(["rust"]) == []
+
+        twin = tmp_path / "twin.md"
+        twin.write_text("---\ntitle: twin\ntags: [rust]\n---\n")
+        assistant._find_similar_content(["rust"], exclude=twin)
+
+        assert assistant._find_similar_content(["rust"]) == ["twin.md"]
+
+    def test_new_notes_are_found_by_new_assistant(self, assistant, tmp_path):
+        """Test notes created after the first lookup are seen by a new assistant."""
+        assert assistant._find_similar_content(["rust"]) == []
+
+        (tmp_path / "new.md").write_text("---\ntitle: new\ntags: [rust]\n---\n")
+
+        with AIKnowledgeAssistant(tmp_path, CKCConfig(project_root=tmp_path)) as fresh:
+            assert fresh._find_similar_content(["rust"]) == ["new.md"]
+
+    def test_suggestions_link_related_notes(self, assistant, tmp_path):
+        """Test content suggestions name related notes but not the note itself."""
+        result = assistant.suggest_content_improvements(tmp_path / "target.md")
+
+        connections = [
+            s["action"]
+            for s in result["suggestions"]
+            if s["action"].startswith("Related content")
+        ]
+        assert connections == ["Related content: twin.md, partial.md"]
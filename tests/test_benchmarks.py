@@ -0,0 +1,150 @@
+"""Tests for the synthetic vault generator and benchmark suite."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.benchmarks import (
+    BenchmarkResult,
+    BenchmarkRun,
+    BenchmarkSuite,
+    VaultGenerator,
+    find_regressions,
+)
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.sync.obsidian import ObsidianVaultManager
+
+
+class TestVaultGenerator:
+    """Test cases for VaultGenerator."""
+
+    def test_same_seed_gives_same_vault(self, tmp_path):
+        """Test generation is deterministic for a seed."""
+        first = VaultGenerator(seed=7).generate(tmp_path / "a", 40)
+        second = VaultGenerator(seed=7).generate(tmp_path / "b", 40)
+
+        assert [p.relative_to(first.root) for p in first.notes] == [
+            p.relative_to(second.root) for p in second.notes
+        ]
+        assert [p.read_text() for p in first.notes] == [
+            p.read_text() for p in second.notes
+        ]
+
+    def test_vault_has_varied_content(self, tmp_path):
+        """Test notes mix languages, code, frontmatter shapes and depths."""
+        vault = VaultGenerator(seed=1).generate(tmp_path, 300)
+
+        assert len(vault.notes) == 300
+        assert all(path.is_relative_to(vault.source_dir) for path in vault.notes)
+        assert 0 < vault.japanese_notes < 300
+        assert 0 < vault.notes_with_code < 300
+        assert 0 < vault.notes_without_frontmatter < 300
+
+        depths = {len(p.relative_to(vault.source_dir).parts) for p in vault.notes}
+        assert len(depths) > 1
+        texts = [p.read_text(encoding="utf-8") for p in vault.notes]
+        assert any("```python" in text for text in texts)
+        assert any("success_rate:" in text for text in texts)
+
+    def test_notes_parse_as_knowledge(self, tmp_path):
+        """Test every generated note yields metadata."""
+        vault = VaultGenerator().generate(tmp_path, 50)
+
+        results = MetadataManager().extract_metadata_bulk(vault.notes, workers=1)
+
+        assert all(result.error is None for result in results)
+
+
+class TestBenchmarkSuite:
+    """Test cases for BenchmarkSuite and baseline comparison."""
+
+    def test_run_records_every_benchmark(self, tmp_path):
+        """Test a small run times each workload and round-trips through JSON."""
+        suite = BenchmarkSuite(tmp_path, notes=30, classify_sample=5)
+
+        run = suite.run()
+
+        assert [r.name for r in run.results] == list(BenchmarkSuite.BENCHMARKS)
+        assert run.result("classify").items == 5
+        assert run.result("sync.cold").items == 30
+        assert all(r.seconds >= 0 for r in run.results)
+
+        path = run.save(tmp_path / "results" / "run.json")
+        stored = json.loads(path.read_text())
+        assert stored["notes"] == 30
+        assert "ms_per_item" in stored["results"][0]
+        loaded = BenchmarkRun.load(path)
+        assert [r.name for r in loaded.results] == [r.name for r in run.results]
+
+    def test_only_runs_selected_benchmarks(self, tmp_path):
+        """Test dependencies run without being recorded."""
+        run = BenchmarkSuite(tmp_path, notes=20).run(["search.query"])
+
+        assert [r.name for r in run.results] == ["search.query"]
+        assert run.result("search.query").items > 0
+
+    def test_reused_workdir_syncs_cold(self, tmp_path):
+        """Test a second run in the same workdir does not start from its vault."""
+        BenchmarkSuite(tmp_path, notes=10).run(["sync.cold"])
+        (tmp_path / "vault" / "stale.md").write_text("# Stale\n")
+
+        render = ObsidianVaultManager._render_file
+        with patch.object(
+            ObsidianVaultManager, "_render_file", autospec=True, side_effect=render
+        ) as mock_render:
+            BenchmarkSuite(tmp_path, notes=10).run(["sync.cold"])
+
+        assert mock_render.call_count == 10
+        assert not (tmp_path / "vault" / "stale.md").exists()
+
+    def test_unknown_benchmark_rejected(self, tmp_path):
+        """Test misspelled benchmark names are reported."""
+        with pytest.raises(ValueError, match="Unknown benchmarks: serch"):
+            BenchmarkSuite(tmp_path, notes=5).run(["serch"])
+
+    def test_regressions_flagged_per_item(self):
+        """Test slowdowns beyond the tolerance are flagged after scaling."""
+        baseline = BenchmarkRun(
+            1000,
+            0,
+            [
+                BenchmarkResult("classify", 250, 1.0),
+                BenchmarkResult("sync.cold", 1000, 2.0),
+                BenchmarkResult("search.query", 7, 0.001),
+            ],
+        )
+        run = BenchmarkRun(
+            1000,
+            0,
+            [
+                # Twice the sample in twice the time: no regression
+                BenchmarkResult("classify", 500, 2.1),
+                BenchmarkResult("sync.cold", 1000, 3.0),
+                # Too short to compare reliably
+                BenchmarkResult("search.query", 7, 0.004),
+                BenchmarkResult("analytics", 1000, 1.0),
+            ],
+        )
+
+        regressions = find_regressions(run, baseline, tolerance=0.25)
+
+        assert [r.name for r in regressions] == ["sync.cold"]
+        assert regressions[0].baseline_seconds == pytest.approx(2.0)
+        assert regressions[0].slowdown == pytest.approx(0.5)
+
+    def test_baseline_of_other_vault_rejected(self):
+        """Test runs over different vaults are not compared."""
+        baseline = BenchmarkRun(1000, 0, [BenchmarkResult("search.query", 7, 0.1)])
+        larger = BenchmarkRun(10_000, 0, [BenchmarkResult("search.query", 7, 0.5)])
+        reseeded = BenchmarkRun(1000, 1, [BenchmarkResult("search.query", 7, 0.1)])
+
+        for run in [larger, reseeded]:
+            assert not run.is_comparable(baseline)
+            with pytest.raises(ValueError, match="Baseline was recorded on 1000"):
+                find_regressions(run, baseline)
+
+    def test_baseline_of_other_format_rejected(self):
+        """Test baselines written by another format version are refused."""
+        with pytest.raises(ValueError, match="format version"):
+            BenchmarkRun.from_dict({"version": 0, "notes": 1, "seed": 0})
@@ -179,7 +179,7 @@ class TestCLICommands:
         # Should handle the command (may fail due to validation)
         assert result.exit_code in [0, 1]
 
-    @patch("claude_knowledge_catalyst.cli.main.KnowledgeWatcher")
+    @patch("claude_knowledge_catalyst.core.watcher.KnowledgeWatcher")
     @patch("claude_knowledge_catalyst.cli.main.load_config")
     def test_watch_start_command(
         self, mock_load_config, mock_watcher_class, cli_runner, temp_project_dir
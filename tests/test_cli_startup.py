@@ -0,0 +1,74 @@
+"""Import-time regression tests for CLI startup."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only specific commands need; loading any of them at startup
+# adds hundreds of milliseconds to every `ckc` invocation
+HEAVY_MODULES = (
+    "yake",
+    "langdetect",
+    "networkx",
+    "numpy",
+    "watchdog",
+    "matplotlib",
+    "claude_knowledge_catalyst.ai",
+    "claude_knowledge_catalyst.core.watcher",
+    "claude_knowledge_catalyst.cli.interactive",
+    "claude_knowledge_catalyst.cli.smart_sync",
+)
+
+# Total self time of all imports, generous enough for slow CI machines
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+
+
+def profile_imports(code: str) -> dict[str, int]:
+    """Run code under ``python -X importtime`` and return self times in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    self_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        self_times[module.strip()] = int(self_us)
+    return self_times
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import claude_knowledge_catalyst.cli.main",
+        "from claude_knowledge_catalyst.cli.main import app\n"
+        "try:\n    app(['--version'])\nexcept SystemExit:\n    pass",
+        "from claude_knowledge_catalyst.cli.main import app\n"
+        "try:\n    app(['status'])\nexcept SystemExit:\n    pass",
+    ],
+    ids=["import", "version", "status"],
+)
+def test_common_commands_skip_heavy_imports(code, tmp_path, monkeypatch):
+    """Common commands load no heavy optional dependencies and stay in budget."""
+    monkeypatch.chdir(tmp_path)
+    self_times = profile_imports(code)
+
+    loaded = [
+        module
+        for module in self_times
+        if any(
+            module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES
+        )
+    ]
+    assert not loaded, f"Heavy modules imported at startup: {loaded}"
+
+    total_seconds = sum(self_times.values()) / 1_000_000
+    assert total_seconds < IMPORT_TIME_BUDGET_SECONDS, (
+        f"Startup imports took {total_seconds:.2f}s"
+    )
@@ -247,7 +247,7 @@ class TestCLIDiagnostics:
                 "claude_knowledge_catalyst.cli.main.get_metadata_manager"
             ) as mock_metadata_manager,
             patch(
-                "claude_knowledge_catalyst.cli.main.SmartContentClassifier"
+                "claude_knowledge_catalyst.ai.smart_classifier.SmartContentClassifier"
             ) as mock_classifier,
         ):
             # Mock metadata manager
@@ -144,6 +144,21 @@ class TestKnowledgeFileEventHandler:
         event_handler._handle_file_event("modified", test_file)
         assert callback_mock.call_count == 2
 
+    def test_debounce_cache_is_bounded(self, watch_config, callback_mock):
+        """Test debounce state stays capped no matter how many paths change."""
+        watch_config.debounce_cache_size = 50
+        handler = KnowledgeFileEventHandler(
+            callback_mock, watch_config, Mock(spec=MetadataManager)
+        )
+
+        for i in range(200):
+            handler._handle_file_event("modified", Path(f"/test/file_{i}.md"))
+
+        stats = handler.debounce_cache.get_stats()
+        assert callback_mock.call_count == 200
+        assert stats["size"] == 50
+        assert stats["capacity_evictions"] == 150
+
     def test_claude_md_processing(self, event_handler):
         """Test CLAUDE.md file processing."""
         claude_file = Path("/project/CLAUDE.md")
@@ -439,3 +454,88 @@ Follow best practices.
         # Should detect CLAUDE.md file
         assert len(claude_events) >= 1
         assert claude_events[0][1].name == "CLAUDE.md"
+
+
+class TestSelfWriteSuppression:
+    """Test the watcher ignores its own metadata writes."""
+
+    @pytest.fixture
+    def note(self, tmp_path):
+        """Create a knowledge note without frontmatter."""
+        note = tmp_path / "note.md"
+        note.write_text("# Python tips\n\nUse pytest fixtures.\n")
+        return note
+
+    def make_watcher(self, tmp_path, mode="on_change", callback=None):
+        """Create a watcher with a real metadata manager."""
+        return KnowledgeWatcher(
+            WatchConfig(watch_paths=[tmp_path], metadata_refresh=mode),
+            MetadataManager(),
+            batch_sync_callback=callback,
+        )
+
+    def test_unchanged_metadata_is_not_rewritten(self, tmp_path, note):
+        """Test a refresh only writes when semantic metadata changes."""
+        watcher = self.make_watcher(tmp_path)
+
+        watcher._update_file_metadata(note)
+        first_write = note.stat().st_mtime_ns
+        time.sleep(0.01)
+        watcher._update_file_metadata(note)
+
+        assert note.stat().st_mtime_ns == first_write
+        assert note.read_text().startswith("---\n")
+
+    def test_always_mode_rewrites(self, tmp_path, note):
+        """Test the 'always' mode keeps bumping the updated timestamp."""
+        watcher = self.make_watcher(tmp_path, mode="always")
+
+        watcher._update_file_metadata(note)
+        first_content = note.read_text()
+        time.sleep(0.01)
+        watcher._update_file_metadata(note)
+
+        assert note.read_text() != first_content
+
+    def test_echo_of_own_write_is_suppressed(self, tmp_path, note):
+        """Test the event caused by a metadata write triggers no second cycle."""
+        batches = []
+        watcher = self.make_watcher(tmp_path, callback=batches.append)
+
+        watcher._handle_file_changes([("created", note)])
+        assert len(batches) == 1
+
+        # The write above produces a modify event for the same content
+        watcher._handle_file_changes([("modified", note)])
+        assert len(batches) == 1
+        assert watcher.get_status()["suppressed_self_writes"] == 1
+
+        # A real edit afterwards is processed again
+        note.write_text(note.read_text() + "\nMore tips.\n")
+        watcher._handle_file_changes([("modified", note)])
+        assert len(batches) == 2
+
+    def test_echoes_suppressed_beyond_debounce_cache_size(self, tmp_path):
+        """Test initial processing of a large vault keeps every self-write."""
+        batches = []
+        watcher = KnowledgeWatcher(
+            WatchConfig(watch_paths=[tmp_path], debounce_cache_size=2),
+            MetadataManager(),
+            batch_sync_callback=batches.append,
+        )
+        notes = []
+        for i in range(5):
+            note = tmp_path / f"note_{i}.md"
+            note.write_text(f"# Note {i}\n\nUse pytest fixtures.\n")
+            notes.append(note)
+
+        watcher.process_existing_files()
+        watcher._handle_file_changes([("modified", note) for note in notes])
+
+        assert batches == []
+        assert watcher.get_status()["suppressed_self_writes"] == 5
+
+    def test_invalid_refresh_mode(self):
+        """Test unknown metadata refresh modes are rejected."""
+        with pytest.raises(ValueError):
+            WatchConfig(metadata_refresh="sometimes")
@@ -0,0 +1,153 @@
+"""Tests for the coalescing file event dispatcher."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from claude_knowledge_catalyst.core.config import WatchConfig
+from claude_knowledge_catalyst.core.event_dispatcher import CoalescingEventDispatcher
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.watcher import KnowledgeWatcher
+
+
+class TestCoalescingEventDispatcher:
+    """Test cases for CoalescingEventDispatcher."""
+
+    @pytest.fixture
+    def batches(self):
+        """Collect handled batches."""
+        return []
+
+    @pytest.fixture
+    def dispatcher(self, batches):
+        """Create running dispatcher with a short debounce window."""
+        dispatcher = CoalescingEventDispatcher(batches.append, debounce_seconds=0.05)
+        dispatcher.start()
+        yield dispatcher
+        dispatcher.stop()
+
+    def test_burst_fires_trailing_event(self, dispatcher, batches):
+        """Test a save storm on one path yields one event after it settles."""
+        path = Path("/notes/a.md")
+        dispatcher.submit("created", path)
+        for _ in range(20):
+            dispatcher.submit("modified", path)
+
+        assert dispatcher.flush(timeout=5)
+        assert batches == [[("created", path)]]
+        assert dispatcher.get_stats()["events_coalesced"] == 20
+
+    def test_ready_paths_share_one_batch(self, batches):
+        """Test hundreds of files changed together produce a single batch."""
+        # A window well above the submit time, so a loaded runner cannot split it
+        dispatcher = CoalescingEventDispatcher(batches.append, debounce_seconds=0.5)
+        dispatcher.start()
+        paths = [Path(f"/repo/doc_{i}.md") for i in range(300)]
+        try:
+            for path in paths:
+                dispatcher.submit("modified", path)
+
+            time.sleep(0.8)
+            assert dispatcher.flush(timeout=5)
+        finally:
+            dispatcher.stop()
+        assert len(batches) == 1
+        assert [path for _, path in batches[0]] == paths
+
+    def test_submit_does_not_wait_for_handler(self):
+        """Test slow processing never blocks the observer thread."""
+        release = threading.Event()
+        dispatcher = CoalescingEventDispatcher(
+            lambda batch: release.wait(5), debounce_seconds=0.0
+        )
+        dispatcher.start()
+        try:
+            dispatcher.submit("modified", Path("/a.md"))
+            time.sleep(0.05)
+
+            started = time.perf_counter()
+            for i in range(100):
+                dispatcher.submit("modified", Path(f"/b_{i}.md"))
+            assert time.perf_counter() - started < 0.5
+        finally:
+            release.set()
+            dispatcher.stop()
+
+        assert dispatcher.get_stats()["events_dispatched"] == 101
+
+    def test_stop_flushes_pending_events(self, batches):
+        """Test events still inside the debounce window are not lost on stop."""
+        dispatcher = CoalescingEventDispatcher(batches.append, debounce_seconds=60)
+        dispatcher.start()
+        dispatcher.submit("modified", Path("/late.md"))
+
+        dispatcher.stop()
+
+        assert batches == [[("modified", Path("/late.md"))]]
+
+    def test_handler_errors_are_contained(self):
+        """Test a failing batch is counted and later batches still run."""
+        handler = Mock(side_effect=[RuntimeError("boom"), None])
+        dispatcher = CoalescingEventDispatcher(handler, debounce_seconds=0.0)
+
+        dispatcher.submit("modified", Path("/a.md"))
+        dispatcher.flush()
+        dispatcher.submit("modified", Path("/b.md"))
+        dispatcher.flush()
+
+        assert handler.call_count == 2
+        assert dispatcher.get_stats()["handler_errors"] == 1
+
+    def test_pending_paths_are_bounded(self, batches):
+        """Test paths beyond max_pending are dispatched before the burst settles."""
+        dispatcher = CoalescingEventDispatcher(
+            batches.append, debounce_seconds=60, max_pending=10
+        )
+        dispatcher.start()
+        try:
+            paths = [Path(f"/burst/doc_{i}.md") for i in range(50)]
+            for path in paths:
+                dispatcher.submit("modified", path)
+
+            deadline = time.monotonic() + 5
+            while dispatcher.get_stats()["pending"] > 10:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            stats = dispatcher.get_stats()
+            assert stats["capacity_dispatches"] == 40
+            assert stats["max_pending"] == 10
+            # The oldest paths overflowed first
+            dispatched = [path for batch in batches for _, path in batch]
+            assert set(dispatched) <= set(paths[:40])
+        finally:
+            dispatcher.stop()
+
+        assert sorted(path for batch in batches for _, path in batch) == sorted(paths)
+
+
+class TestWatcherBatching:
+    """Test KnowledgeWatcher event batching."""
+
+    def test_batch_callback_receives_coalesced_events(self, tmp_path):
+        """Test the watcher hands one batch to the batch sync callback."""
+        received = []
+        watcher = KnowledgeWatcher(
+            WatchConfig(watch_paths=[tmp_path], debounce_seconds=0.05),
+            Mock(spec=MetadataManager),
+            batch_sync_callback=received.append,
+        )
+        handler = watcher.event_handler
+        files = [tmp_path / f"note_{i}.md" for i in range(5)]
+
+        for _ in range(3):
+            for file_path in files:
+                handler._handle_file_event("modified", file_path)
+        watcher.dispatcher.flush()
+
+        assert len(received) == 1
+        assert sorted(path for _, path in received[0]) == sorted(files)
+        assert watcher.get_status()["event_queue"]["events_received"] == 15
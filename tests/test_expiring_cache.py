@@ -0,0 +1,100 @@
+"""Tests for the bounded, time-expiring cache."""
+
+from claude_knowledge_catalyst.core.config import WatchConfig
+from claude_knowledge_catalyst.core.expiring_cache import ExpiringCache
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.watcher import KnowledgeWatcher
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestExpiringCache:
+    """Test cases for ExpiringCache."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test entries disappear once their TTL has passed."""
+        clock = FakeClock()
+        cache = ExpiringCache(ttl_seconds=1.0, clock=clock)
+        cache["a"] = 1
+        clock.now = 0.5
+        cache["b"] = 2
+
+        assert cache == {"a": 1, "b": 2}
+        clock.now = 1.2
+        assert cache.get("a") is None
+        assert cache["b"] == 2
+        assert cache.get_stats()["expired_evictions"] == 1
+
+    def test_rewrite_refreshes_entry(self):
+        """Test writing a key again restarts its TTL."""
+        clock = FakeClock()
+        cache = ExpiringCache(ttl_seconds=1.0, clock=clock)
+        cache["a"] = 1
+        clock.now = 0.8
+        cache["a"] = 2
+        clock.now = 1.5
+
+        assert cache["a"] == 2
+
+    def test_capacity_evicts_oldest(self):
+        """Test the least recently written entries are evicted when full."""
+        cache = ExpiringCache(max_entries=3, ttl_seconds=60)
+        for key in "abcd":
+            cache[key] = key
+        cache["b"] = "b"
+        cache["e"] = "e"
+
+        assert list(cache) == ["d", "b", "e"]
+        stats = cache.get_stats()
+        assert stats["size"] == 3
+        assert stats["capacity_evictions"] == 2
+
+    def test_uncapped_cache_only_expires(self):
+        """Test a cache without max_entries keeps entries until they expire."""
+        clock = FakeClock()
+        cache = ExpiringCache(max_entries=None, ttl_seconds=1.0, clock=clock)
+        for i in range(100):
+            cache[i] = i
+
+        assert len(cache) == 100
+        clock.now = 2.0
+        assert len(cache) == 0
+        assert cache.get_stats()["capacity_evictions"] == 0
+
+    def test_pop(self):
+        """Test popping live, missing and expired keys."""
+        clock = FakeClock()
+        cache = ExpiringCache(ttl_seconds=1.0, clock=clock)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", None) is None
+        clock.now = 2.0
+        assert cache.pop("b", "gone") == "gone"
+
+
+class TestWatcherCacheStatus:
+    """Test cache metrics exposed by KnowledgeWatcher."""
+
+    def test_status_reports_cache_metrics(self, tmp_path):
+        """Test get_status includes event queue and self-write cache stats."""
+        watcher = KnowledgeWatcher(
+            WatchConfig(watch_paths=[tmp_path], debounce_cache_size=100),
+            MetadataManager(),
+        )
+
+        status = watcher.get_status()
+
+        assert status["event_queue"]["pending"] == 0
+        assert status["event_queue"]["max_pending"] == 100
+        assert status["event_queue"]["capacity_dispatches"] == 0
+        assert status["self_write_cache"]["capacity_evictions"] == 0
@@ -0,0 +1,67 @@
+"""Tests for the frontmatter-only header reader."""
+
+import pytest
+
+from claude_knowledge_catalyst.core.frontmatter_reader import (
+    has_frontmatter,
+    read_frontmatter,
+    read_frontmatter_text,
+)
+
+
+class TestFrontmatterReader:
+    """Test cases for frontmatter_reader."""
+
+    def test_reads_header_only(self, tmp_path):
+        """Test the body is never decoded, so a corrupt body doesn't matter."""
+        note = tmp_path / "note.md"
+        note.write_bytes(
+            b"---\ntitle: Big\ntags: [python]\n---\n" + b"\xff\xfe body" * 100_000
+        )
+
+        assert read_frontmatter_text(note) == "title: Big\ntags: [python]\n"
+        assert read_frontmatter(note) == {"title": "Big", "tags": ["python"]}
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "# Just content",
+            "--\ntitle: Malformed\n",
+            "---\ntitle: Unterminated\n",
+            "",
+        ],
+    )
+    def test_missing_frontmatter(self, tmp_path, content):
+        """Test files without a complete header block."""
+        note = tmp_path / "note.md"
+        note.write_text(content)
+
+        assert read_frontmatter_text(note) is None
+        assert read_frontmatter(note) is None
+        assert has_frontmatter(note) is False
+
+    def test_bom_crlf_and_empty_header(self, tmp_path):
+        """Test BOM, Windows line endings and an empty block."""
+        note = tmp_path / "note.md"
+        note.write_bytes(b"\xef\xbb\xbf---\r\ntitle: Win\r\n---\r\nBody\r\n")
+        empty = tmp_path / "empty.md"
+        empty.write_text("---\n---\nBody\n")
+
+        assert read_frontmatter(note) == {"title": "Win"}
+        assert read_frontmatter(empty) == {}
+
+    def test_header_size_limit(self, tmp_path):
+        """Test headers larger than the limit are treated as unterminated."""
+        note = tmp_path / "note.md"
+        note.write_text("---\n" + "key: value\n" * 100 + "---\n")
+
+        assert read_frontmatter_text(note, max_bytes=512) is None
+        assert read_frontmatter_text(note, max_bytes=4096) is not None
+
+    def test_unreadable_file(self, tmp_path):
+        """Test has_frontmatter swallows read errors."""
+        missing = tmp_path / "missing.md"
+
+        assert has_frontmatter(missing) is False
+        with pytest.raises(OSError):
+            read_frontmatter_text(missing)
@@ -0,0 +1,169 @@
+"""Tests for the persistent keyword cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.ai.keyword_cache import (
+    KEYWORD_CACHE_FILE_NAME,
+    KeywordCache,
+)
+from claude_knowledge_catalyst.ai.yake_extractor import (
+    YAKE_AVAILABLE,
+    Keyword,
+    YAKEConfig,
+    YAKEKeywordExtractor,
+)
+
+SAMPLE_CONTENT = """
+# Machine Learning Pipeline
+
+This document describes a machine learning pipeline using Python and
+scikit-learn, with data preprocessing, feature engineering and model
+evaluation deployed with Docker containers.
+"""
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic last-use times."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+class TestKeywordCache:
+    """Test suite for KeywordCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored keywords are returned unchanged."""
+        cache = KeywordCache(tmp_path / "cache.db")
+        keywords = [
+            ("machine learning", 0.05, "en", 0.95),
+            ("機械学習", 0.1, "ja", 0.9),
+        ]
+
+        assert cache.get("key") is None
+        cache.put("key", keywords)
+
+        assert cache.get("key") == keywords
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new instance on the same file sees earlier entries."""
+        path = tmp_path / "cache.db"
+        first = KeywordCache(path)
+        first.put("key", [("docker", 0.2, "en", 0.8)])
+        first.close()
+
+        second = KeywordCache(path)
+        assert second.get("key") == [("docker", 0.2, "en", 0.8)]
+        assert len(second) == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Entries read recently survive eviction."""
+        cache = KeywordCache(tmp_path / "cache.db", max_entries=2, clock=FakeClock())
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        assert len(cache) == 2
+        assert cache.get("a") == []
+        assert cache.get("b") is None
+        assert cache.get("c") == []
+        assert cache.evictions == 1
+
+    def test_overwrite_does_not_grow(self, tmp_path):
+        """Storing an existing key replaces it."""
+        cache = KeywordCache(tmp_path / "cache.db", max_entries=1)
+        cache.put("a", [("old", 0.5, "en", 0.5)])
+        cache.put("a", [("new", 0.5, "en", 0.5)])
+
+        assert len(cache) == 1
+        assert cache.evictions == 0
+        assert cache.get("a") == [("new", 0.5, "en", 0.5)]
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        """A path that cannot be created still yields a working cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        cache = KeywordCache(blocker / "cache.db")
+        cache.put("key", [])
+
+        assert cache.cache_path is None
+        assert cache.get("key") == []
+
+    def test_invalid_max_entries(self):
+        """The size bound must be positive."""
+        with pytest.raises(ValueError):
+            KeywordCache(None, max_entries=0)
+
+
+@pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+class TestExtractorKeywordCache:
+    """Test suite for the YAKE extractor's persistent cache."""
+
+    def test_repeat_extraction_skips_yake(self, tmp_path):
+        """Unchanged content is served from disk by a fresh extractor."""
+        first = YAKEKeywordExtractor(cache_dir=tmp_path)
+        expected = first.extract_keywords(SAMPLE_CONTENT)
+        assert expected
+        assert (tmp_path / KEYWORD_CACHE_FILE_NAME).exists()
+
+        second = YAKEKeywordExtractor(cache_dir=tmp_path)
+        with patch.object(second, "_get_extractor") as get_extractor:
+            keywords = second.extract_keywords(SAMPLE_CONTENT)
+
+        get_extractor.assert_not_called()
+        assert keywords == expected
+        assert all(isinstance(keyword, Keyword) for keyword in keywords)
+
+    def test_config_change_misses(self, tmp_path):
+        """A config that changes extraction does not reuse cached keywords."""
+        YAKEKeywordExtractor(cache_dir=tmp_path).extract_keywords(SAMPLE_CONTENT)
+
+        extractor = YAKEKeywordExtractor(YAKEConfig(top_keywords=3), cache_dir=tmp_path)
+        keywords = extractor.extract_keywords(SAMPLE_CONTENT)
+
+        assert extractor.keyword_cache is not None
+        assert extractor.keyword_cache.hits == 0
+        assert len(keywords) <= 3
+
+    def test_cache_size_settings_share_entries(self, tmp_path):
+        """Fields that only size caches do not split the cache."""
+        YAKEKeywordExtractor(cache_dir=tmp_path).extract_keywords(SAMPLE_CONTENT)
+
+        extractor = YAKEKeywordExtractor(
+            YAKEConfig(cache_size=10, persistent_cache_size=50), cache_dir=tmp_path
+        )
+        extractor.extract_keywords(SAMPLE_CONTENT)
+
+        assert extractor.keyword_cache is not None
+        assert extractor.keyword_cache.hits == 1
+
+    def test_language_is_part_of_key(self, tmp_path):
+        """An explicit language does not reuse auto-detected results."""
+        extractor = YAKEKeywordExtractor(cache_dir=tmp_path)
+        extractor.extract_keywords(SAMPLE_CONTENT)
+        extractor.extract_keywords(SAMPLE_CONTENT, language="ja")
+
+        assert extractor.keyword_cache is not None
+        assert extractor.keyword_cache.hits == 0
+        assert len(extractor.keyword_cache) == 2
+
+    def test_persistent_cache_disabled(self, tmp_path):
+        """Disabling the cache writes nothing to disk."""
+        extractor = YAKEKeywordExtractor(
+            YAKEConfig(persistent_cache=False), cache_dir=tmp_path
+        )
+        extractor.extract_keywords(SAMPLE_CONTENT)
+
+        assert extractor.keyword_cache is None
+        assert not (tmp_path / KEYWORD_CACHE_FILE_NAME).exists()
+        assert extractor.get_extractor_info()["keyword_cache"] is None
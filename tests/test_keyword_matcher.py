@@ -0,0 +1,56 @@
+"""Tests for the single-pass keyword matcher."""
+
+from claude_knowledge_catalyst.core.keyword_matcher import KeywordMatcher
+from claude_knowledge_catalyst.core.metadata import (
+    TECH_PATTERNS,
+    get_inference_matcher,
+)
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_finds_all_labels(self):
+        """Test every keyword present in the text is reported."""
+        matcher = KeywordMatcher(
+            [("python", "lang"), ("docker", "ops"), ("rust", "lang2")]
+        )
+        assert matcher.find_labels("Deploy the Python app with Docker") == {
+            "lang",
+            "ops",
+        }
+
+    def test_overlapping_and_nested_keywords(self):
+        """Test keywords inside or overlapping other keywords are found."""
+        matcher = KeywordMatcher(
+            [("node.js", "node"), ("js", "js"), ("html", "html"), ("ml", "ml")]
+        )
+        assert matcher.find_labels("node.js renders html") == {
+            "node",
+            "js",
+            "html",
+            "ml",
+        }
+
+    def test_keyword_with_multiple_labels(self):
+        """Test a keyword shared between tables yields each label."""
+        matcher = KeywordMatcher([("docker", "tech"), ("docker", "devops")])
+        assert matcher.find_labels("docker compose") == {"tech", "devops"}
+
+    def test_case_sensitive_matching(self):
+        """Test ignore_case=False keeps exact-case semantics."""
+        matcher = KeywordMatcher([("class ", "code")], ignore_case=False)
+        assert matcher.find_labels("class Foo:") == {"code"}
+        assert matcher.find_labels("Class notes") == set()
+
+    def test_empty_inputs(self):
+        """Test empty keyword sets and empty text."""
+        assert KeywordMatcher([]).find_labels("anything") == set()
+        assert KeywordMatcher([("a", 1)]).find_labels("") == set()
+
+    def test_inference_matcher_covers_tables(self):
+        """Test the shared inference automaton includes every tech keyword."""
+        matcher = get_inference_matcher()
+        expected = sum(len(patterns) for patterns in TECH_PATTERNS.values())
+        assert matcher.keyword_count > expected
+        assert get_inference_matcher() is matcher
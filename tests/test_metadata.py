@@ -229,3 +229,59 @@ Some content here.
         assert checksum1 != checksum2  # Different content, different checksum
         assert checksum1 == checksum3  # Same content, same checksum
         assert len(checksum1) == 32  # MD5 hash length
+
+
+class TestBulkMetadataExtraction:
+    """Test cases for MetadataManager.extract_metadata_bulk."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = MetadataManager()
+
+    def _write_notes(self, directory: Path, count: int) -> list[Path]:
+        paths = []
+        for i in range(count):
+            path = directory / f"note_{i:03d}.md"
+            path.write_text(
+                f"---\ntitle: Note {i}\ntech: [python]\n---\n\nBody {i}\n",
+                encoding="utf-8",
+            )
+            paths.append(path)
+        return paths
+
+    def test_serial_results_in_order_with_errors(self):
+        """Test results keep input order and capture per-file errors."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_notes(Path(temp_dir), 3)
+            missing = Path(temp_dir) / "missing.md"
+            paths.insert(1, missing)
+
+            results = self.manager.extract_metadata_bulk(paths, workers=1)
+
+            assert [result.path for result in results] == paths
+            assert results[0].metadata.title == "Note 0"
+            assert results[1].metadata is None
+            assert isinstance(results[1].error, FileNotFoundError)
+            assert results[2].metadata.title == "Note 1"
+            assert all(
+                result.error is None for i, result in enumerate(results) if i != 1
+            )
+
+    def test_parallel_matches_serial(self):
+        """Test the process pool produces the same metadata as serial extraction."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_notes(Path(temp_dir), 40)
+
+            parallel = self.manager.extract_metadata_bulk(paths, workers=2)
+            serial = self.manager.extract_metadata_bulk(paths, workers=1)
+
+            assert [r.metadata.title for r in parallel] == [
+                r.metadata.title for r in serial
+            ]
+            assert [r.metadata.checksum for r in parallel] == [
+                r.metadata.checksum for r in serial
+            ]
+
+    def test_empty_input(self):
+        """Test bulk extraction of no files."""
+        assert self.manager.extract_metadata_bulk([]) == []
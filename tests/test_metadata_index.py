@@ -0,0 +1,368 @@
+"""Tests for the persistent metadata index."""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.metadata_index import MetadataIndex
+from claude_knowledge_catalyst.core.project_resolver import ProjectResolutionCache
+
+
+class TestMetadataIndex:
+    """Test cases for MetadataIndex."""
+
+    @pytest.fixture
+    def vault_path(self):
+        """Create temporary vault with a few knowledge files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault = Path(temp_dir)
+            (vault / "notes").mkdir()
+            (vault / "notes" / "python.md").write_text(
+                "---\ntitle: Python Tips\ntech: [python]\n---\n\nUse pytest.\n"
+            )
+            (vault / "notes" / "api.md").write_text(
+                "---\ntitle: API Design\n---\n\nREST endpoint guide.\n"
+            )
+            (vault / "README.md").write_text("# Vault\n")
+            yield vault
+
+    @pytest.fixture
+    def manager(self):
+        """Create metadata manager."""
+        return MetadataManager()
+
+    def test_scan_extracts_and_persists(self, vault_path, manager):
+        """Test scanning stores metadata on disk."""
+        index = MetadataIndex.for_directory(vault_path, manager)
+        items = index.scan(vault_path, skip=lambda p: p.name == "README.md")
+
+        titles = sorted(metadata.title for _, metadata in items)
+        assert titles == ["API Design", "Python Tips"]
+        assert (vault_path / ".ckc" / "metadata_index.db").exists()
+        assert index.get_stats()["entries"] == 2
+        index.close()
+
+    def test_unchanged_files_are_not_reparsed(self, vault_path, manager):
+        """Test a second scan is served entirely from the index."""
+        MetadataIndex.for_directory(vault_path, manager).scan(vault_path)
+
+        index = MetadataIndex.for_directory(vault_path, manager)
+        with patch.object(manager, "extract_metadata_from_file") as mock_extract:
+            items = index.scan(vault_path)
+
+        mock_extract.assert_not_called()
+        assert len(items) == 3
+        assert index.hits == 3
+        assert index.misses == 0
+        index.close()
+
+    def test_changed_file_is_reparsed(self, vault_path, manager):
+        """Test files with a new mtime or size are extracted again."""
+        index = MetadataIndex.for_directory(vault_path, manager)
+        target = vault_path / "notes" / "api.md"
+        assert index.get(target).title == "API Design"
+
+        target.write_text("---\ntitle: API Design v2\n---\n\nGraphQL.\n")
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.get(target).title == "API Design v2"
+        assert index.misses == 2
+        index.close()
+
+    def test_deleted_files_are_pruned(self, vault_path, manager):
+        """Test scan drops entries for files that no longer exist."""
+        index = MetadataIndex.for_directory(vault_path, manager)
+        index.scan(vault_path)
+        (vault_path / "notes" / "python.md").unlink()
+
+        items = index.scan(vault_path)
+
+        assert len(items) == 2
+        assert index.get_stats()["entries"] == 2
+        index.close()
+
+    def test_tag_config_change_invalidates_index(self, vault_path, manager):
+        """Test a different tag configuration starts from an empty index."""
+        MetadataIndex.for_directory(vault_path, manager).scan(vault_path)
+
+        custom_manager = MetadataManager(tag_config={"type": ["prompt"]})
+        index = MetadataIndex.for_directory(vault_path, custom_manager)
+
+        assert index.get_stats()["entries"] == 0
+        index.close()
+
+    def test_project_change_reextracts_unchanged_files(self, vault_path):
+        """Test a new project.yaml refreshes auto-detected projects."""
+        index = MetadataIndex.for_directory(
+            vault_path, MetadataManager(project_cache=ProjectResolutionCache())
+        )
+        target = vault_path / "notes" / "api.md"
+        assert "renamed" not in dict(index.scan(vault_path))[target].projects
+        index.close()
+
+        claude_dir = vault_path / "notes" / ".claude"
+        claude_dir.mkdir()
+        (claude_dir / "project.yaml").write_text("project_name: renamed\n")
+
+        # A later run resolves projects afresh
+        manager = MetadataManager(project_cache=ProjectResolutionCache())
+        index = MetadataIndex.for_directory(vault_path, manager)
+        items = dict(index.scan(vault_path))
+
+        assert items[target].projects == ["renamed"]
+        assert items[vault_path / "README.md"].projects != ["renamed"]
+        assert index.misses == 2
+        assert index.hits == 1
+        index.close()
+
+    def test_errors_are_reported(self, vault_path, manager):
+        """Test parse failures are reported and skipped."""
+        errors = []
+        index = MetadataIndex(None, manager)
+
+        with patch.object(
+            manager, "extract_metadata_from_file", side_effect=ValueError("bad")
+        ):
+            items = index.scan(
+                vault_path, on_error=lambda path, error: errors.append(path)
+            )
+
+        assert items == []
+        assert len(errors) == 3
+        index.close()
+
+    def test_get_missing_file(self, manager):
+        """Test missing files raise like MetadataManager does."""
+        with MetadataIndex(None, manager) as index:
+            with pytest.raises(FileNotFoundError):
+                index.get(Path("/nonexistent/file.md"))
+
+
+class TestMetadataIndexSearch:
+    """Test posting-list search over the metadata index."""
+
+    NOTES = {
+        "flask": ("code", "production", ["python"], ["web-dev"], 90, "03"),
+        "django": ("code", "draft", ["python"], ["web-dev"], 60, "02"),
+        "pandas": ("concept", "production", ["python"], ["data-science"], 80, "01"),
+        "react": ("code", "production", ["javascript"], ["web-dev"], None, "04"),
+    }
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index over a vault with a few tagged notes."""
+        for name, (kind, status, tech, domain, rate, day) in self.NOTES.items():
+            lines = [
+                f"title: {name.title()}",
+                f"type: {kind}",
+                f"status: {status}",
+                f"tech: {tech}",
+                f"domain: {domain}",
+                f'updated: "2024-01-{day}T09:00:00"',
+            ]
+            if rate is not None:
+                lines.append(f"success_rate: {rate}")
+            (tmp_path / f"{name}.md").write_text(
+                "---\n" + "\n".join(lines) + "\n---\n\nBody.\n"
+            )
+
+        index = MetadataIndex(None, MetadataManager())
+        assert index.refresh(tmp_path) == 4
+        yield index
+        index.close()
+
+    def titles(self, results):
+        """Titles of search results in order."""
+        return [metadata.title for _, metadata in results]
+
+    def test_filters_intersect(self, index, tmp_path):
+        """Test several filters return the intersection, newest first."""
+        results = index.search(
+            tmp_path, {"type": "code", "tech": "python", "domain": "web-dev"}
+        )
+        assert self.titles(results) == ["Flask", "Django"]
+
+        results = index.search(tmp_path, {"status": "production", "tech": "python"})
+        assert self.titles(results) == ["Flask", "Pandas"]
+
+        assert index.search(tmp_path, {"tech": "rust"}) == []
+
+    def test_range_limit_and_predicate(self, index, tmp_path):
+        """Test success rate, limit and extra predicates."""
+        assert self.titles(index.search(tmp_path, min_success_rate=75)) == [
+            "Flask",
+            "Pandas",
+        ]
+        assert self.titles(index.search(tmp_path, limit=2)) == ["React", "Flask"]
+        assert self.titles(
+            index.search(
+                tmp_path,
+                {"type": "code"},
+                predicate=lambda metadata: metadata.title != "React",
+                limit=1,
+            )
+        ) == ["Flask"]
+
+    def test_unknown_field_rejected(self, index, tmp_path):
+        """Test filters on fields without posting lists are rejected."""
+        with pytest.raises(ValueError):
+            index.search(tmp_path, {"title": "Flask"})
+
+    def test_postings_follow_changes(self, index, tmp_path):
+        """Test edits and deletions update the posting lists."""
+        flask = tmp_path / "flask.md"
+        flask.write_text(
+            flask.read_text().replace("status: production", "status: tested")
+        )
+        stat = flask.stat()
+        os.utime(flask, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (tmp_path / "pandas.md").unlink()
+
+        assert index.refresh(tmp_path) == 1
+
+        assert self.titles(index.search(tmp_path, {"status": "production"})) == [
+            "React"
+        ]
+        assert self.titles(index.search(tmp_path, {"status": "tested"})) == ["Flask"]
+        with index._lock:
+            (orphans,) = index._conn.execute(
+                "SELECT COUNT(*) FROM postings "
+                "WHERE entry_id NOT IN (SELECT id FROM entries)"
+            ).fetchone()
+        assert orphans == 0
+
+
+class TestMetadataIndexFullText:
+    """Test BM25 full-text search over note bodies."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index over English and Japanese notes."""
+        notes = {
+            "async.md": (
+                "Async IO",
+                "code",
+                "Event loops schedule coroutines. Coroutines await futures.",
+            ),
+            "loops.md": ("Loops", "concept", "A for loop repeats; coroutines appear."),
+            "tokyo.md": ("東京メモ", "concept", "東京都の非同期処理についてのメモ。"),
+            "kyoto.md": ("京都", "concept", "京都の寺について。"),
+        }
+        for name, (title, kind, body) in notes.items():
+            (tmp_path / name).write_text(
+                f"---\ntitle: {title}\ntype: {kind}\n---\n\n{body}\n",
+                encoding="utf-8",
+            )
+
+        index = MetadataIndex(None, MetadataManager())
+        index.refresh(tmp_path)
+        yield index
+        index.close()
+
+    def titles(self, hits):
+        """Titles of ranked hits in order."""
+        return [metadata.title for _, metadata, _ in hits]
+
+    def test_body_terms_are_ranked(self, index, tmp_path):
+        """Test body-only terms are found and higher tf ranks first."""
+        hits = index.search_text(tmp_path, "coroutines")
+
+        assert self.titles(hits) == ["Async IO", "Loops"]
+        assert hits[0][2] > hits[1][2] > 0
+
+    def test_japanese_query(self, index, tmp_path):
+        """Test Japanese queries match bigrams inside sentences."""
+        assert self.titles(index.search_text(tmp_path, "非同期")) == ["東京メモ"]
+        assert self.titles(index.search_text(tmp_path, "東京都"))[0] == "東京メモ"
+
+    def test_filters_and_limit(self, index, tmp_path):
+        """Test tag filters restrict candidates and limit keeps the top hits."""
+        assert self.titles(
+            index.search_text(tmp_path, "coroutines", {"type": "concept"})
+        ) == ["Loops"]
+        assert len(index.search_text(tmp_path, "coroutines", limit=1)) == 1
+        assert index.search_text(tmp_path, "the") == []
+        assert index.search_text(tmp_path, "nonexistent") == []
+
+    def test_terms_follow_edits(self, index, tmp_path):
+        """Test re-extracted notes replace their indexed terms."""
+        note = tmp_path / "kyoto.md"
+        note.write_text(
+            "---\ntitle: 京都\n---\n\nCoroutines everywhere.\n", encoding="utf-8"
+        )
+        stat = note.stat()
+        os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        index.refresh(tmp_path)
+
+        assert "京都" in self.titles(index.search_text(tmp_path, "coroutines"))
+        assert index.search_text(tmp_path, "寺") == []
+
+
+class TestMetadataIndexRelated:
+    """Test tag-overlap lookups of related notes."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index over notes with overlapping tags."""
+        notes = {
+            "self.md": ["python", "testing", "ci"],
+            "twin.md": ["python", "testing", "ci"],
+            "close.md": ["python", "testing", "ci", "docker"],
+            "rare.md": ["ci", "fixtures"],
+            "common.md": ["python", "web"],
+            "other.md": ["design"],
+        }
+        for name, tags in notes.items():
+            (tmp_path / name).write_text(
+                f"---\ntitle: {name[:-3]}\ntags: [{', '.join(tags)}]\n---\n\nBody\n"
+            )
+        for number in range(5):
+            (tmp_path / f"filler{number}.md").write_text(
+                f"---\ntitle: filler{number}\ntags: [python, web]\n---\n\nBody\n"
+            )
+
+        index = MetadataIndex(None, MetadataManager())
+        index.refresh(tmp_path)
+        yield index
+        index.close()
+
+    def names(self, hits):
+        """File names of hits in order."""
+        return [path.name for path, _, _ in hits]
+
+    def test_ranked_by_jaccard(self, index, tmp_path):
+        """Test identical tag sets rank first and the note itself is excluded."""
+        hits = index.related(
+            tmp_path, ["python", "testing", "ci"], exclude=tmp_path / "self.md"
+        )
+
+        assert self.names(hits)[:2] == ["twin.md", "close.md"]
+        assert hits[0][2] == pytest.approx(1.0)
+        assert hits[1][2] == pytest.approx(0.75)
+        assert "self.md" not in self.names(hits)
+        assert "other.md" not in self.names(hits)
+
+    def test_rare_shared_tags_break_ties(self, index, tmp_path):
+        """Test equal Jaccard scores prefer the neighbour sharing a rarer tag."""
+        hits = index.related(tmp_path, ["ci", "web"], limit=20)
+        scores = {path.name: score for path, _, score in hits}
+
+        # Both share one of three distinct tags, but "ci" is on fewer notes
+        assert scores["rare.md"] == pytest.approx(scores["common.md"])
+        assert self.names(hits).index("rare.md") < self.names(hits).index("common.md")
+
+    def test_limit_skip_and_empty_tags(self, index, tmp_path):
+        """Test limits, skip predicates and tagless queries."""
+        assert len(index.related(tmp_path, ["python"], limit=3)) == 3
+        hits = index.related(
+            tmp_path, ["python"], skip=lambda path: path.name.startswith("filler")
+        )
+        assert not any(name.startswith("filler") for name in self.names(hits))
+        assert index.related(tmp_path, []) == []
+        assert index.related(tmp_path, ["unknown"]) == []
+        assert index.related(tmp_path / "missing", ["python"]) == []
@@ -0,0 +1,102 @@
+"""Tests for compiled classification patterns."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.ai.classification_engine import ClassificationEngine
+from claude_knowledge_catalyst.ai.pattern_loader import PatternLoader
+
+
+class TestCompiledPatterns:
+    """Test cases for PatternLoader.load_compiled_patterns."""
+
+    @pytest.fixture
+    def dirs(self):
+        """Copy the bundled patterns and provide an empty cache directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            patterns_dir = Path(temp_dir) / "patterns"
+            shutil.copytree(Path(PatternLoader().patterns_dir), patterns_dir)
+            yield patterns_dir, Path(temp_dir) / "cache"
+
+    def test_single_scan_matches_per_pattern_scoring(self, dirs):
+        """Test compiled classification equals the pattern-by-pattern scoring."""
+        patterns_dir, cache_dir = dirs
+        engine = ClassificationEngine(PatternLoader(patterns_dir, cache_dir))
+        content = (
+            "FastAPI service in Python: def create_app(), pip install uvicorn. "
+            "Deploy with Docker; fix the Error in the API endpoint."
+        )
+
+        expected = []
+        for patterns, tag_type in [
+            (engine.tech_patterns, "tech"),
+            (engine.domain_patterns, "domain"),
+            (engine.content_patterns, "type"),
+        ]:
+            for name, config in patterns.items():
+                confidence, evidence = engine._calculate_pattern_confidence(
+                    content.lower(), config
+                )
+                if confidence > 0.1:
+                    expected.append((tag_type, name, confidence, evidence))
+
+        results = engine.classify_content(content)
+        actual = [
+            (r.tag_type, r.suggested_value, r.confidence, r.evidence) for r in results
+        ]
+        assert sorted(actual) == sorted(expected)
+        assert any(r.suggested_value == "python" for r in results)
+
+    def test_compiled_artifact_skips_yaml(self, dirs):
+        """Test a second loader reuses the artifact without parsing YAML."""
+        patterns_dir, cache_dir = dirs
+        first = PatternLoader(patterns_dir, cache_dir).load_compiled_patterns()
+        assert len(list(cache_dir.glob("patterns-*.pickle"))) == 1
+
+        loader = PatternLoader(patterns_dir, cache_dir)
+        with patch("yaml.safe_load") as mock_load:
+            compiled = loader.load_compiled_patterns()
+            tech_patterns = loader.load_tech_patterns()
+
+        mock_load.assert_not_called()
+        assert compiled.patterns == first.patterns
+        assert "python" in tech_patterns
+
+    def test_pattern_file_change_rebuilds(self, dirs):
+        """Test editing a pattern file invalidates the compiled artifact."""
+        patterns_dir, cache_dir = dirs
+        PatternLoader(patterns_dir, cache_dir).load_compiled_patterns()
+
+        with open(patterns_dir / "tech_patterns.yaml", "a", encoding="utf-8") as f:
+            f.write(
+                "\nzig:\n  high_confidence:\n    - 'zig build'\n"
+                "  medium_confidence: []\n  keywords: []\n"
+            )
+
+        engine = ClassificationEngine(PatternLoader(patterns_dir, cache_dir))
+        results = engine.classify_content("Run zig build for release")
+        assert any(r.suggested_value == "zig" for r in results)
+
+    def test_corrupt_artifact_is_ignored(self, dirs):
+        """Test an unreadable artifact falls back to compiling from YAML."""
+        patterns_dir, cache_dir = dirs
+        loader = PatternLoader(patterns_dir, cache_dir)
+        cache_dir.mkdir()
+        loader.compiled_cache_path.write_bytes(b"not a pickle")
+
+        compiled = loader.load_compiled_patterns()
+        assert "python" in compiled.patterns["tech"]
+
+    def test_reload_patterns_recompiles(self, dirs):
+        """Test reload drops the in-memory compiled patterns."""
+        patterns_dir, _ = dirs
+        loader = PatternLoader(patterns_dir, use_disk_cache=False)
+        first = loader.load_compiled_patterns()
+        assert loader.load_compiled_patterns() is first
+
+        loader.reload_patterns()
+        assert loader.load_compiled_patterns() is not first
@@ -1,5 +1,6 @@
 """Performance tests for Claude Knowledge Catalyst."""
 
+import os
 import shutil
 import tempfile
 
@@ -14,14 +15,29 @@ from unittest.mock import patch
 
 import pytest
 
+from claude_knowledge_catalyst.ai.yake_extractor import (
+    YAKE_AVAILABLE,
+    YAKEConfig,
+    YAKEKeywordExtractor,
+)
 from claude_knowledge_catalyst.analytics.knowledge_analytics import (
     KnowledgeAnalytics,
 )
 from claude_knowledge_catalyst.automation.structure_automation import (
     AutomatedStructureManager,
 )
+from claude_knowledge_catalyst.benchmarks import (
+    BenchmarkRun,
+    BenchmarkSuite,
+    find_regressions,
+)
 from claude_knowledge_catalyst.core.config import CKCConfig
-from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.keyword_matcher import KeywordMatcher
+from claude_knowledge_catalyst.core.metadata import (
+    DOMAIN_PATTERNS,
+    TECH_PATTERNS,
+    MetadataManager,
+)
 from claude_knowledge_catalyst.sync.hybrid_manager import HybridObsidianVaultManager
 
 
@@ -574,6 +590,142 @@ File {file_i} in subdirectory {sub_i} of {dir_name}.
             sections["overview"]["total_files"] > 400
         )  # Should have processed many files
 
+    def test_keyword_inference_cost_flat_in_pattern_count(self):
+        """Test single-pass tag inference steps once per character.
+
+        The scan cost is counted in automaton transitions rather than timed,
+        so a 50x larger pattern table must take exactly as many steps.
+        """
+        base_keywords = [
+            (pattern, (field, value))
+            for field, table in (("tech", TECH_PATTERNS), ("domain", DOMAIN_PATTERNS))
+            for value, patterns in table.items()
+            for pattern in patterns
+        ]
+        # 50x larger table of realistic-length keywords that never occur in the text
+        grown_keywords = base_keywords + [
+            (f"{pattern.strip()}-variant{i}", ("tech", f"extra{i}"))
+            for i in range(50)
+            for pattern, _ in base_keywords
+        ]
+
+        document = (
+            "# Deploying a FastAPI service\n\n"
+            "We containerize the python API with docker and run pytest in CI/CD. "
+            "The React frontend talks to a postgres database through REST endpoints.\n"
+        ) * 100
+
+        class CountingTransitions(dict):
+            lookups = 0
+
+            def get(self, *args):
+                CountingTransitions.lookups += 1
+                return super().get(*args)
+
+        def scan_steps(matcher: KeywordMatcher) -> int:
+            matcher._transitions = [
+                CountingTransitions(state) for state in matcher._transitions
+            ]
+            CountingTransitions.lookups = 0
+            matcher.find_labels(document)
+            return CountingTransitions.lookups
+
+        base_matcher = KeywordMatcher(base_keywords)
+        grown_matcher = KeywordMatcher(grown_keywords)
+        assert grown_matcher.find_labels(document) == base_matcher.find_labels(document)
+        assert grown_matcher.state_count > base_matcher.state_count * 10
+
+        base_steps = scan_steps(base_matcher)
+        grown_steps = scan_steps(grown_matcher)
+
+        print(
+            f"\n{base_matcher.keyword_count} keywords: {base_steps} steps, "
+            f"{grown_matcher.keyword_count} keywords: {grown_steps} steps "
+            f"per {len(document)}-char document"
+        )
+        assert base_steps == grown_steps == len(document)
+
+    @pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+    def test_keyword_batch_scaling_across_workers(self, tmp_path):
+        """Benchmark batch keyword extraction as worker processes are added.
+
+        Timings are only reported, since speedups depend on the runner's CPUs;
+        every worker count must produce the serial results.
+        """
+        extractor = YAKEKeywordExtractor(
+            YAKEConfig(persistent_cache=False), cache_dir=tmp_path
+        )
+        topics = ["python", "docker", "kubernetes", "react", "postgres", "terraform"]
+        contents = [
+            f"# Note {i}\n\n"
+            + (
+                f"Deploying the {topics[i % len(topics)]} service with automated "
+                f"testing, monitoring dashboards and incident runbooks. "
+            )
+            * 30
+            for i in range(192)
+        ]
+
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, min(2, cpu_count), min(4, cpu_count), cpu_count})
+        timings = {}
+        results = {}
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results[workers] = extractor.extract_keywords_batch(
+                contents, workers=workers
+            )
+            timings[workers] = time.perf_counter() - start
+
+        print(
+            f"\n{len(contents)} documents: "
+            + ", ".join(
+                f"{workers} worker(s) {timings[workers]:.2f}s "
+                f"({timings[1] / timings[workers]:.1f}x)"
+                for workers in worker_counts
+            )
+        )
+
+        for workers in worker_counts:
+            assert results[workers] == results[1]
+
+    def test_benchmark_suite_against_baseline(self, tmp_path):
+        """Run the benchmark suite on a synthetic vault and check for regressions.
+
+        The vault size defaults to a quick 200 notes; set ``CKC_BENCHMARK_NOTES``
+        (e.g. 1000, 10000, 100000) for a full run. When ``CKC_BENCHMARK_BASELINE``
+        names a results file recorded on the same number of notes, per-item
+        slowdowns beyond 25% fail the test, and
+        ``CKC_BENCHMARK_OUTPUT`` keeps this run's results.
+        """
+        notes = int(os.environ.get("CKC_BENCHMARK_NOTES", "200"))
+        run = BenchmarkSuite(tmp_path, notes, classify_sample=min(notes, 50)).run()
+
+        print(
+            f"\n{notes} notes: "
+            + ", ".join(f"{r.name} {r.seconds:.2f}s" for r in run.results)
+        )
+        output = os.environ.get("CKC_BENCHMARK_OUTPUT")
+        if output:
+            run.save(Path(output))
+
+        assert {r.name for r in run.results} == set(BenchmarkSuite.BENCHMARKS)
+        # Unchanged sources make incremental sync far cheaper than the first sync
+        assert run.result("sync.incremental").seconds < run.result("sync.cold").seconds
+
+        baseline = os.environ.get("CKC_BENCHMARK_BASELINE")
+        if baseline:
+            reference = BenchmarkRun.load(Path(baseline))
+            if not run.is_comparable(reference):
+                pytest.skip(
+                    f"Baseline was recorded on {reference.notes} notes; "
+                    f"set CKC_BENCHMARK_NOTES={reference.notes} to compare"
+                )
+            regressions = find_regressions(run, reference)
+            assert not regressions, ", ".join(
+                f"{r.name} {r.slowdown:.0%} slower" for r in regressions
+            )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+"""Tests for the command profiler and `ckc profile`."""
+
+import pstats
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from claude_knowledge_catalyst.analytics.profiler import CommandProfiler
+from claude_knowledge_catalyst.cli.main import app
+
+
+def busy_work(size=20_000):
+    """Allocate and sum a list so the profile has something to show."""
+    values = [index * 2 for index in range(size)]
+    return sum(values)
+
+
+class TestCommandProfiler:
+    """Test cases for CommandProfiler."""
+
+    def test_run_writes_stats_and_summary(self, tmp_path):
+        """Test a run returns the result and writes loadable reports."""
+        profiler = CommandProfiler(tmp_path / "profiles", top_n=5)
+
+        result, report = profiler.run("search python", busy_work)
+
+        assert result == busy_work()
+        assert report.stats_path.name.endswith("-search-python.prof")
+        assert report.peak_memory_bytes is None
+        assert 0 < len(report.hot_functions) <= 5
+        assert any("busy_work" in hot.location for hot in report.hot_functions)
+
+        stats = pstats.Stats(str(report.stats_path))
+        assert stats.total_calls > 0  # type: ignore[attr-defined]
+        summary = report.summary_path.read_text()
+        assert "Command: search python" in summary
+        assert "Top 5 functions by own time" in summary
+        assert "Top 5 functions by cumulative time" in summary
+        assert "allocation sites" not in summary
+
+    def test_runs_within_one_second_keep_separate_reports(self, tmp_path):
+        """Test repeated runs of a command never overwrite earlier reports."""
+        profiler = CommandProfiler(tmp_path / "profiles", top_n=5)
+
+        with patch("claude_knowledge_catalyst.analytics.profiler.datetime") as clock:
+            clock.now.return_value = datetime(2026, 1, 1, 12, 0, 0)
+            reports = [profiler.run("sync", busy_work)[1] for _ in range(3)]
+
+        assert len({report.stats_path for report in reports}) == 3
+        assert [report.summary_path.name for report in reports] == [
+            "20260101-120000-sync.txt",
+            "20260101-120000-2-sync.txt",
+            "20260101-120000-3-sync.txt",
+        ]
+        assert all(report.stats_path.exists() for report in reports)
+
+    def test_memory_tracing_reports_peak(self, tmp_path):
+        """Test tracemalloc peak and allocation sites are reported."""
+        profiler = CommandProfiler(tmp_path, trace_memory=True)
+
+        _, report = profiler.run("sync", lambda: busy_work(100_000))
+
+        assert report.peak_memory_bytes is not None
+        assert report.peak_memory_bytes > 100_000
+        summary = report.summary_path.read_text()
+        assert "Peak traced memory" in summary
+        assert "allocation sites" in summary
+
+    def test_reports_written_when_call_fails(self, tmp_path):
+        """Test a failing call still leaves its profile behind."""
+        profiler = CommandProfiler(tmp_path)
+
+        def failing():
+            busy_work()
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            profiler.run("analyze", failing)
+
+        assert len(list(tmp_path.glob("*-analyze.prof"))) == 1
+        assert len(list(tmp_path.glob("*-analyze.txt"))) == 1
+
+
+class TestProfileCommand:
+    """Test cases for the profile CLI command."""
+
+    def test_profiles_subcommand(self, tmp_path):
+        """Test the wrapped command runs and reports land in the output dir."""
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["profile", "--output-dir", str(tmp_path), "--top", "3", "status"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Profile of:" in result.output
+        assert len(list(tmp_path.glob("*-status.prof"))) == 1
+        assert len(list(tmp_path.glob("*-status.txt"))) == 1
+
+    def test_exit_code_of_failing_command_is_kept(self, tmp_path):
+        """Test a failing subcommand's exit code is returned after profiling."""
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            [
+                "profile",
+                "--output-dir",
+                str(tmp_path),
+                "analyze",
+                str(tmp_path / "missing.md"),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert len(list(tmp_path.glob("*.prof"))) == 1
+
+    def test_profile_cannot_wrap_itself(self, tmp_path):
+        """Test nested profiling is refused."""
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["profile", "--output-dir", str(tmp_path), "profile", "status"]
+        )
+
+        assert result.exit_code == 1
+        assert list(tmp_path.iterdir()) == []
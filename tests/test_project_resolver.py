@@ -0,0 +1,79 @@
+"""Tests for directory-level project resolution caching."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.project_resolver import ProjectResolutionCache
+
+
+class TestProjectResolutionCache:
+    """Test cases for ProjectResolutionCache."""
+
+    @pytest.fixture
+    def workspace(self):
+        """Create a repository-like tree with nested note directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir) / "my-repo"
+            (repo / ".git").mkdir(parents=True)
+            notes = repo / "docs" / "notes"
+            notes.mkdir(parents=True)
+            for i in range(20):
+                (notes / f"note_{i}.md").write_text(f"# Note {i}\n")
+            yield repo
+
+    def test_git_root_detection(self, workspace):
+        """Test project name comes from the git root directory."""
+        cache = ProjectResolutionCache()
+        assert cache.resolve_project(workspace / "docs" / "notes") == "my-repo"
+
+    def test_project_yaml_takes_precedence(self, workspace):
+        """Test .claude/project.yaml overrides the git repository name."""
+        (workspace / ".claude").mkdir()
+        (workspace / ".claude" / "project.yaml").write_text(
+            "project_name: configured-name\n"
+        )
+        cache = ProjectResolutionCache()
+        assert cache.resolve_project(workspace / "docs") == "configured-name"
+
+    def test_one_lookup_per_directory(self, workspace):
+        """Test bulk extraction walks each directory once and never forks git."""
+        manager = MetadataManager(project_cache=ProjectResolutionCache())
+        notes = sorted((workspace / "docs" / "notes").glob("*.md"))
+
+        with patch("subprocess.run") as mock_run:
+            projects = {manager._auto_detect_project(note) for note in notes}
+
+        mock_run.assert_not_called()
+        assert projects == {"my-repo"}
+        lookups_after_first_pass = manager.project_cache.lookups
+
+        for note in notes:
+            manager._auto_detect_project(note)
+        assert manager.project_cache.lookups == lookups_after_first_pass
+
+    def test_invalidate_subtree(self, workspace):
+        """Test a new project.yaml is picked up after invalidation."""
+        cache = ProjectResolutionCache()
+        notes_dir = workspace / "docs" / "notes"
+        assert cache.resolve_project(notes_dir) == "my-repo"
+
+        claude_dir = workspace / "docs" / ".claude"
+        claude_dir.mkdir()
+        (claude_dir / "project.yaml").write_text("project_name: docs-site\n")
+        assert cache.resolve_project(notes_dir) == "my-repo"
+
+        cache.invalidate(claude_dir)
+        assert cache.resolve_project(notes_dir) == "docs-site"
+
+    def test_invalidate_all(self, workspace):
+        """Test clearing the whole cache."""
+        cache = ProjectResolutionCache()
+        cache.resolve_project(workspace / "docs")
+        assert len(cache) > 0
+
+        cache.invalidate()
+        assert len(cache) == 0
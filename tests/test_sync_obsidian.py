@@ -10,6 +10,7 @@ import pytest
 
 from claude_knowledge_catalyst.core.config import SyncTarget
 from claude_knowledge_catalyst.core.metadata import KnowledgeMetadata, MetadataManager
+from claude_knowledge_catalyst.core.project_resolver import ProjectResolutionCache
 from claude_knowledge_catalyst.sync.obsidian import ObsidianVaultManager
 
 
@@ -350,3 +351,151 @@ class TestObsidianVaultManagerErrorHandling:
         result = vault_manager.sync_file(source_file)
         # Should handle gracefully
         assert result in [True, False]  # Depends on error handling implementation
+
+
+class TestIncrementalDirectorySync:
+    """Test manifest-based incremental directory sync."""
+
+    @pytest.fixture
+    def workspace(self):
+        """Create a source directory with dated notes and an empty vault."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / ".claude"
+            source_dir.mkdir()
+            for name in ["alpha", "beta", "gamma"]:
+                (source_dir / f"{name}.md").write_text(
+                    f'---\ntitle: {name.title()}\ncreated: "2024-01-01T09:00:00"\n'
+                    f'updated: "2024-01-02T09:00:00"\nstatus: tested\n---\n\n# {name}\n'
+                )
+            yield source_dir, Path(temp_dir) / "vault"
+
+    def test_second_run_skips_unchanged_files(self, workspace):
+        """Test an unchanged tree is skipped without extracting metadata."""
+        source_dir, vault_path = workspace
+        manager = MetadataManager()
+        ObsidianVaultManager(vault_path, manager).sync_directory(source_dir)
+
+        vault_manager = ObsidianVaultManager(vault_path, manager)
+        with patch.object(manager, "extract_metadata_bulk") as mock_bulk:
+            mock_bulk.return_value = []
+            results = vault_manager.sync_directory(source_dir)
+
+        mock_bulk.assert_called_once_with([])
+        assert all(results.values())
+        assert vault_manager.last_sync_summary.to_dict() == {
+            "updated": 0,
+            "skipped": 3,
+            "removed": 0,
+            "failed": 0,
+        }
+        assert (vault_path / ".ckc" / "sync_manifest.json").exists()
+
+    def test_identical_output_is_not_rewritten(self, workspace):
+        """Test a touched source re-renders but leaves the target alone."""
+        source_dir, vault_path = workspace
+        vault_manager = ObsidianVaultManager(vault_path, MetadataManager())
+        vault_manager.sync_directory(source_dir)
+        assert vault_manager.last_sync_summary.updated == 3
+
+        # Same content, different size: forces a re-render of identical output
+        source = source_dir / "alpha.md"
+        source.write_text(source.read_text() + "\n")
+        target = vault_path / "knowledge" / "20240101_Alpha.md"
+        target_mtime = target.stat().st_mtime_ns
+
+        vault_manager.sync_directory(source_dir)
+
+        assert vault_manager.last_sync_summary.updated == 0
+        assert vault_manager.last_sync_summary.skipped == 3
+        assert target.stat().st_mtime_ns == target_mtime
+
+    def test_undated_note_renders_identically(self, workspace):
+        """Test notes without timestamps are not rewritten when the stat misses."""
+        source_dir, vault_path = workspace
+        (source_dir / "undated.md").write_text(
+            "---\ntitle: Undated\nstatus: tested\n---\n\n# undated\n"
+        )
+        vault_manager = ObsidianVaultManager(vault_path, MetadataManager())
+        vault_manager.sync_directory(source_dir)
+        (target,) = (vault_path / "knowledge").glob("*_Undated.md")
+        target_mtime = target.stat().st_mtime_ns
+
+        # Without the manifest every source is rendered again
+        (vault_path / ".ckc" / "sync_manifest.json").unlink()
+        vault_manager = ObsidianVaultManager(vault_path, MetadataManager())
+        vault_manager.sync_directory(source_dir)
+
+        assert vault_manager.last_sync_summary.updated == 0
+        assert target.stat().st_mtime_ns == target_mtime
+
+    def test_changed_and_removed_sources(self, workspace):
+        """Test edits are synced and deleted sources drop their targets."""
+        source_dir, vault_path = workspace
+        vault_manager = ObsidianVaultManager(vault_path, MetadataManager())
+        vault_manager.sync_directory(source_dir)
+
+        (source_dir / "alpha.md").write_text(
+            '---\ntitle: Alpha\ncreated: "2024-01-01T09:00:00"\n'
+            'updated: "2024-01-02T09:00:00"\n'
+            "status: tested\n---\n\n# alpha\n\nNew section.\n"
+        )
+        (source_dir / "beta.md").unlink()
+
+        vault_manager.sync_directory(source_dir)
+
+        assert vault_manager.last_sync_summary.to_dict() == {
+            "updated": 1,
+            "skipped": 1,
+            "removed": 1,
+            "failed": 0,
+        }
+        assert (
+            "New section."
+            in (vault_path / "knowledge" / "20240101_Alpha.md").read_text()
+        )
+        assert not (vault_path / "knowledge" / "20240101_Beta.md").exists()
+
+    def test_detected_project_change_resyncs(self, tmp_path):
+        """Test a changed project.yaml re-renders otherwise unchanged sources."""
+        project_yaml = tmp_path / "repo" / ".claude" / "project.yaml"
+        project_yaml.parent.mkdir(parents=True)
+        project_yaml.write_text("project_name: alpha\n")
+        source_dir = tmp_path / "repo" / "docs"
+        source_dir.mkdir()
+        (source_dir / "note.md").write_text(
+            '---\ntitle: Note\ncreated: "2024-01-01T09:00:00"\n'
+            'updated: "2024-01-02T09:00:00"\nstatus: tested\n---\n\n# note\n'
+        )
+        vault_path = tmp_path / "vault"
+        target = vault_path / "knowledge" / "20240101_Note.md"
+
+        def sync() -> ObsidianVaultManager:
+            manager = MetadataManager(project_cache=ProjectResolutionCache())
+            vault_manager = ObsidianVaultManager(vault_path, manager)
+            vault_manager.sync_directory(source_dir)
+            return vault_manager
+
+        sync()
+        assert "[[alpha]]" in target.read_text()
+
+        project_yaml.write_text("project_name: beta\n")
+        vault_manager = sync()
+
+        assert vault_manager.last_sync_summary.updated == 1
+        assert "[[beta]]" in target.read_text()
+        assert "[[alpha]]" not in target.read_text()
+
+    def test_edited_vault_copy_is_kept(self, workspace):
+        """Test a target edited in the vault is not deleted with its source."""
+        source_dir, vault_path = workspace
+        vault_manager = ObsidianVaultManager(vault_path, MetadataManager())
+        vault_manager.sync_directory(source_dir)
+
+        target = vault_path / "knowledge" / "20240101_Gamma.md"
+        target.write_text(target.read_text() + "\nVault-only notes.\n")
+        (source_dir / "gamma.md").unlink()
+
+        vault_manager.sync_directory(source_dir)
+
+        assert target.exists()
+        assert vault_manager.last_sync_summary.removed == 0
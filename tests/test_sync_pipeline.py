@@ -0,0 +1,99 @@
+"""Tests for the multi-target sync pipeline."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.sync.obsidian import ObsidianVaultManager
+from claude_knowledge_catalyst.sync.pipeline import MultiTargetSyncPipeline
+
+
+class TestMultiTargetSyncPipeline:
+    """Test cases for MultiTargetSyncPipeline."""
+
+    @pytest.fixture
+    def workspace(self):
+        """Create a source directory with a few notes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / ".claude"
+            source_dir.mkdir()
+            for name in ["alpha", "beta"]:
+                (source_dir / f"{name}.md").write_text(
+                    f'---\ntitle: {name.title()}\ncreated: "2024-01-01T09:00:00"\n'
+                    f'updated: "2024-01-02T09:00:00"\nstatus: tested\n---\n\n# {name}\n'
+                )
+            yield Path(temp_dir), source_dir
+
+    @pytest.fixture
+    def manager(self):
+        """Create metadata manager."""
+        return MetadataManager()
+
+    def make_pipeline(self, root, manager, names):
+        """Create a pipeline with one vault per name."""
+        return MultiTargetSyncPipeline(
+            {name: ObsidianVaultManager(root / name, manager) for name in names},
+            manager,
+        )
+
+    def test_sources_parsed_once_for_all_targets(self, workspace, manager):
+        """Test three vaults share a single metadata extraction."""
+        root, source_dir = workspace
+        pipeline = self.make_pipeline(root, manager, ["one", "two", "three"])
+
+        with patch.object(
+            manager,
+            "extract_metadata_from_file",
+            wraps=manager.extract_metadata_from_file,
+        ) as mock_extract:
+            results = pipeline.sync_directory(source_dir)
+
+        assert mock_extract.call_count == 2
+        assert list(results) == ["one", "two", "three"]
+        for name, target_result in results.items():
+            assert target_result.error is None
+            assert target_result.success_count == 2
+            assert target_result.summary.updated == 2
+            assert (root / name / "knowledge" / "20240101_Alpha.md").exists()
+
+    def test_only_stale_targets_need_parsing(self, workspace, manager):
+        """Test a new vault added later is filled without re-syncing others."""
+        root, source_dir = workspace
+        self.make_pipeline(root, manager, ["one"]).sync_directory(source_dir)
+
+        pipeline = self.make_pipeline(root, manager, ["one", "two"])
+        results = pipeline.sync_directory(source_dir)
+
+        assert results["one"].summary.skipped == 2
+        assert results["one"].summary.updated == 0
+        assert results["two"].summary.updated == 2
+
+    def test_target_failure_is_isolated(self, workspace, manager):
+        """Test an error in one target does not affect the others."""
+        root, source_dir = workspace
+        pipeline = self.make_pipeline(root, manager, ["good", "bad"])
+
+        with patch.object(
+            pipeline.vault_managers["bad"],
+            "plan_directory_sync",
+            side_effect=OSError("disk full"),
+        ):
+            results = pipeline.sync_directory(source_dir)
+
+        assert results["good"].success_count == 2
+        assert isinstance(results["bad"].error, OSError)
+
+    def test_sync_files(self, workspace, manager):
+        """Test syncing individual files (watch mode) to several targets."""
+        root, source_dir = workspace
+        pipeline = self.make_pipeline(root, manager, ["one", "two"])
+        missing = source_dir / "missing.md"
+
+        results = pipeline.sync_files([source_dir / "alpha.md", missing])
+
+        for target_result in results.values():
+            assert target_result.results[str(source_dir / "alpha.md")] is True
+            assert target_result.failed_files == [str(missing)]
@@ -0,0 +1,32 @@
+"""Tests for the full-text search tokenizer."""
+
+from claude_knowledge_catalyst.core.frontmatter_reader import strip_frontmatter
+from claude_knowledge_catalyst.core.text_tokenizer import tokenize
+
+
+class TestTokenize:
+    """Test cases for tokenize."""
+
+    def test_english_words(self):
+        """Test lowercasing and stopword removal."""
+        assert tokenize("The Quick API for a REST service") == [
+            "quick",
+            "api",
+            "rest",
+            "service",
+        ]
+
+    def test_japanese_bigrams(self):
+        """Test Japanese runs become overlapping bigrams."""
+        assert tokenize("東京都") == ["東京", "京都"]
+        assert tokenize("型") == ["型"]
+
+    def test_mixed_and_width_normalization(self):
+        """Test mixed scripts split cleanly and full-width forms fold."""
+        assert tokenize("Python入門") == ["python", "入門"]
+        assert tokenize("ＡＰＩ設計") == tokenize("API設計") == ["api", "設計"]
+
+    def test_strip_frontmatter(self):
+        """Test the header block is removed from indexed text."""
+        assert strip_frontmatter("---\ntitle: x\n---\nBody\n") == "Body\n"
+        assert strip_frontmatter("# No header\n") == "# No header\n"
@@ -0,0 +1,223 @@
+"""Tests for hierarchical span tracing."""
+
+import contextvars
+import json
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from claude_knowledge_catalyst.analytics.knowledge_analytics import KnowledgeAnalytics
+from claude_knowledge_catalyst.analytics.usage_statistics import PerformanceMonitor
+from claude_knowledge_catalyst.cli.main import app
+from claude_knowledge_catalyst.core import tracing
+from claude_knowledge_catalyst.core.config import CKCConfig
+from claude_knowledge_catalyst.core.metadata import MetadataManager
+from claude_knowledge_catalyst.core.tracing import (
+    Tracer,
+    current_span,
+    get_tracer,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+)
+from claude_knowledge_catalyst.sync.obsidian import ObsidianVaultManager
+from claude_knowledge_catalyst.sync.pipeline import MultiTargetSyncPipeline
+
+
+@pytest.fixture
+def tracer():
+    """Activate a fresh tracer for the test."""
+    active = start_tracing()
+    yield active
+    stop_tracing()
+
+
+def spans_by_name(tracer):
+    """Finished spans keyed by name (last one wins)."""
+    return {span.name: span for span in tracer.spans}
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_spans_nest_by_context(self, tracer):
+        """Test spans record their enclosing span as parent."""
+        with trace_span("outer") as outer:
+            with trace_span("inner", step=1) as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+        assert current_span() is None
+
+        spans = spans_by_name(tracer)
+        assert spans["outer"].parent_id is None
+        assert spans["inner"].parent_id == spans["outer"].span_id
+        assert spans["inner"].args == {"step": 1}
+        assert spans["outer"].start_ns <= spans["inner"].start_ns
+        assert spans["inner"].end_ns <= spans["outer"].end_ns
+
+    def test_span_closed_on_exception(self, tracer):
+        """Test a failing block still finishes its span."""
+        with pytest.raises(ValueError):
+            with trace_span("failing"):
+                raise ValueError("boom")
+
+        assert spans_by_name(tracer)["failing"].end_ns is not None
+        assert current_span() is None
+
+    def test_threads_keep_copied_parent(self, tracer):
+        """Test work run in a copied context nests under the caller's span."""
+
+        def work():
+            with trace_span("worker"):
+                pass
+
+        with trace_span("parent"):
+            context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(work,), name="ckc-test")
+        thread.start()
+        thread.join()
+
+        spans = spans_by_name(tracer)
+        assert spans["worker"].parent_id == spans["parent"].span_id
+        assert spans["worker"].thread_id == thread.ident
+        assert spans["worker"].thread_id != spans["parent"].thread_id
+
+    def test_disabled_tracing_is_noop(self):
+        """Test trace_span records nothing without an active tracer."""
+        assert get_tracer() is None
+        with trace_span("ignored") as span:
+            assert span is None
+            assert current_span() is None
+
+    def test_max_spans_drops_extra(self):
+        """Test spans beyond the limit are counted but not kept."""
+        limited = Tracer(max_spans=2)
+        for index in range(5):
+            with limited.span(f"span-{index}"):
+                pass
+
+        assert len(limited.spans) == 2
+        assert limited.dropped_spans == 3
+
+    def test_chrome_trace_format(self, tracer, tmp_path):
+        """Test export produces complete events with parent links."""
+        with trace_span("sync.directory", source=Path("notes")):
+            with trace_span("sync.extract", files=3):
+                pass
+
+        path = tracer.export_chrome_trace(tmp_path / "out" / "trace.json")
+        document = json.loads(path.read_text())
+
+        events = [e for e in document["traceEvents"] if e["ph"] == "X"]
+        metadata = [e for e in document["traceEvents"] if e["ph"] == "M"]
+        assert [e["name"] for e in events] == ["sync.directory", "sync.extract"]
+        outer, inner = events
+        assert outer["cat"] == "sync"
+        assert outer["args"]["source"] == "notes"
+        assert inner["args"]["parent_id"] == outer["args"]["span_id"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+        assert metadata and metadata[0]["name"] == "thread_name"
+
+    def test_stop_tracing_returns_tracer(self):
+        """Test stopping tracing hands back the active tracer."""
+        active = start_tracing()
+        assert stop_tracing() is active
+        assert tracing.get_tracer() is None
+
+
+class TestTracedOperations:
+    """Test cases for instrumented code paths."""
+
+    def test_performance_monitors_nest(self, tracer):
+        """Test nested monitors become nested spans and still report timing."""
+        collector = Mock()
+        with PerformanceMonitor(collector, "outer_op"):
+            with PerformanceMonitor(collector, "inner_op", {"files": 2}):
+                pass
+
+        spans = spans_by_name(tracer)
+        assert spans["inner_op"].parent_id == spans["outer_op"].span_id
+        assert spans["inner_op"].args == {"files": 2}
+        assert collector.track_operation.call_count == 2
+        name, duration, _ = collector.track_operation.call_args_list[0].args
+        assert name == "inner_op"
+        assert duration >= 0
+
+    def test_monitor_without_collector_only_traces(self, tracer):
+        """Test a monitor without a collector still records its span."""
+        with PerformanceMonitor(None, "standalone"):
+            pass
+
+        assert "standalone" in spans_by_name(tracer)
+
+    def test_analytics_report_spans_each_step(self, tracer, tmp_path):
+        """Test report steps nest under the report span and are timed."""
+        (tmp_path / "note.md").write_text("---\ntitle: Note\ntech: [python]\n---\n")
+        collector = Mock()
+        analytics = KnowledgeAnalytics(
+            tmp_path, CKCConfig(project_root=tmp_path), usage_collector=collector
+        )
+
+        analytics.generate_comprehensive_report()
+        analytics.metadata_index.close()
+
+        spans = spans_by_name(tracer)
+        report = spans["analyze.report"]
+        for name in [
+            "analyze.collect",
+            "analyze.overview",
+            "analyze.quality",
+            "analyze.structure_health",
+            "analyze.recommendations",
+        ]:
+            assert spans[name].parent_id == report.span_id
+        assert spans["analyze.overview"].args == {"files": 1}
+        tracked = [call.args[0] for call in collector.track_operation.call_args_list]
+        assert tracked[-1] == "analyze.report"
+        assert "analyze.evolution" in tracked
+
+    def test_pipeline_spans_cover_each_phase(self, tracer, tmp_path):
+        """Test a multi-target sync records plan, extract, render and write."""
+        source_dir = tmp_path / ".claude"
+        source_dir.mkdir()
+        (source_dir / "note.md").write_text(
+            '---\ntitle: Note\ncreated: "2024-01-01T09:00:00"\n---\n\n# Note\n'
+        )
+        manager = MetadataManager()
+        pipeline = MultiTargetSyncPipeline(
+            {
+                name: ObsidianVaultManager(tmp_path / name, manager)
+                for name in ["one", "two"]
+            },
+            manager,
+        )
+
+        pipeline.sync_directory(source_dir)
+
+        spans = {span.span_id: span for span in tracer.spans}
+        names = [span.name for span in tracer.spans]
+        for name in ["sync.plan", "sync.extract", "sync.render", "sync.write"]:
+            assert name in names
+        assert names.count("sync.apply") == 2
+
+        # Per-target work runs on pool threads but stays under the sync span
+        root = next(s for s in tracer.spans if s.name == "sync.directory")
+        for span in tracer.spans:
+            if span.name == "sync.write":
+                apply_span = spans[span.parent_id]
+                assert apply_span.name == "sync.apply"
+                assert apply_span.parent_id == root.span_id
+
+    def test_cli_trace_option_exports_file(self, tmp_path):
+        """Test --trace writes a trace rooted at the command span."""
+        trace_path = tmp_path / "trace.json"
+        result = CliRunner().invoke(app, ["--trace", str(trace_path), "status"])
+
+        assert get_tracer() is None
+        assert trace_path.exists(), result.output
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        assert any(e["name"] == "cli.status" for e in events)
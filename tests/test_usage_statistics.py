@@ -0,0 +1,328 @@
+"""Tests for usage statistics logging."""
+
+import gc
+import json
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from claude_knowledge_catalyst.analytics import segmented_log
+from claude_knowledge_catalyst.analytics.log_writer import BufferedLogWriter
+from claude_knowledge_catalyst.analytics.segmented_log import SegmentedLog
+from claude_knowledge_catalyst.analytics.usage_statistics import (
+    UsageStatisticsCollector,
+)
+from claude_knowledge_catalyst.core.config import CKCConfig
+
+
+def make_entry(timestamp: datetime, **fields) -> dict:
+    """Log entry at the given time."""
+    return {"timestamp": timestamp.isoformat(), **fields}
+
+
+class TestSegmentedLog:
+    """Test suite for SegmentedLog."""
+
+    def test_entries_are_split_by_day(self, tmp_path):
+        """Each day's entries go to their own segment."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append(
+            [
+                make_entry(datetime(2026, 10, 1, 9), n=1),
+                make_entry(datetime(2026, 10, 2, 9), n=2),
+                make_entry(datetime(2026, 10, 2, 18), n=3),
+            ]
+        )
+
+        assert [path.name for path in log.segments()] == [
+            "2026-10-01.jsonl",
+            "2026-10-02.jsonl",
+        ]
+        entries = list(log.read_since(datetime(2026, 10, 1)))
+        assert [entry["n"] for entry in entries] == [1, 2, 3]
+
+    def test_read_since_skips_segments_before_cutoff(self, tmp_path):
+        """Segments entirely before the window are never opened."""
+        log = SegmentedLog(tmp_path / "log")
+        for day in range(1, 11):
+            log.append([make_entry(datetime(2026, 10, day, 12), day=day)])
+        list(log.read_since(datetime(2026, 10, 1)))  # build the index
+
+        opened = []
+        real_open = open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", tracking_open):
+            entries = list(log.read_since(datetime(2026, 10, 9)))
+
+        assert [entry["day"] for entry in entries] == [9, 10]
+        assert [path for path in opened if path.endswith(".jsonl")] == [
+            str(tmp_path / "log" / "2026-10-09.jsonl"),
+            str(tmp_path / "log" / "2026-10-10.jsonl"),
+        ]
+
+    def test_straddling_segment_is_filtered(self, tmp_path):
+        """Entries before the cutoff in the boundary segment are dropped."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append(
+            [
+                make_entry(datetime(2026, 10, 5, 8), n=1),
+                make_entry(datetime(2026, 10, 5, 12), n=2),
+                make_entry(datetime(2026, 10, 5, 16), n=3),
+            ]
+        )
+
+        entries = list(log.read_since(datetime(2026, 10, 5, 10)))
+        assert [entry["n"] for entry in entries] == [2, 3]
+
+    def test_index_tracks_appends(self, tmp_path):
+        """Entries appended after indexing are still read."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append([make_entry(datetime(2026, 10, 5, 8), n=1)])
+        assert len(list(log.read_since(datetime(2026, 10, 5)))) == 1
+
+        log.append([make_entry(datetime(2026, 10, 5, 20), n=2)])
+        assert len(list(log.read_since(datetime(2026, 10, 5, 12)))) == 1
+
+        index = json.loads(log.index_path.read_text(encoding="utf-8"))
+        segment = index["segments"]["2026-10-05.jsonl"]
+        assert segment["end"] == datetime(2026, 10, 5, 20).isoformat()
+
+    def test_drop_before_deletes_whole_segments(self, tmp_path):
+        """Retention deletes expired segment files and keeps the rest intact."""
+        log = SegmentedLog(tmp_path / "log")
+        for day in range(1, 6):
+            log.append([make_entry(datetime(2026, 10, day, 12), day=day)])
+
+        removed = log.drop_before(datetime(2026, 10, 3))
+
+        assert removed == 2
+        assert [path.name for path in log.segments()] == [
+            "2026-10-03.jsonl",
+            "2026-10-04.jsonl",
+            "2026-10-05.jsonl",
+        ]
+
+    def test_drop_before_trims_straddling_segment(self, tmp_path):
+        """Entries before the cutoff in the boundary segment are removed."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append(
+            [make_entry(datetime(2026, 10, 5, hour), hour=hour) for hour in range(24)]
+        )
+
+        log.drop_before(datetime(2026, 10, 5, 12))
+
+        entries = list(log.read_since(datetime(2026, 1, 1)))
+        assert [entry["hour"] for entry in entries] == list(range(12, 24))
+
+    def test_trim_stops_parsing_at_cutoff(self, tmp_path):
+        """Lines after the first retained entry are copied without parsing."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append(
+            [make_entry(datetime(2026, 10, 5, hour), hour=hour) for hour in range(24)]
+        )
+        path = log.segments()[0]
+
+        with patch(
+            "claude_knowledge_catalyst.analytics.segmented_log._entry_timestamp",
+            wraps=segmented_log._entry_timestamp,
+        ) as parse:
+            removed = log.trim_segment(path, datetime(2026, 10, 5, 3))
+
+        assert removed == 3
+        assert parse.call_count == 4
+
+    def test_interrupted_trim_keeps_original(self, tmp_path):
+        """A failure while copying leaves the segment untouched."""
+        log = SegmentedLog(tmp_path / "log")
+        log.append(
+            [make_entry(datetime(2026, 10, 5, hour), hour=hour) for hour in range(24)]
+        )
+        path = log.segments()[0]
+        original = path.read_bytes()
+
+        with patch("shutil.copyfileobj", side_effect=OSError("disk full")):
+            assert log.trim_segment(path, datetime(2026, 10, 5, 12)) == 0
+
+        assert path.read_bytes() == original
+        assert [p.name for p in path.parent.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_drop_before_runs_alongside_buffered_appends(self, tmp_path):
+        """Entries appended while retention runs are not lost."""
+        log = SegmentedLog(tmp_path / "log")
+        today = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        log.append(
+            [make_entry(today - timedelta(hours=6), old=True) for _ in range(2000)]
+        )
+        writer = BufferedLogWriter(max_buffered=10, flush_interval=0.01)
+
+        def produce() -> None:
+            for n in range(500):
+                writer.submit(log, make_entry(today + timedelta(seconds=n), n=n))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        log.drop_before(today)
+        producer.join()
+        writer.close()
+
+        entries = list(log.read_since(datetime(2000, 1, 1)))
+        assert sorted(entry["n"] for entry in entries) == list(range(500))
+
+    def test_import_legacy(self, tmp_path):
+        """A single-file log is split into segments and removed."""
+        legacy = tmp_path / "usage_log.jsonl"
+        legacy.write_text(
+            json.dumps(make_entry(datetime(2026, 10, 1, 9), n=1))
+            + "\nnot json\n"
+            + json.dumps(make_entry(datetime(2026, 10, 2, 9), n=2))
+            + "\n",
+            encoding="utf-8",
+        )
+        log = SegmentedLog(tmp_path / "log")
+
+        log.import_legacy(legacy)
+
+        assert not legacy.exists()
+        assert len(log.segments()) == 2
+        assert [e["n"] for e in log.read_since(datetime(2026, 1, 1))] == [1, 2]
+
+
+class TestUsageStatisticsCollector:
+    """Test suite for UsageStatisticsCollector logging."""
+
+    def test_report_reads_only_recent_entries(self, tmp_path):
+        """Reports count entries inside the window only."""
+        collector = UsageStatisticsCollector(tmp_path, CKCConfig())
+        old = datetime.now() - timedelta(days=20)
+        collector.usage_log.append(
+            [make_entry(old, operation="sync", duration_ms=5.0, metadata={})]
+        )
+        collector.track_operation("sync", 0.01)
+        collector.track_operation("search", 0.02)
+
+        report = collector.generate_usage_report(days=7)
+
+        assert report["operation_statistics"]["total_operations"] == 2
+
+    def test_cleanup_old_logs(self, tmp_path):
+        """Expired days are removed from every log."""
+        collector = UsageStatisticsCollector(tmp_path, CKCConfig())
+        old = datetime.now() - timedelta(days=120)
+        collector.performance_log.append([make_entry(old, metric="m", value=1.0)])
+        collector.track_performance_metric("m", 2.0)
+
+        collector.cleanup_old_logs(days_to_keep=90)
+
+        assert len(collector.performance_log.segments()) == 1
+        report = collector.generate_usage_report(days=365)
+        assert report["performance_metrics"]["metrics_collected"] == 1
+
+    def test_legacy_logs_are_migrated(self, tmp_path):
+        """Logs written by earlier versions are still reported."""
+        stats_dir = tmp_path / ".ckc" / "statistics"
+        stats_dir.mkdir(parents=True)
+        entry = make_entry(
+            datetime.now(), operation="sync", duration_ms=5.0, metadata={}
+        )
+        (stats_dir / "usage_log.jsonl").write_text(
+            json.dumps(entry) + "\n", encoding="utf-8"
+        )
+
+        collector = UsageStatisticsCollector(tmp_path, CKCConfig())
+
+        assert not (stats_dir / "usage_log.jsonl").exists()
+        report = collector.generate_usage_report(days=1)
+        assert report["operation_statistics"]["total_operations"] == 1
+
+
+class TestBufferedLogWriter:
+    """Test suite for BufferedLogWriter."""
+
+    def test_entries_are_buffered_until_flush(self, tmp_path):
+        """Nothing is written before a flush, then one append per log."""
+        log = SegmentedLog(tmp_path / "log")
+        writer = BufferedLogWriter(max_buffered=100, flush_interval=60)
+        try:
+            with patch.object(log, "append", wraps=log.append) as append:
+                for n in range(10):
+                    writer.submit(log, make_entry(datetime.now(), n=n))
+                assert writer.pending == 10
+                assert not log.segments()
+
+                writer.flush()
+
+            append.assert_called_once()
+            entries = list(log.read_since(datetime.now() - timedelta(hours=1)))
+            assert [entry["n"] for entry in entries] == list(range(10))
+        finally:
+            writer.close()
+
+    def test_full_buffer_flushes_in_background(self, tmp_path):
+        """Reaching the size threshold wakes the worker thread."""
+        log = SegmentedLog(tmp_path / "log")
+        writer = BufferedLogWriter(max_buffered=5, flush_interval=60)
+        try:
+            for n in range(5):
+                writer.submit(log, make_entry(datetime.now(), n=n))
+
+            deadline = time.monotonic() + 5
+            while writer.pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert writer.pending == 0
+            assert writer.entries_written == 5
+        finally:
+            writer.close()
+
+    def test_close_flushes_and_later_writes_are_synchronous(self, tmp_path):
+        """Closing writes pending entries; closed writers write immediately."""
+        log = SegmentedLog(tmp_path / "log")
+        writer = BufferedLogWriter(max_buffered=100, flush_interval=60)
+        writer.submit(log, make_entry(datetime.now(), n=1))
+
+        writer.close()
+        writer.submit(log, make_entry(datetime.now(), n=2))
+
+        entries = list(log.read_since(datetime.now() - timedelta(hours=1)))
+        assert [entry["n"] for entry in entries] == [1, 2]
+
+    def test_closed_writers_are_not_kept_alive(self, tmp_path):
+        """Unused and closed writers can be garbage collected."""
+        log = SegmentedLog(tmp_path / "log")
+        unused = weakref.ref(BufferedLogWriter())
+        writer = BufferedLogWriter(max_buffered=100, flush_interval=60)
+        writer.submit(log, make_entry(datetime.now(), n=1))
+        writer.close()
+        closed = weakref.ref(writer)
+
+        del writer
+        gc.collect()
+
+        assert unused() is None
+        assert closed() is None
+
+    def test_file_size_is_resolved_at_flush(self, tmp_path):
+        """File access entries get their size without a stat on submit."""
+        vault = tmp_path / "vault"
+        collector = UsageStatisticsCollector(vault, CKCConfig())
+        note = vault / "note.md"
+        note.write_text("x" * 42, encoding="utf-8")
+
+        with patch.object(Path, "stat", side_effect=AssertionError("stat")):
+            collector.track_file_access(note, "read")
+
+        report = collector.generate_usage_report(days=1)
+        collector.close()
+
+        assert report["file_access_patterns"]["total_accesses"] == 1
+        entries = list(
+            collector.interaction_log.read_since(datetime.now() - timedelta(hours=1))
+        )
+        assert entries[0]["file_size"] == 42
@@ -0,0 +1,91 @@
+"""Tests for the single-pass vault snapshot."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from claude_knowledge_catalyst.core.hybrid_config import HybridStructureConfig
+from claude_knowledge_catalyst.core.structure_validator import (
+    StructureHealthMonitor,
+    StructureValidator,
+)
+from claude_knowledge_catalyst.core.vault_snapshot import VaultSnapshot
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a small vault with nested, hidden and README files."""
+    vault = tmp_path / "vault"
+    (vault / "_templates").mkdir(parents=True)
+    (vault / "_templates" / "README.md").write_text("# Templates\n")
+    (vault / "10_Projects" / "alpha").mkdir(parents=True)
+    (vault / "10_Projects" / "alpha" / "plan.md").write_text("---\ntitle: P\n---\n")
+    (vault / "10_Projects" / "notes.txt").write_text("x" * 100)
+    (vault / ".obsidian").mkdir()
+    (vault / ".obsidian" / "app.json").write_text("{}")
+    (vault / "top.md").write_text("# No frontmatter\n")
+    return vault
+
+
+class TestVaultSnapshot:
+    """Test cases for VaultSnapshot."""
+
+    def test_scan_collects_aggregates(self, vault):
+        """Test files, suffixes and per-directory totals from one walk."""
+        snapshot = VaultSnapshot.scan(vault)
+
+        assert snapshot.total_files == 5
+        assert snapshot.directory_count == 4
+        assert snapshot.suffix_counts[".md"] == 3
+        assert sorted(snapshot.top_level_entries) == [
+            ".obsidian",
+            "10_Projects",
+            "_templates",
+            "top.md",
+        ]
+        assert [d.name for d in snapshot.content_directories()] == [
+            "10_Projects",
+            "_templates",
+        ]
+
+        projects = snapshot.directories["10_Projects"]
+        assert projects.file_count == 2
+        assert projects.total_size == 100 + len("---\ntitle: P\n---\n")
+        assert projects.has_readme is False
+        assert snapshot.directories["_templates"].has_readme is True
+
+    def test_scan_missing_vault(self, tmp_path):
+        """Test a missing vault yields an empty snapshot."""
+        snapshot = VaultSnapshot.scan(tmp_path / "missing")
+
+        assert snapshot.total_files == 0
+        assert snapshot.directories == {}
+
+    def test_validation_lists_each_directory_once(self, vault):
+        """Test a full validation walks the vault a single time."""
+        validator = StructureValidator(vault, HybridStructureConfig())
+
+        with patch(
+            "claude_knowledge_catalyst.core.vault_snapshot.os.scandir",
+            wraps=os.scandir,
+        ) as mock_scandir:
+            result = validator.validate_full_structure()
+
+        assert mock_scandir.call_count == 5  # vault root + 4 directories
+        assert result.statistics["total_files"] == 5
+        assert result.statistics["markdown_files"] == 3
+        assert result.statistics["readme_files"] == 1
+        assert result.statistics["largest_directory"] == "10_Projects"
+        assert any("Metadata coverage: 50.0%" in info for info in result.info)
+
+    def test_health_check_reuses_snapshot(self, vault):
+        """Test a health check can validate against a given snapshot."""
+        monitor = StructureHealthMonitor(vault, HybridStructureConfig())
+        snapshot = VaultSnapshot.scan(vault)
+
+        with patch.object(VaultSnapshot, "scan") as mock_scan:
+            result = monitor.run_health_check(snapshot)
+
+        mock_scan.assert_not_called()
+        assert result.statistics["total_files"] == 5
@@ -97,6 +97,70 @@ class TestLanguageDetector:
         assert "https://example.com" not in cleaned
         assert "sample text" in cleaned
 
+    @pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("この文書では、Pythonを使用した機械学習の実装について説明します。", "ja"),
+            ("機械学習アルゴリズムの概要とDocker環境の構築手順", "ja"),
+            ("本文介绍了使用Python实现机器学习的方法，包括数据预处理。", "zh"),
+            ("이 문서는 파이썬을 사용한 머신러닝 구현에 대해 설명합니다.", "ko"),
+            ("This note explains how the deployment pipeline works in CI.", "en"),
+        ],
+    )
+    def test_script_detection_skips_langdetect(self, detector, text, expected):
+        """Test unambiguous scripts are decided without langdetect."""
+        with patch("langdetect.detect") as detect:
+            result = detector.detect_language(text)
+
+        detect.assert_not_called()
+        assert result == expected
+        assert detector.get_stats()["script_detections"] == 1
+
+    @pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+    def test_ambiguous_latin_falls_back_to_langdetect(self, detector):
+        """Test Latin text without English function words uses langdetect."""
+        text = "Ceci est un texte en français sur l'apprentissage automatique."
+
+        with patch("langdetect.detect", return_value="fr") as detect:
+            result = detector.detect_language(text)
+
+        detect.assert_called_once()
+        assert result == "fr"
+        assert detector.get_stats()["fallback_detections"] == 1
+
+    @pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+    def test_cache_keyed_by_cleaned_text(self, detector):
+        """Test samples that only differ in stripped code share a cache entry."""
+        text = "Dies ist ein Text über maschinelles Lernen."
+
+        with patch("langdetect.detect", return_value="de") as detect:
+            detector.detect_language(text)
+            detector.detect_language(text + " `inline code`")
+
+        detect.assert_called_once()
+        assert detector.get_stats()["cache_size"] == 1
+
+    @pytest.mark.skipif(not YAKE_AVAILABLE, reason="YAKE dependencies not available")
+    def test_cache_evicts_least_recently_used(self):
+        """Test a recently read entry survives eviction."""
+        detector = LanguageDetector(cache_size=2)
+        first = "Erster deutscher Beispieltext ohne Funktionswoerter"
+        second = "Zweiter deutscher Beispieltext ohne Funktionswoerter"
+        third = "Dritter deutscher Beispieltext ohne Funktionswoerter"
+
+        with patch("langdetect.detect", return_value="de") as detect:
+            detector.detect_language(first)
+            detector.detect_language(second)
+            detector.detect_language(first)
+            detector.detect_language(third)
+            assert detect.call_count == 3
+
+            detector.detect_language(first)
+            assert detect.call_count == 3
+            detector.detect_language(second)
+            assert detect.call_count == 4
+
     @patch("claude_knowledge_catalyst.ai.yake_extractor.YAKE_AVAILABLE", False)
     def test_fallback_when_dependencies_missing(self, detector):
         """Test fallback behavior when YAKE dependencies are missing."""
@@ -144,10 +208,10 @@ class TestYAKEKeywordExtractor:
     """Test suite for YAKEKeywordExtractor when dependencies are available."""
 
     @pytest.fixture
-    def extractor(self):
+    def extractor(self, tmp_path):
         """Create YAKE extractor instance."""
         config = YAKEConfig(top_keywords=10)
-        return YAKEKeywordExtractor(config)
+        return YAKEKeywordExtractor(config, cache_dir=tmp_path)
 
     @pytest.fixture
     def sample_tech_content(self):
@@ -273,6 +337,40 @@ containerization with Docker,
         assert all(isinstance(result, list) for result in results)
         assert all(len(result) > 0 for result in results)
 
+    def test_batch_parallel_matches_serial(self, tmp_path):
+        """Test the process pool returns the same keywords in input order."""
+        config = YAKEConfig(persistent_cache=False)
+        extractor = YAKEKeywordExtractor(config, cache_dir=tmp_path)
+        contents = [
+            f"Note {i} about {topic} and software testing with continuous delivery"
+            for i in range(40)
+            for topic in ("python", "docker")
+        ]
+
+        parallel = extractor.extract_keywords_batch(contents, workers=2)
+        serial = extractor.extract_keywords_batch(contents, workers=1)
+
+        assert parallel == serial
+        assert all(parallel)
+
+    def test_batch_serves_cached_documents_in_parent(self, tmp_path):
+        """Test cached documents are not sent to the worker pool."""
+        extractor = YAKEKeywordExtractor(cache_dir=tmp_path)
+        contents = [f"Document {i} covers python packaging and API" for i in range(40)]
+        expected = extractor.extract_keywords_batch(contents, workers=1)
+
+        with patch(
+            "claude_knowledge_catalyst.ai.yake_extractor.ProcessPoolExecutor"
+        ) as pool:
+            results = extractor.extract_keywords_batch(contents, workers=2)
+
+        pool.assert_not_called()
+        assert results == expected
+
+    def test_batch_empty_input(self, extractor):
+        """Test batch extraction of no documents."""
+        assert extractor.extract_keywords_batch([]) == []
+
     def test_keyword_filtering_by_length(self, extractor):
         """Test that keywords are filtered by length."""
         # Content designed to generate very short and very long keywords